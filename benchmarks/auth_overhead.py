@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Measure per-request authentication overhead with and without the JWT payload cache.
+
+Times `JWTHandler.get_token_payload` on its own and a minimal FastAPI route that
+only depends on `get_current_user`, first with the payload cache disabled and
+then with it enabled. A pool of distinct tokens is cycled so the cached run
+also exercises LRU lookups rather than a single hot entry.
+
+    python -m benchmarks.auth_overhead [--iterations N] [--tokens N]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+
+from fastapi import Depends, FastAPI
+
+from benchmarks.common import asgi_request, measure_latency, print_table
+from src.api.auth.jwt_handler import JWTHandler
+from src.core.config import settings
+from src.enums import UserRole
+from src.middleware import get_current_user
+from src.utils.cache import ExpiringLRUCache
+
+PATH = "/whoami"
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get(PATH)
+    async def whoami(current_user: Dict[str, Any] = Depends(get_current_user)):
+        return {"user_id": current_user["user_id"]}
+
+    return app
+
+
+def decode_latency(tokens, iterations: int) -> Dict[str, float]:
+    for token in tokens:
+        JWTHandler.get_token_payload(token)
+
+    started = time.perf_counter()
+    for i in range(iterations):
+        JWTHandler.get_token_payload(tokens[i % len(tokens)])
+    return {"mean_us": (time.perf_counter() - started) / iterations * 1_000_000}
+
+
+async def main(iterations: int, token_count: int) -> None:
+    tokens = [
+        JWTHandler.create_user_token(i, f"user{i}@company.com", UserRole.USER, ["create-request"])
+        for i in range(1, token_count + 1)
+    ]
+    app = build_app()
+
+    decode_rows, request_rows = [], []
+    for variant, cache in (
+            ("no_cache", None),
+            ("cache", ExpiringLRUCache(max(settings.jwt_cache_max_size, token_count))),
+    ):
+        JWTHandler.payload_cache = cache
+        decode_rows.append((variant, decode_latency(tokens, iterations)))
+
+        counter = 0
+
+        async def call():
+            nonlocal counter
+            counter += 1
+            headers = {"Authorization": f"Bearer {tokens[counter % token_count]}"}
+            status_code, _ = await asgi_request(app, "GET", PATH, headers)
+            assert status_code == 200
+
+        request_rows.append((variant, await measure_latency(call, iterations)))
+        if cache is not None:
+            print(f"\nCache stats: {cache.get_stats()}")
+
+    print_table(f"get_token_payload over {iterations} calls, {token_count} tokens", decode_rows)
+    print_table(f"Authenticated request latency over {iterations} requests", request_rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.tokens))
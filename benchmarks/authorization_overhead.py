@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Measure route authorization overhead, stacked dependencies vs the fused Authorize check.
+
+The "stacked" app reproduces the previous route setup: `require_admin` plus a
+`PermissionsValidator` that builds sets from the role's permission list on every
+request. The "fused" app uses one `Authorize` dependency that checks the role
+and a precompiled permission bitmask. Both run behind the JWT payload cache so
+the difference is FastAPI dependency resolution plus the checks themselves.
+
+    python -m benchmarks.authorization_overhead [--iterations N]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+
+from fastapi import Depends, FastAPI, HTTPException, status
+
+from benchmarks.common import asgi_request, measure_latency, print_table
+from src.api.auth.jwt_handler import JWTHandler
+from src.enums import UserRole
+from src.middleware import get_current_user, require_admin
+from src.middleware.permissions import Authorize, Permissions, RolePermissions
+
+PATH = "/admin/staff/workload"
+REQUIRED = [Permissions.VIEW_STAFF, Permissions.VIEW_STATISTICS]
+
+
+class SetPermissionsValidator:
+    # The set-based validator the routes used before permissions were compiled.
+
+    def __init__(self, required_permissions):
+        self.required_permissions = required_permissions
+
+    def __call__(self, current_user: Dict[str, Any] = Depends(get_current_user)) -> None:
+        user_permissions = RolePermissions.get_role_permissions(UserRole(current_user["role"]))
+        if set(self.required_permissions) - set(user_permissions):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+
+def build_app(fused: bool) -> FastAPI:
+    app = FastAPI()
+
+    if fused:
+        @app.get(PATH, dependencies=[Depends(Authorize([UserRole.ADMIN], REQUIRED))])
+        async def workload():
+            return {"ok": True}
+    else:
+        @app.get(PATH, dependencies=[Depends(require_admin), Depends(SetPermissionsValidator(REQUIRED))])
+        async def workload():
+            return {"ok": True}
+
+    return app
+
+
+def check_latency(fused: bool, payload: Dict[str, Any], iterations: int) -> float:
+    authorize, validator = Authorize([UserRole.ADMIN], REQUIRED), SetPermissionsValidator(REQUIRED)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if fused:
+            authorize(payload)
+        else:
+            if UserRole(payload["role"]) != UserRole.ADMIN:
+                raise AssertionError
+            validator(payload)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def main(iterations: int) -> None:
+    role = UserRole.ADMIN
+    token = JWTHandler.create_token_pair(
+        1, "admin@company.com", role, RolePermissions.get_role_permissions(role), RolePermissions.get_token_claims(role)
+    )["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = JWTHandler.get_token_payload(token)
+
+    rows = []
+    for variant, fused in (("stacked", False), ("fused", True)):
+        app = build_app(fused)
+
+        async def call():
+            status_code, _ = await asgi_request(app, "GET", PATH, headers)
+            assert status_code == 200
+
+        rows.append((variant, {
+            "check_us": check_latency(fused, payload, iterations * 10),
+            **await measure_latency(call, iterations),
+        }))
+
+    print_table(f"Authorization on {PATH} over {iterations} requests", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations))
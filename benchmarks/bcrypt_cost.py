@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Report bcrypt login throughput for a range of work factors.
+
+For each cost, times password verification on one thread (logins/sec per
+core) and on the password executor with PASSWORD_HASH_WORKERS threads to show
+how throughput scales across cores. Use it with src.tools.calibrate_bcrypt to
+choose BCRYPT_ROUNDS for an environment.
+
+    python -m benchmarks.bcrypt_cost [--min-rounds 10] [--max-rounds 14] [--logins N]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import print_table
+from src.api.auth.password_manager import PasswordManager
+from src.core.config import settings
+from src.core.executors import password_executor
+
+PASSWORD = "Str0ngPassword"
+
+
+def single_core(password_hash: str, logins: int) -> float:
+    started = time.perf_counter()
+    for _ in range(logins):
+        PasswordManager.verify_password(PASSWORD, password_hash)
+    return logins / (time.perf_counter() - started)
+
+
+async def executor_throughput(password_hash: str, logins: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(PasswordManager.verify_password_async(PASSWORD, password_hash) for _ in range(logins)))
+    return logins / (time.perf_counter() - started)
+
+
+async def main(min_rounds: int, max_rounds: int, logins: int) -> None:
+    rows = []
+    for rounds in range(min_rounds, max_rounds + 1):
+        password_hash = PasswordManager.hash_password(PASSWORD, rounds=rounds)
+        # Fewer iterations at high costs keep the run short; throughput is a rate anyway.
+        count = max(4, logins >> max(0, rounds - min_rounds))
+
+        per_core = single_core(password_hash, count)
+        rows.append((f"rounds={rounds}", {
+            "verify_ms": 1000 / per_core,
+            "logins_s_core": per_core,
+            f"logins_s_{settings.password_hash_workers}thr": await executor_throughput(password_hash, count * 2),
+        }))
+
+    password_executor.shutdown()
+    print_table("bcrypt verification throughput", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--logins", type=int, default=64)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.min_rounds, args.max_rounds, args.logins))
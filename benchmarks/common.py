@@ -0,0 +1,90 @@
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message
+
+
+async def asgi_request(
+        app: ASGIApp,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: bytes = b""
+) -> Tuple[int, bytes]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+    status_code = 0
+    chunks: List[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status_code, b"".join(chunks)
+
+
+async def measure_latency(call: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 100) -> Dict[str, float]:
+    for _ in range(warmup):
+        await call()
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+async def measure_throughput(call: Callable[[], Awaitable[Any]], total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker() -> None:
+        async with semaphore:
+            await call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+def print_table(title: str, rows: List[Tuple[str, Dict[str, float]]]) -> None:
+    print(f"\n{title}")
+    if not rows:
+        return
+    columns = list(rows[0][1].keys())
+    print(f"{'':<28}" + "".join(f"{column:>14}" for column in columns))
+    for name, values in rows:
+        print(f"{name:<28}" + "".join(f"{values[column]:>14.1f}" for column in columns))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Measure ticket endpoint latency while a burst of logins runs on the same worker.
+
+A stub app exposes a login route that verifies a bcrypt hash and a ticket route
+that does no blocking work. Ticket requests are scheduled at a steady rate while
+concurrent logins hammer the login route, once with bcrypt called inline on
+the event loop and once through the bounded password executor.
+
+    python -m benchmarks.login_burst [--logins N] [--concurrency C] [--tickets N]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from fastapi import FastAPI
+
+from benchmarks.common import asgi_request, print_table
+from src.api.auth.password_manager import PasswordManager
+from src.core.executors import password_executor
+
+PASSWORD = "Str0ngPassword"
+
+
+def build_app(offloaded: bool, password_hash: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/auth/login")
+    async def login():
+        if offloaded:
+            ok = await PasswordManager.verify_password_async(PASSWORD, password_hash)
+        else:
+            ok = PasswordManager.verify_password(PASSWORD, password_hash)
+        return {"ok": ok}
+
+    @app.get("/user_request/my")
+    async def my_requests():
+        return {"items": [], "total": 0}
+
+    return app
+
+
+async def ticket_latencies(app: FastAPI, count: int, interval: float) -> List[float]:
+    # Open-loop schedule: latency is measured from when each request was due, so
+    # time spent waiting for a blocked event loop is counted as well.
+    samples = []
+    started = time.perf_counter()
+    for i in range(count):
+        due = started + i * interval
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await asgi_request(app, "GET", "/user_request/my")
+        samples.append((time.perf_counter() - due) * 1000)
+    return sorted(samples)
+
+
+async def login_burst(app: FastAPI, total: int, concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+
+    async def login():
+        nonlocal rejected
+        async with semaphore:
+            status_code, _ = await asgi_request(app, "POST", "/auth/login")
+            rejected += status_code == 503
+
+    await asyncio.gather(*(login() for _ in range(total)))
+    return rejected
+
+
+async def main(logins: int, concurrency: int, tickets: int) -> None:
+    password_hash = PasswordManager.hash_password(PASSWORD)
+
+    rows = []
+    for variant, offloaded in (("inline_bcrypt", False), ("executor", True)):
+        app = build_app(offloaded, password_hash)
+        burst = asyncio.create_task(login_burst(app, logins, concurrency))
+        samples = await ticket_latencies(app, tickets, interval=0.005)
+        rejected = await burst
+
+        rows.append((variant, {
+            "ticket_p50_ms": samples[len(samples) // 2],
+            "ticket_p99_ms": samples[int(len(samples) * 0.99) - 1],
+            "ticket_max_ms": samples[-1],
+            "logins_503": rejected,
+        }))
+
+    password_executor.shutdown()
+    print_table(f"Ticket latency during {logins} logins, concurrency {concurrency}", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--tickets", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.logins, args.concurrency, args.tickets))
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Compare the logging middleware stack on /user_request/my.
+
+Runs an in-process FastAPI app with a stub handler three ways: without the
+logging middlewares, with BaseHTTPMiddleware stand-ins that mirror the old
+implementation, and with the pure-ASGI middlewares. All variants feed the same
+log pipeline backed by a no-op sink, so only middleware mechanics differ.
+
+    python -m benchmarks.middleware_overhead [--iterations N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+from fastapi import Depends, FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from benchmarks.common import asgi_request, measure_latency, measure_throughput, print_table
+from src.api.auth.jwt_handler import JWTHandler
+from src.core.log_pipeline import log_pipeline
+from src.enums import UserRole
+from src.middleware import LoggingMiddleware, RequestActionMiddleware, get_current_user
+from src.middleware.route_actions import route_action_table
+
+PATH = "/user_request/my"
+
+
+class NullLogSink:
+
+    async def log_many_to_mongo(self, collection: str, documents: List[dict]) -> int:
+        return len(documents)
+
+
+_api_logger = LoggingMiddleware(app=None)
+_action_logger = RequestActionMiddleware(app=None)
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        asyncio.create_task(_api_logger._log_request(request, response.status_code, process_time))
+        return response
+
+
+class LegacyRequestActionMiddleware(BaseHTTPMiddleware):
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if 200 <= response.status_code < 300:
+            route_action = route_action_table.resolve(request.scope)
+            if route_action is not None:
+                asyncio.create_task(_action_logger._log_action(request.scope, route_action))
+        return response
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get(PATH)
+    async def get_my_requests(current_user: Dict[str, Any] = Depends(get_current_user)):
+        now = datetime.utcnow()
+        items = [
+            {"id": i, "text": "Printer on floor 3 is jammed", "status": "new",
+             "created_at": now, "updated_at": now, "owner_email": "user@company.com"}
+            for i in range(50)
+        ]
+        return {"items": items, "total": 50, "page": 1, "size": 50, "pages": 1}
+
+    if variant == "base_http":
+        app.add_middleware(LegacyRequestActionMiddleware)
+        app.add_middleware(LegacyLoggingMiddleware)
+    elif variant == "asgi":
+        app.add_middleware(RequestActionMiddleware)
+        app.add_middleware(LoggingMiddleware)
+
+    route_action_table.build(app.routes)
+    return app
+
+
+async def main(iterations: int, total: int, concurrency: int) -> None:
+    log_pipeline._database = NullLogSink()
+    await log_pipeline.start()
+
+    token = JWTHandler.create_user_token(1, "user@company.com", UserRole.USER)
+    headers = {"Authorization": f"Bearer {token}", "User-Agent": "bench"}
+
+    latency_rows, throughput_rows = [], []
+    for variant in ("no_middleware", "base_http", "asgi"):
+        app = build_app(variant)
+
+        async def call():
+            status_code, _ = await asgi_request(app, "GET", PATH, headers)
+            assert status_code == 200
+
+        latency_rows.append((variant, await measure_latency(call, iterations)))
+        throughput_rows.append((variant, {"rps": await measure_throughput(call, total, concurrency)}))
+
+    await log_pipeline.stop(timeout=5)
+
+    print_table(f"Latency over {iterations} sequential requests", latency_rows)
+    print_table(f"Throughput over {total} requests, concurrency {concurrency}", throughput_rows)
+    print(f"\nLog pipeline: {log_pipeline.get_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=3000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.requests, args.concurrency))
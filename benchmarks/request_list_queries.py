@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Count queries and time the request list read path, prefetch vs a single JOIN.
+
+Seeds a scratch database with users, staff and requests, then reads one page of
+`RequestService.get_all_requests` per page size. The "prefetch" variant is the
+previous path (model instances plus `prefetch_related("owner", "staff_member")`
+and per-item response building); "join" is the current `.values()` path.
+Queries are counted from the `tortoise.db_client` logger. Defaults to an
+in-memory SQLite database; pass a scratch PostgreSQL URL for realistic timings.
+
+    python -m benchmarks.request_list_queries [--db-url postgres://...] [--sizes 50,500,5000] [--repeat N]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import List
+
+from tortoise import Tortoise
+
+from benchmarks.common import print_table
+from src.api.schemas.schemas import PaginationParams, RequestFilters, RequestListResponse, RequestPaginationParams
+from src.api.services.request_service import RequestService
+from src.enums import RequestStatus, UserRole
+from src.models.models import Request, User
+
+
+class QueryCounter(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+async def seed(requests: int) -> None:
+    owners = [User(email=f"user{i}@company.com", password_hash="x", role=UserRole.USER) for i in range(200)]
+    staff = [User(email=f"staff{i}@company.com", password_hash="x", role=UserRole.STAFF) for i in range(20)]
+    await User.bulk_create(owners + staff)
+    owner_ids = [user.id for user in await User.filter(role=UserRole.USER).only("id")]
+    staff_ids = [user.id for user in await User.filter(role=UserRole.STAFF).only("id")]
+
+    statuses = list(RequestStatus)
+    await Request.bulk_create([
+        Request(
+            owner_id=owner_ids[i % len(owner_ids)],
+            staff_member_id=staff_ids[i % len(staff_ids)] if i % 3 else None,
+            text=f"Request {i}: " + "printer is out of toner " * 4,
+            status=statuses[i % len(statuses)]
+        )
+        for i in range(requests)
+    ], batch_size=1000)
+
+
+async def prefetch_page(pagination: PaginationParams) -> List[RequestListResponse]:
+    requests = await Request.all().order_by("-created_at").offset(
+        (pagination.page - 1) * pagination.size
+    ).limit(pagination.size).prefetch_related("owner", "staff_member")
+
+    return [
+        RequestListResponse(
+            id=request.id,
+            text=request.text,
+            status=request.status,
+            created_at=request.created_at,
+            updated_at=request.updated_at,
+            owner_email=request.owner.email,
+            staff_member_email=request.staff_member.email if request.staff_member else None
+        )
+        for request in requests
+    ]
+
+
+async def join_page(pagination: RequestPaginationParams) -> List[RequestListResponse]:
+    query = RequestService._apply_filters(Request.all(), RequestFilters())
+    items, _, _, _ = await RequestService._fetch_list_page(query, pagination)
+    return items
+
+
+async def main(db_url: str, sizes: List[int], repeat: int) -> None:
+    await Tortoise.init(db_url=db_url, modules={"models": ["src.models.models"]})
+    await Tortoise.generate_schemas()
+
+    counter = QueryCounter()
+    db_logger = logging.getLogger("tortoise.db_client")
+    db_logger.setLevel(logging.DEBUG)
+    db_logger.propagate = False
+    db_logger.addHandler(counter)
+
+    try:
+        await seed(max(sizes))
+
+        rows = []
+        for size in sizes:
+            # Built without validation so sizes above PAGINATION_MAX_SIZE can be measured.
+            pagination = RequestPaginationParams.model_construct(page=1, size=size, cursor=None)
+            for variant, read_page in (("prefetch", prefetch_page), ("join", join_page)):
+                assert len(await read_page(pagination)) == size
+
+                samples = []
+                counter.count = 0
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    await read_page(pagination)
+                    samples.append((time.perf_counter() - started) * 1000)
+
+                rows.append((f"{variant} size={size}", {
+                    "queries": counter.count / repeat,
+                    "p50_ms": statistics.median(samples),
+                    "max_ms": max(samples),
+                }))
+
+        print_table(f"Request list page read ({db_url.split(':', 1)[0]}, {repeat} reads each)", rows)
+    finally:
+        db_logger.removeHandler(counter)
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    parser.add_argument("--sizes", default="50,500,5000")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.db_url, [int(size) for size in args.sizes.split(",")], args.repeat))
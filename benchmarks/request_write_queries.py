@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Count queries and time ticket writes, ORM read-modify-write vs single-statement RETURNING.
+
+Seeds an empty scratch PostgreSQL database and runs each ticket mutation the
+way the service used to (get, update, re-fetch with prefetches) and through the
+current `RequestService` methods, which validate, write and read the response
+row in one statement. Queries are counted from the `tortoise.db_client` logger and the
+run fails if a current write needs more than one query.
+
+    python -m benchmarks.request_write_queries --db-url postgres://user:pass@db:5432/scratch [--repeat N]
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import statistics
+import sys
+import time
+
+from tortoise import Tortoise
+
+from benchmarks.common import print_table
+from benchmarks.request_list_queries import QueryCounter, seed
+from src.api.schemas.schemas import RequestCreate, RequestStatusUpdate, RequestUpdate, StaffAssignment
+from src.api.services.request_service import RequestService
+from src.enums import RequestStatus, UserRole
+from src.models.models import Request, User
+
+QUERIES_PER_WRITE = 1
+
+
+async def orm_create(user_id: int, request_id: int, staff_id: int) -> None:
+    request = await Request.create(owner_id=user_id, text="Printer is jammed", status=RequestStatus.NEW)
+    request = await Request.get(id=request.id).prefetch_related("owner", "staff_member")
+    await RequestService._build_request_response(request)
+
+
+async def orm_update(user_id: int, request_id: int, staff_id: int) -> None:
+    request = await Request.get_or_none(id=request_id, owner_id=user_id).prefetch_related("owner")
+    assert request.status == RequestStatus.NEW
+    await Request.filter(id=request_id).update(text="Printer is still jammed")
+    request = await Request.get(id=request_id).prefetch_related("owner", "staff_member")
+    await RequestService._build_request_response(request)
+
+
+async def orm_update_status(user_id: int, request_id: int, staff_id: int) -> None:
+    await Request.get_or_none(id=request_id).prefetch_related("owner", "staff_member")
+    await Request.filter(id=request_id).update(status=RequestStatus.IN_PROGRESS, staff_member_id=staff_id)
+    request = await Request.get(id=request_id).prefetch_related("owner", "staff_member")
+    await RequestService._build_request_response(request)
+
+
+async def orm_assign(user_id: int, request_id: int, staff_id: int) -> None:
+    request = await Request.get_or_none(id=request_id).prefetch_related("owner")
+    await User.get(id=staff_id, role=UserRole.STAFF)
+    new_status = RequestStatus.IN_PROGRESS if request.status == RequestStatus.NEW else request.status
+    await Request.filter(id=request_id).update(staff_member_id=staff_id, status=new_status)
+    request = await Request.get(id=request_id).prefetch_related("owner", "staff_member")
+    await RequestService._build_request_response(request)
+
+
+async def returning_create(user_id: int, request_id: int, staff_id: int) -> None:
+    await RequestService.create_request(user_id, RequestCreate(text="Printer is jammed"))
+
+
+async def returning_update(user_id: int, request_id: int, staff_id: int) -> None:
+    await RequestService.update_request(request_id, user_id, RequestUpdate(text="Printer is still jammed"))
+
+
+async def returning_update_status(user_id: int, request_id: int, staff_id: int) -> None:
+    await RequestService.update_request_status(
+        request_id, staff_id, RequestStatusUpdate(status=RequestStatus.IN_PROGRESS)
+    )
+
+
+async def returning_assign(user_id: int, request_id: int, staff_id: int) -> None:
+    await RequestService.assign_staff_to_request(request_id, StaffAssignment(staff_id=staff_id), admin_id=0)
+
+
+WRITES = {
+    "create": (orm_create, returning_create),
+    "update": (orm_update, returning_update),
+    "update_status": (orm_update_status, returning_update_status),
+    "assign": (orm_assign, returning_assign),
+}
+
+
+async def main(db_url: str, repeat: int) -> int:
+    await Tortoise.init(db_url=db_url, modules={"models": ["src.models.models"]})
+    if Tortoise.get_connection("default").capabilities.dialect != "postgres":
+        print("request_write_queries needs a PostgreSQL database", file=sys.stderr)
+        await Tortoise.close_connections()
+        return 2
+    await Tortoise.generate_schemas()
+
+    counter = QueryCounter()
+    db_logger = logging.getLogger("tortoise.db_client")
+    db_logger.setLevel(logging.DEBUG)
+    db_logger.propagate = False
+    db_logger.addHandler(counter)
+
+    try:
+        await seed(repeat * 2 * len(WRITES) * len(RequestStatus))
+        staff = await User.filter(role=UserRole.STAFF).first()
+        # update() only accepts tickets that are still NEW, so every call gets its own.
+        tickets = iter(await Request.filter(status=RequestStatus.NEW).values_list("id", "owner_id"))
+
+        rows, failures = [], 0
+        for name, variants in WRITES.items():
+            for variant, write in zip(("orm", "returning"), variants):
+                samples = []
+                counter.count = 0
+                for request_id, owner_id in itertools.islice(tickets, repeat):
+                    started = time.perf_counter()
+                    await write(owner_id, request_id, staff.id)
+                    samples.append((time.perf_counter() - started) * 1000)
+
+                queries = counter.count / len(samples)
+                if variant == "returning" and queries > QUERIES_PER_WRITE:
+                    failures += 1
+                rows.append((f"{variant} {name}", {
+                    "queries": queries,
+                    "p50_ms": statistics.median(samples),
+                    "max_ms": max(samples),
+                }))
+
+        print_table(f"Ticket writes ({repeat} each)", rows)
+        if failures:
+            print(f"{failures} write(s) took more than {QUERIES_PER_WRITE} query", file=sys.stderr)
+        return 1 if failures else 0
+    finally:
+        db_logger.removeHandler(counter)
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", required=True)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.db_url, args.repeat)))
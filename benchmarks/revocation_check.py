@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Measure the per-request cost of the token revocation check.
+
+Fills a local revocation list with N revoked tokens and times `is_revoked` for
+tokens that are not revoked (answered by the Bloom filter alone) and for revoked
+ones (filter hit plus exact lookup). Also reports the filter's observed false
+positive rate. Nothing is written to MongoDB.
+
+    python -m benchmarks.revocation_check [--revoked 1000,100000] [--iterations N]
+"""
+
+import argparse
+import time
+import uuid
+from typing import Dict, List
+
+from benchmarks.common import print_table
+from src.core.config import settings
+from src.core.database import db_manager
+from src.core.token_revocation import TokenRevocationList
+
+
+def mean_us(revocation_list: TokenRevocationList, payloads: List[Dict], iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        revocation_list.is_revoked(payloads[i % len(payloads)])
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main(revoked_counts: List[int], iterations: int) -> None:
+    expires_at = time.time() + 3600
+    rows = []
+    for count in revoked_counts:
+        revocation_list = TokenRevocationList(
+            db_manager,
+            user_cutoff_ttl=3600,
+            bloom_capacity=settings.token_revocation_bloom_capacity,
+            bloom_error_rate=settings.token_revocation_bloom_error_rate,
+            sync_interval=60
+        )
+        revoked = [uuid.uuid4().hex for _ in range(count)]
+        for jti in revoked:
+            revocation_list._add_token(jti, expires_at)
+
+        valid = [{"jti": uuid.uuid4().hex, "user_id": i, "iat": int(time.time())} for i in range(10000)]
+        false_positives = sum(payload["jti"] in revocation_list._bloom for payload in valid)
+
+        rows.append((f"revoked={count}", {
+            "valid_us": mean_us(revocation_list, valid, iterations),
+            "revoked_us": mean_us(revocation_list, [{"jti": jti, "user_id": 0} for jti in revoked[:10000]], iterations)
+            if revoked else 0.0,
+            "false_pos_pct": false_positives / len(valid) * 100,
+            "bloom_kib": revocation_list._bloom.size_bits / 8 / 1024,
+        }))
+
+    print_table(f"is_revoked over {iterations} checks", rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--revoked", default="0,1000,100000")
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+
+    main([int(count) for count in args.revoked.split(",")], args.iterations)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Compare a plain and a time-series app_logs collection.
+
+Seeds the same synthetic request logs into both layouts in a scratch database
+(`<MONGODB_DATABASE>_bench`), builds the managed indexes each mode declares,
+then reports storage size from $collStats and the latency of the analytics
+and stats aggregations. Needs a reachable MongoDB 7 at MONGODB_URL.
+
+    python -m benchmarks.timeseries_storage [--documents N] [--iterations N] [--keep]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from benchmarks.common import print_table
+from src.api.services.log_analytics_service import LogAnalyticsService
+from src.core.config import settings
+from src.core.database import db_manager
+from src.core.mongo_indexes import MongoIndexManager, declared_log_indexes
+from src.middleware.route_actions import RouteActionTable
+
+PLAIN = "bench_app_logs_plain"
+TIMESERIES = "bench_app_logs_timeseries"
+SEED_BATCH = 10000
+WINDOW = timedelta(days=7)
+
+
+def synthetic_logs(count: int, now: datetime) -> List[dict]:
+    routes = sorted({(template, method) for template, method in RouteActionTable.ACTIONS})
+    routes += [("/auth/login", "POST"), ("/health", "GET")]
+    statuses = [200] * 90 + [201] * 4 + [400] * 2 + [401] * 2 + [404] + [500]
+
+    documents = []
+    for _ in range(count):
+        route, method = random.choice(routes)
+        documents.append({
+            "timestamp": now - timedelta(seconds=random.uniform(0, WINDOW.total_seconds())),
+            "type": "api_request",
+            "method": method,
+            "url": f"http://api.local{route}",
+            "route": route,
+            "status_code": random.choice(statuses),
+            "process_time": round(random.lognormvariate(-3.5, 0.8), 3),
+            "ip_address": f"10.0.{random.randint(0, 255)}.{random.randint(1, 254)}",
+            "user_agent": "bench-client/1.0",
+            "sample_weight": 1.0,
+        })
+    return documents
+
+
+async def seed(mongo_db, documents: List[dict]) -> Dict[str, float]:
+    seconds = {}
+    for name in (PLAIN, TIMESERIES):
+        started = time.perf_counter()
+        for offset in range(0, len(documents), SEED_BATCH):
+            batch = [dict(document) for document in documents[offset:offset + SEED_BATCH]]
+            await mongo_db[name].insert_many(batch, ordered=False)
+        seconds[name] = time.perf_counter() - started
+    return seconds
+
+
+async def build_indexes(mongo_db) -> None:
+    retention = {"app_logs": settings.log_retention_days_app_logs}
+    declared = {
+        PLAIN: declared_log_indexes(retention)["app_logs"],
+        TIMESERIES: declared_log_indexes(retention, settings.log_timeseries_meta_field)["app_logs"],
+    }
+    await MongoIndexManager(mongo_db, declared).reconcile()
+
+
+async def storage_stats(mongo_db, name: str) -> Dict[str, float]:
+    stats = await mongo_db[name].aggregate([{"$collStats": {"storageStats": {}}}]).to_list(length=1)
+    storage = stats[0]["storageStats"]
+    return {
+        "data_mb": storage.get("size", 0) / 1024 / 1024,
+        "storage_mb": storage.get("storageSize", 0) / 1024 / 1024,
+        "index_mb": storage.get("totalIndexSize", 0) / 1024 / 1024,
+    }
+
+
+async def time_pipeline(mongo_db, name: str, pipeline: List[dict], iterations: int) -> float:
+    await mongo_db[name].aggregate(pipeline).to_list(length=None)
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await mongo_db[name].aggregate(pipeline).to_list(length=None)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def stats_pipelines(now: datetime) -> Dict[str, List[dict]]:
+    since_day = now - timedelta(hours=24)
+    since_week = now - WINDOW
+    return {
+        "weighted_count_24h": [
+            {"$match": {"timestamp": {"$gte": since_day}}},
+            {"$group": {"_id": None, "requests": {"$sum": {"$ifNull": ["$sample_weight", 1]}}}}
+        ],
+        "errors_by_route_7d": [
+            {"$match": {"timestamp": {"$gte": since_week}, "status_code": {"$gte": 500}}},
+            {"$group": {"_id": "$route", "errors": {"$sum": 1}}}
+        ],
+        "latency_24h_60m": LogAnalyticsService._build_route_latency_pipeline(since_day, now, 60, None, None),
+        "latency_7d_60m": LogAnalyticsService._build_route_latency_pipeline(since_week, now, 60, None, None),
+    }
+
+
+async def main(documents: int, iterations: int, keep: bool) -> None:
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    mongo_db = client[f"{settings.mongodb_database}_bench"]
+    now = datetime.utcnow()
+
+    try:
+        await mongo_db.drop_collection(PLAIN)
+        await mongo_db.drop_collection(TIMESERIES)
+        await mongo_db.create_collection(PLAIN)
+        await mongo_db.create_collection(TIMESERIES, **db_manager.app_logs_timeseries_options())
+
+        print(f"Seeding {documents} documents into each collection...")
+        seed_seconds = await seed(mongo_db, synthetic_logs(documents, now))
+        await build_indexes(mongo_db)
+
+        print_table("Storage ($collStats)", [
+            (name, {**await storage_stats(mongo_db, name), "seed_docs_per_s": documents / seed_seconds[name]})
+            for name in (PLAIN, TIMESERIES)
+        ])
+
+        pipelines = stats_pipelines(now)
+        rows = []
+        for label, pipeline in pipelines.items():
+            rows.append((label, {
+                "plain_ms": await time_pipeline(mongo_db, PLAIN, pipeline, iterations),
+                "timeseries_ms": await time_pipeline(mongo_db, TIMESERIES, pipeline, iterations),
+            }))
+        print_table(f"Aggregation latency, median of {iterations}", rows)
+    finally:
+        if not keep:
+            await mongo_db.drop_collection(PLAIN)
+            await mongo_db.drop_collection(TIMESERIES)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=500_000)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.documents, args.iterations, args.keep))
@@ -14,6 +14,7 @@ readonly MAX_REQUESTS_JITTER="${MAX_REQUESTS_JITTER:-100}"
 readonly TIMEOUT="${TIMEOUT:-30}"
 readonly KEEPALIVE="${KEEPALIVE:-2}"
 readonly ENVIRONMENT="${ENVIRONMENT:-production}"
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/support_system/metrics}"
 
 readonly RED='\033[0;31m'
 readonly GREEN='\033[0;32m'
@@ -200,6 +201,33 @@ run_migrations() {
     fi
 }
 
+prepare_metrics_dir() {
+    log_info "Preparing metrics directory: $PROMETHEUS_MULTIPROC_DIR"
+
+    # Workers write per-pid metric files here; files left by a previous run would
+    # be added to the new totals, so the directory starts empty on every boot.
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR" || error_exit "Cannot create metrics directory: $PROMETHEUS_MULTIPROC_DIR"
+}
+
+recommend_bcrypt_cost() {
+    # Only reports a cost for this host. BCRYPT_ROUNDS must stay one pinned value
+    # for the whole deployment: replicas that picked their own cost would keep
+    # rehashing each other's passwords on login.
+    if [[ -z "${BCRYPT_TARGET_MS:-}" ]]; then
+        return 0
+    fi
+
+    cd "$APP_DIR"
+
+    local rounds
+    if rounds=$(python3 -m src.tools.calibrate_bcrypt --target-ms "$BCRYPT_TARGET_MS" --quiet); then
+        log_info "bcrypt cost for a ${BCRYPT_TARGET_MS} ms target on this host: $rounds (using BCRYPT_ROUNDS=${BCRYPT_ROUNDS:-default})"
+    else
+        log_warn "bcrypt calibration failed"
+    fi
+}
+
 bootstrap_initial() {
     log_info "Bootstrapping default user ..."
 
@@ -274,12 +302,19 @@ main() {
     log_info "=== Support System API Entrypoint ==="
     log_info "Starting initialization sequence..."
 
+    # Importing the app creates the multiprocess metric files, so the directory
+    # has to exist before validate_environment and bootstrap_initial import it.
+    prepare_metrics_dir
     validate_environment
     setup_application
     preflight_checks
     wait_for_dependencies
     run_migrations
+    recommend_bcrypt_cost
     bootstrap_initial
+    # Clear it again: the setup steps left files for pids that no longer exist,
+    # which liveall gauges would still report.
+    prepare_metrics_dir
     start_application
 }
 
@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_requests_created_id" ON "requests" ("created_at" DESC, "id" DESC);
+CREATE INDEX IF NOT EXISTS "idx_requests_owner_created" ON "requests" ("owner_id", "created_at" DESC, "id" DESC);
+CREATE INDEX IF NOT EXISTS "idx_requests_staff_status_created" ON "requests" ("staff_member_id", "status", "created_at" DESC, "id" DESC);
+CREATE INDEX IF NOT EXISTS "idx_requests_open_status_created" ON "requests" ("status", "created_at" DESC, "id" DESC) WHERE "status" IN ('new', 'in_progress');"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_requests_open_status_created";
+DROP INDEX IF EXISTS "idx_requests_staff_status_created";
+DROP INDEX IF EXISTS "idx_requests_owner_created";
+DROP INDEX IF EXISTS "idx_requests_created_id";"""
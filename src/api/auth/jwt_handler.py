@@ -1,13 +1,22 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from fastapi import HTTPException, status
+import hashlib
+import uuid
 import jwt
 
 from src.enums import UserRole
 from src.core.config import settings
+from src.core.token_revocation import token_revocation_list
+from src.utils.cache import ExpiringLRUCache
 
 
 class JWTHandler:
+    # Validated access-token payloads, keyed by the token's SHA-256 and expiring at
+    # the token's own `exp`. Set to None to disable caching.
+    payload_cache: Optional[ExpiringLRUCache] = (
+        ExpiringLRUCache(settings.jwt_cache_max_size) if settings.jwt_cache_max_size > 0 else None
+    )
 
     @staticmethod
     def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -17,6 +26,7 @@ class JWTHandler:
         to_encode.update({
             "exp": expire,
             "iat": datetime.utcnow(),
+            "jti": uuid.uuid4().hex,
             "token_type": "access"
         })
 
@@ -25,11 +35,12 @@ class JWTHandler:
     @staticmethod
     def create_refresh_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         to_encode = data.copy()
-        expire = datetime.utcnow() + (expires_delta or timedelta(days=7))
+        expire = datetime.utcnow() + (expires_delta or timedelta(days=settings.refresh_token_expire_days))
 
         to_encode.update({
             "exp": expire,
             "iat": datetime.utcnow(),
+            "jti": uuid.uuid4().hex,
             "token_type": "refresh"
         })
 
@@ -62,13 +73,19 @@ class JWTHandler:
         return JWTHandler.create_access_token(payload)
 
     @staticmethod
-    def create_token_pair(user_id: int, email: str, role: UserRole, permissions: Optional[List[str]] = None) -> Dict[
-        str, Any]:
+    def create_token_pair(
+            user_id: int,
+            email: str,
+            role: UserRole,
+            permissions: Optional[List[str]] = None,
+            permission_claims: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         base_payload = {
             "user_id": user_id,
             "email": email,
             "role": role.value,
-            "permissions": permissions or []
+            "permissions": permissions or [],
+            **(permission_claims or {})
         }
 
         access_token = JWTHandler.create_access_token(base_payload)
@@ -83,6 +100,32 @@ class JWTHandler:
 
     @staticmethod
     def get_token_payload(token: str) -> Dict[str, Any]:
+        cache = JWTHandler.payload_cache
+        if cache is None:
+            payload = JWTHandler._validate_access_token(token)
+            JWTHandler._ensure_not_revoked(payload)
+            return payload
+
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload = cache.get(cache_key)
+        if payload is None:
+            payload = JWTHandler._validate_access_token(token)
+            if "exp" in payload:
+                cache.set(cache_key, payload, expires_at=payload["exp"])
+
+        # Checked on cache hits too, so a revocation takes effect without evicting
+        # anything from the payload cache.
+        JWTHandler._ensure_not_revoked(payload)
+
+        # Callers get their own copy so mutating it cannot poison the cache.
+        return {key: list(value) if isinstance(value, list) else value for key, value in payload.items()}
+
+    @staticmethod
+    def get_cache_stats() -> Optional[Dict[str, Any]]:
+        return JWTHandler.payload_cache.get_stats() if JWTHandler.payload_cache is not None else None
+
+    @staticmethod
+    def _validate_access_token(token: str) -> Dict[str, Any]:
         payload = JWTHandler.decode_token(token)
 
         if payload.get("token_type") != "access":
@@ -120,8 +163,17 @@ class JWTHandler:
                 detail="Invalid refresh token"
             )
 
+        JWTHandler._ensure_not_revoked(payload)
         return payload
 
+    @staticmethod
+    def _ensure_not_revoked(payload: Dict[str, Any]) -> None:
+        if token_revocation_list.is_revoked(payload):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked"
+            )
+
     @staticmethod
     def verify_token_permissions(token: str, required_permissions: List[str]) -> Dict[str, Any]:
         payload = JWTHandler.get_token_payload(token)
@@ -1,12 +1,15 @@
 import bcrypt
-from typing import Tuple, List
+from typing import Optional, Tuple, List
+
+from src.core.config import settings
+from src.core.executors import password_executor
 
 
 class PasswordManager:
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        salt = bcrypt.gensalt()
+    def hash_password(password: str, rounds: Optional[int] = None) -> str:
+        salt = bcrypt.gensalt(rounds=rounds or settings.bcrypt_rounds)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
@@ -17,6 +20,29 @@ class PasswordManager:
         except (ValueError, TypeError):
             return False
 
+    @staticmethod
+    def get_rounds(hashed_password: str) -> Optional[int]:
+        # Modular crypt format: $2b$<cost>$<22-char salt><31-char hash>
+        parts = hashed_password.split("$")
+        if len(parts) != 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        rounds = PasswordManager.get_rounds(hashed_password)
+        return rounds is not None and rounds != settings.bcrypt_rounds
+
+    # bcrypt takes 100+ ms per call; request handlers use the async variants so the
+    # work runs on the bounded password executor instead of the event loop.
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        return await password_executor.run("hash", PasswordManager.hash_password, password)
+
+    @staticmethod
+    async def verify_password_async(password: str, hashed_password: str) -> bool:
+        return await password_executor.run("verify", PasswordManager.verify_password, password, hashed_password)
+
     @staticmethod
     def is_password_strong(password: str) -> Tuple[bool, List[str]]:
         errors = []
@@ -1,14 +1,14 @@
 from fastapi import APIRouter, Depends, status
 
-from src.middleware.permissions import PermissionsValidator, Permissions
+from src.middleware.permissions import Authorize, Permissions
 from src.api.services.request_service import RequestService
-from src.middleware.auth_middleware import require_admin
 from src.api.services.admin_service import AdminService
 from src.api.services.user_service import UserService
 from src.api.services.csv_service import CSVService
+from src.enums import UserRole
 from src.api.schemas.schemas import (
     AdminRegistration, AdminResponse, StatsResponse,
-    PaginationParams, PaginatedResponse, RequestFilters
+    PaginationParams, PaginatedResponse, RequestFilters, RequestPaginationParams
 )
 
 router = APIRouter()
@@ -22,10 +22,7 @@ async def register_admin(admin_data: AdminRegistration):
 @router.get(
     "/statistics",
     response_model=StatsResponse,
-    dependencies=[
-        Depends(require_admin),
-        Depends(PermissionsValidator([Permissions.VIEW_STATISTICS]))
-    ]
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_STATISTICS]))]
 )
 async def get_statistics():
     return await AdminService.get_statistics()
@@ -33,10 +30,7 @@ async def get_statistics():
 
 @router.get(
     "/users",
-    dependencies=[
-        Depends(require_admin),
-        Depends(PermissionsValidator([Permissions.VIEW_USERS]))
-    ]
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_USERS]))]
 )
 async def get_all_users(pagination: PaginationParams = Depends()):
     return await AdminService.get_all_users(pagination)
@@ -44,10 +38,7 @@ async def get_all_users(pagination: PaginationParams = Depends()):
 
 @router.get(
     "/staff",
-    dependencies=[
-        Depends(require_admin),
-        Depends(PermissionsValidator([Permissions.VIEW_STAFF]))
-    ]
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_STAFF]))]
 )
 async def get_all_staff(pagination: PaginationParams = Depends()):
     return await AdminService.get_all_staff(pagination)
@@ -55,10 +46,7 @@ async def get_all_staff(pagination: PaginationParams = Depends()):
 
 @router.delete(
     "/users/{user_id}",
-    dependencies=[
-        Depends(require_admin),
-        Depends(PermissionsValidator([Permissions.DELETE_USERS]))
-    ]
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.DELETE_USERS]))]
 )
 async def delete_user(user_id: int):
     return await AdminService.delete_user(user_id)
@@ -66,21 +54,23 @@ async def delete_user(user_id: int):
 
 @router.delete(
     "/staff/{staff_id}",
-    dependencies=[
-        Depends(require_admin),
-        Depends(PermissionsValidator([Permissions.DELETE_STAFF]))
-    ]
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.DELETE_STAFF]))]
 )
 async def delete_staff(staff_id: int):
     return await AdminService.delete_staff(staff_id)
 
 
+@router.post(
+    "/users/{user_id}/revoke-tokens",
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.MANAGE_USERS]))]
+)
+async def revoke_user_tokens(user_id: int):
+    return await AdminService.revoke_user_tokens(user_id)
+
+
 @router.get(
     "/staff/workload",
-    dependencies=[
-        Depends(require_admin),
-        Depends(PermissionsValidator([Permissions.VIEW_STAFF, Permissions.VIEW_STATISTICS]))
-    ]
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_STAFF, Permissions.VIEW_STATISTICS]))]
 )
 async def get_staff_workload():
     return await AdminService.get_staff_workload()
@@ -89,24 +79,18 @@ async def get_staff_workload():
 @router.get(
     "/requests",
     response_model=PaginatedResponse,
-    dependencies=[
-        Depends(require_admin),
-        Depends(PermissionsValidator([Permissions.VIEW_REQUESTS]))
-    ]
+    dependencies=[Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_REQUESTS]))]
 )
 async def get_all_requests(
-    pagination: PaginationParams = Depends(),
+    pagination: RequestPaginationParams = Depends(),
     filters: RequestFilters = Depends()
 ):
     return await RequestService.get_all_requests(pagination, filters)
 
 
-@router.get(
-    "/requests/export",
-    dependencies=[Depends(PermissionsValidator([Permissions.EXPORT_DATA]))]
-)
+@router.get("/requests/export")
 async def export_requests_csv(
     filters: RequestFilters = Depends(),
-    current_admin = Depends(require_admin)
+    current_admin = Depends(Authorize([UserRole.ADMIN], [Permissions.EXPORT_DATA]))
 ):
     return await CSVService.export_requests_csv(filters, current_admin["user_id"])
\ No newline at end of file
@@ -1,14 +1,14 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, status
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from src.middleware.auth_middleware import get_current_user, verify_user_context
-from src.middleware.permissions import PermissionsValidator, Permissions, RolePermissions
+from src.middleware.permissions import Authorize, Permissions, RolePermissions
 from src.api.auth.jwt_handler import JWTHandler
 from src.api.services import UserService
 from src.enums import UserRole
 from src.api.schemas.schemas import (
     UserRegistration, UserLogin, TokenResponse,
-    UserResponse, UserProfileUpdate, PasswordChange
+    UserResponse, UserProfileUpdate, PasswordChange, LogoutRequest
 )
 
 router = APIRouter()
@@ -26,37 +26,38 @@ async def login_user(login_data: UserLogin, request: Request):
     return await UserService.authenticate_user(login_data, ip_address)
 
 
-@router.get(
-    "/profile",
-    dependencies=[Depends(PermissionsValidator([Permissions.MANAGE_PROFILE]))]
-)
-async def get_profile(current_user: Dict[str, Any] = Depends(verify_user_context)):
+@router.get("/profile")
+async def get_profile(current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.MANAGE_PROFILE]))):
     return await UserService.get_user_profile(current_user["user_id"])
 
 
 @router.put(
     "/profile",
-    response_model=UserResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.MANAGE_PROFILE]))]
+    response_model=UserResponse
 )
 async def update_profile(
     profile_data: UserProfileUpdate,
-    current_user: Dict[str, Any] = Depends(verify_user_context)
+    current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.MANAGE_PROFILE]))
 ):
     return await UserService.update_user_profile(current_user["user_id"], profile_data)
 
 
-@router.post(
-    "/change-password",
-    dependencies=[Depends(PermissionsValidator([Permissions.MANAGE_PROFILE]))]
-)
+@router.post("/change-password")
 async def change_password(
     password_data: PasswordChange,
-    current_user: Dict[str, Any] = Depends(verify_user_context)
+    current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.MANAGE_PROFILE]))
 ):
     return await UserService.change_password(current_user["user_id"], password_data)
 
 
+@router.post("/logout")
+async def logout(
+    logout_data: Optional[LogoutRequest] = None,
+    current_user: Dict[str, Any] = Depends(verify_user_context)
+):
+    return await UserService.logout(current_user, logout_data.refresh_token if logout_data else None)
+
+
 @router.post("/refresh")
 async def refresh_token(refresh_token: str):
     try:
@@ -68,7 +69,7 @@ async def refresh_token(refresh_token: str):
         permissions = RolePermissions.get_role_permissions(user_role)
 
         token_data = JWTHandler.create_token_pair(
-            user_id, user_profile.email, user_role, permissions
+            user_id, user_profile.email, user_role, permissions, RolePermissions.get_token_claims(user_role)
         )
 
         return {
@@ -2,23 +2,38 @@ from fastapi import APIRouter, Depends, Query
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
-from src.middleware.permissions import PermissionsValidator, Permissions
+from src.middleware.permissions import Authorize, Permissions
 from src.core.database import DatabaseManager
 from src.core.dependencies import get_database_manager
-from src.middleware.auth_middleware import require_admin
+from src.core.config import settings
+from src.core.log_pipeline import log_pipeline
+from src.core.log_rollups import request_rollups
+from src.core.log_spool import log_spool, log_spool_replayer
+from src.api.services.log_analytics_service import LogAnalyticsService
+from src.api.services.log_export_service import LogExportService
+from src.enums import ExportFormat, LogCollection, RollupGranularity, UserRole
 
 router = APIRouter()
 
+API_LOG_PROJECTION = {
+    "timestamp": 1, "method": 1, "url": 1, "route": 1, "status_code": 1,
+    "process_time": 1, "ip_address": 1, "user_agent": 1, "user_info": 1
+}
 
-@router.get(
-    "/api-logs",
-    dependencies=[Depends(PermissionsValidator([Permissions.VIEW_LOGS]))]
-)
+REQUEST_ACTION_PROJECTION = {
+    "timestamp": 1, "request_id": 1, "request_ids": 1, "user_id": 1, "user_email": 1,
+    "user_role": 1, "action": 1, "method": 1, "url": 1
+}
+
+
+@router.get("/api-logs")
 async def get_api_logs(
-    current_user: Dict[str, Any] = Depends(require_admin),
+    current_user: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_LOGS])),
     db: DatabaseManager = Depends(get_database_manager),
     page: int = Query(1, ge=1),
     size: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
     method: Optional[str] = Query(None),
     status_code: Optional[int] = Query(None),
     user_id: Optional[int] = Query(None),
@@ -38,19 +53,21 @@ async def get_api_logs(
         collection="app_logs",
         filters=filters,
         page=page,
-        size=size
+        size=size,
+        cursor=cursor,
+        include_total=include_total,
+        projection=API_LOG_PROJECTION
     )
 
 
-@router.get(
-    "/request-actions",
-    dependencies=[Depends(PermissionsValidator([Permissions.VIEW_LOGS]))]
-)
+@router.get("/request-actions")
 async def get_request_action_logs(
-    current_user: Dict[str, Any] = Depends(require_admin),
+    current_user: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_LOGS])),
     db: DatabaseManager = Depends(get_database_manager),
     page: int = Query(1, ge=1),
     size: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    include_total: bool = Query(True),
     request_id: Optional[int] = Query(None),
     user_id: Optional[int] = Query(None),
     action: Optional[str] = Query(None),
@@ -60,7 +77,8 @@ async def get_request_action_logs(
     filters = {"timestamp": {"$gte": since}}
 
     if request_id:
-        filters["request_id"] = request_id
+        # Bulk actions record the tickets they changed in `request_ids`.
+        filters["$or"] = [{"request_id": request_id}, {"request_ids": request_id}]
     if user_id:
         filters["user_id"] = user_id
     if action:
@@ -70,27 +88,93 @@ async def get_request_action_logs(
         collection="request_actions",
         filters=filters,
         page=page,
-        size=size
+        size=size,
+        cursor=cursor,
+        include_total=include_total,
+        projection=REQUEST_ACTION_PROJECTION
     )
 
 
-@router.get(
-    "/stats",
-    dependencies=[Depends(PermissionsValidator([Permissions.VIEW_LOGS, Permissions.VIEW_STATISTICS]))]
-)
+@router.get("/export")
+async def export_logs(
+    collection: LogCollection,
+    current_user: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_LOGS, Permissions.EXPORT_DATA])),
+    db: DatabaseManager = Depends(get_database_manager),
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    since: Optional[datetime] = Query(None),
+    until: Optional[datetime] = Query(None)
+):
+    until = until or datetime.utcnow()
+    since = since or until - timedelta(hours=24)
+    projection = API_LOG_PROJECTION if collection == LogCollection.APP_LOGS else REQUEST_ACTION_PROJECTION
+
+    return await LogExportService.export_logs(
+        db,
+        collection,
+        since,
+        until,
+        columns=list(projection),
+        export_format=export_format,
+        batch_size=settings.log_export_batch_size
+    )
+
+
+@router.get("/stats")
 async def get_logging_stats(
-    current_user: Dict[str, Any] = Depends(require_admin),
+    current_user: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_LOGS, Permissions.VIEW_STATISTICS])),
     db: DatabaseManager = Depends(get_database_manager),
     hours_ago: int = Query(24, ge=1, le=168)
 ):
     since = datetime.utcnow() - timedelta(hours=hours_ago)
 
-    api_logs_count = await db.count_mongo_logs("app_logs", {"timestamp": {"$gte": since}})
+    totals = await LogAnalyticsService.get_request_totals(db, since)
     action_logs_count = await db.count_mongo_logs("request_actions", {"timestamp": {"$gte": since}})
 
     return {
         "period_hours": hours_ago,
-        "api_requests": api_logs_count,
+        "api_requests": totals["requests"],
+        "api_server_errors": totals["server_errors"],
         "request_actions": action_logs_count,
-        "total_logs": api_logs_count + action_logs_count
-    }
\ No newline at end of file
+        "total_logs": totals["requests"] + action_logs_count,
+        "pipeline": log_pipeline.get_stats(),
+        "rollups": request_rollups.get_stats(),
+        "spool": {**log_spool.get_stats(), **log_spool_replayer.get_stats()} if settings.log_spool_enabled else None
+    }
+
+
+@router.get("/analytics")
+async def get_log_analytics(
+    current_user: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_LOGS, Permissions.VIEW_STATISTICS])),
+    db: DatabaseManager = Depends(get_database_manager),
+    hours_ago: int = Query(24, ge=1, le=168),
+    bucket_minutes: int = Query(60, ge=1, le=1440),
+    route: Optional[str] = Query(None),
+    method: Optional[str] = Query(None)
+):
+    until = datetime.utcnow()
+    since = until - timedelta(hours=hours_ago)
+
+    return await LogAnalyticsService.get_route_latency(db, since, until, bucket_minutes, route, method)
+
+
+@router.get("/rollups")
+async def get_log_rollups(
+    current_user: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_LOGS, Permissions.VIEW_STATISTICS])),
+    db: DatabaseManager = Depends(get_database_manager),
+    hours_ago: int = Query(24, ge=1, le=24 * 365),
+    granularity: RollupGranularity = Query(RollupGranularity.MINUTE),
+    route: Optional[str] = Query(None),
+    method: Optional[str] = Query(None)
+):
+    until = datetime.utcnow()
+    since = until - timedelta(hours=hours_ago)
+
+    return await LogAnalyticsService.get_rollups(db, since, until, granularity, route, method)
+
+
+@router.get("/indexes")
+async def get_log_indexes(
+    current_user: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.VIEW_LOGS])),
+    db: DatabaseManager = Depends(get_database_manager)
+):
+    return db.get_index_report()
@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from typing import Dict, Any
 
-from src.middleware.auth_middleware import require_staff_or_admin, require_admin
-from src.middleware.permissions import PermissionsValidator, Permissions
+from src.middleware.permissions import Authorize, Permissions
+from src.middleware.route_actions import BULK_REQUEST_IDS_STATE
 from src.api.services.request_service import RequestService
 from src.api.services.user_service import UserService
+from src.enums import UserRole, BulkOutcome
 from src.api.schemas.schemas import (
     StaffRegistration, StaffResponse, RequestStatusUpdate,
     RequestResponse, PaginatedResponse, RequestFilters,
-    PaginationParams, StaffAssignment
+    RequestPaginationParams, StaffAssignment, BulkStaffAssignment,
+    BulkStatusUpdate, BulkComment, BulkOperationResponse
 )
 
 router = APIRouter()
@@ -16,25 +18,23 @@ router = APIRouter()
 
 @router.post(
     "/register",
-    response_model=StaffResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.MANAGE_STAFF]))]
+    response_model=StaffResponse
 )
 async def register_staff(
     staff_data: StaffRegistration,
-    current_admin: Dict[str, Any] = Depends(require_admin)
+    current_admin: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.MANAGE_STAFF]))
 ):
     return await UserService.register_staff(staff_data)
 
 
 @router.get(
     "/requests",
-    response_model=PaginatedResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.VIEW_REQUESTS]))]
+    response_model=PaginatedResponse
 )
 async def get_assigned_requests(
-    pagination: PaginationParams = Depends(),
+    pagination: RequestPaginationParams = Depends(),
     filters: RequestFilters = Depends(),
-    current_staff: Dict[str, Any] = Depends(require_staff_or_admin)
+    current_staff: Dict[str, Any] = Depends(Authorize([UserRole.STAFF, UserRole.ADMIN], [Permissions.VIEW_REQUESTS]))
 ):
     if filters.staff_id is None:
         filters.staff_id = current_staff["user_id"]
@@ -42,27 +42,69 @@ async def get_assigned_requests(
     return await RequestService.get_all_requests(pagination, filters)
 
 
+def _record_bulk_outcome(request: Request, response: BulkOperationResponse) -> BulkOperationResponse:
+    setattr(request.state, BULK_REQUEST_IDS_STATE, [
+        result.request_id for result in response.results if result.outcome == BulkOutcome.UPDATED
+    ])
+    return response
+
+
+# Declared before the /requests/{request_id}/... routes so "bulk" is not taken for an id.
+@router.post(
+    "/requests/bulk/assign",
+    response_model=BulkOperationResponse
+)
+async def bulk_assign_requests(
+    data: BulkStaffAssignment,
+    request: Request,
+    current_admin: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.ASSIGN_REQUESTS]))
+):
+    return _record_bulk_outcome(request, await RequestService.bulk_assign_staff(data))
+
+
+@router.post(
+    "/requests/bulk/status",
+    response_model=BulkOperationResponse
+)
+async def bulk_update_request_status(
+    data: BulkStatusUpdate,
+    request: Request,
+    current_staff: Dict[str, Any] = Depends(Authorize([UserRole.STAFF, UserRole.ADMIN], [Permissions.MANAGE_REQUESTS]))
+):
+    return _record_bulk_outcome(request, await RequestService.bulk_update_status(current_staff["user_id"], data))
+
+
+@router.post(
+    "/requests/bulk/comment",
+    response_model=BulkOperationResponse
+)
+async def bulk_comment_requests(
+    data: BulkComment,
+    request: Request,
+    current_staff: Dict[str, Any] = Depends(Authorize([UserRole.STAFF, UserRole.ADMIN], [Permissions.MANAGE_REQUESTS]))
+):
+    return _record_bulk_outcome(request, await RequestService.bulk_comment(data))
+
+
 @router.put(
     "/requests/{request_id}/status",
-    response_model=RequestResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.MANAGE_REQUESTS]))]
+    response_model=RequestResponse
 )
 async def update_request_status(
     request_id: int,
     data: RequestStatusUpdate,
-    current_staff: Dict[str, Any] = Depends(require_staff_or_admin)
+    current_staff: Dict[str, Any] = Depends(Authorize([UserRole.STAFF, UserRole.ADMIN], [Permissions.MANAGE_REQUESTS]))
 ):
     return await RequestService.update_request_status(request_id, current_staff["user_id"], data)
 
 
 @router.post(
     "/requests/{request_id}/assign",
-    response_model=RequestResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.ASSIGN_REQUESTS]))]
+    response_model=RequestResponse
 )
 async def assign_request_to_staff(
     request_id: int,
     assignment: StaffAssignment,
-    current_admin: Dict[str, Any] = Depends(require_admin)
+    current_admin: Dict[str, Any] = Depends(Authorize([UserRole.ADMIN], [Permissions.ASSIGN_REQUESTS]))
 ):
     return await RequestService.assign_staff_to_request(request_id, assignment, current_admin["user_id"])
\ No newline at end of file
@@ -1,13 +1,12 @@
 from fastapi import APIRouter, Depends
 from typing import Dict, Any
 
-from src.middleware.permissions import PermissionsValidator, Permissions
-from src.middleware.auth_middleware import require_user_access
+from src.middleware.permissions import Authorize, Permissions
 from src.api.services.request_service import RequestService
 from src.enums import UserRole
 from src.api.schemas.schemas import (
     RequestCreate, RequestUpdate, RequestResponse,
-    PaginatedResponse, RequestFilters, PaginationParams
+    PaginatedResponse, RequestFilters, RequestPaginationParams
 )
 
 router = APIRouter()
@@ -15,37 +14,34 @@ router = APIRouter()
 
 @router.post(
     "/",
-    response_model=RequestResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.CREATE_REQUEST]))]
+    response_model=RequestResponse
 )
 async def create_request(
     data: RequestCreate,
-    current_user: Dict[str, Any] = Depends(require_user_access)
+    current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.CREATE_REQUEST]))
 ):
     return await RequestService.create_request(current_user["user_id"], data)
 
 
 @router.get(
     "/my",
-    response_model=PaginatedResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.VIEW_OWN_REQUESTS]))]
+    response_model=PaginatedResponse
 )
 async def get_my_requests(
-    pagination: PaginationParams = Depends(),
+    pagination: RequestPaginationParams = Depends(),
     filters: RequestFilters = Depends(),
-    current_user: Dict[str, Any] = Depends(require_user_access)
+    current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.VIEW_OWN_REQUESTS]))
 ):
     return await RequestService.get_user_requests(current_user["user_id"], pagination, filters)
 
 
 @router.get(
     "/{request_id}",
-    response_model=RequestResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.VIEW_OWN_REQUESTS]))]
+    response_model=RequestResponse
 )
 async def get_request_by_id(
     request_id: int,
-    current_user: Dict[str, Any] = Depends(require_user_access)
+    current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.VIEW_OWN_REQUESTS]))
 ):
     user_role = UserRole(current_user["role"])
     return await RequestService.get_request_by_id(request_id, current_user["user_id"], user_role)
@@ -53,23 +49,19 @@ async def get_request_by_id(
 
 @router.put(
     "/{request_id}",
-    response_model=RequestResponse,
-    dependencies=[Depends(PermissionsValidator([Permissions.UPDATE_OWN_REQUESTS]))]
+    response_model=RequestResponse
 )
 async def update_request(
     request_id: int,
     data: RequestUpdate,
-    current_user: Dict[str, Any] = Depends(require_user_access)
+    current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.UPDATE_OWN_REQUESTS]))
 ):
     return await RequestService.update_request(request_id, current_user["user_id"], data)
 
 
-@router.delete(
-    "/{request_id}",
-    dependencies=[Depends(PermissionsValidator([Permissions.DELETE_OWN_REQUESTS]))]
-)
+@router.delete("/{request_id}")
 async def delete_request(
     request_id: int,
-    current_user: Dict[str, Any] = Depends(require_user_access)
+    current_user: Dict[str, Any] = Depends(Authorize(permissions=[Permissions.DELETE_OWN_REQUESTS]))
 ):
     return await RequestService.delete_request(request_id, current_user["user_id"])
\ No newline at end of file
@@ -1,8 +1,9 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator, model_validator
 from typing import Optional, List
 from datetime import datetime
 
-from src.enums import UserRole, RequestStatus
+from src.core.config import settings
+from src.enums import UserRole, RequestStatus, TotalMode, BulkOutcome
 
 
 class TokenResponse(BaseModel):
@@ -94,6 +95,10 @@ class PasswordChange(BaseModel):
     new_password: str
 
 
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None
+
+
 class RequestCreate(BaseModel):
     text: str
 
@@ -142,6 +147,23 @@ class PaginationParams(BaseModel):
     page: int = 1
     size: int = 50
 
+    @field_validator("page")
+    @classmethod
+    def clamp_page(cls, value: int) -> int:
+        return max(1, value)
+
+    @field_validator("size")
+    @classmethod
+    def clamp_size(cls, value: int) -> int:
+        return min(max(1, value), settings.pagination_max_size)
+
+
+class RequestPaginationParams(PaginationParams):
+    # An opaque next_cursor/prev_cursor from a previous page; when set, `page` is ignored.
+    cursor: Optional[str] = None
+    include_total: bool = True
+    total_mode: TotalMode = TotalMode.EXACT
+
 
 class RequestFilters(BaseModel):
     status: Optional[RequestStatus] = None
@@ -151,12 +173,65 @@ class RequestFilters(BaseModel):
     date_to: Optional[datetime] = None
 
 
+class BulkRequestSelection(BaseModel):
+    # Exactly one of: explicit ids (at most BULK_REQUEST_MAX_IDS) or a filter, which
+    # is rejected as a whole if it matches more than BULK_REQUEST_MAX_IDS tickets.
+    request_ids: Optional[List[int]] = None
+    filters: Optional[RequestFilters] = None
+
+    @field_validator("request_ids")
+    @classmethod
+    def unique_request_ids(cls, value: Optional[List[int]]) -> Optional[List[int]]:
+        if value is None:
+            return value
+        value = list(dict.fromkeys(value))
+        if not value:
+            raise ValueError("request_ids must not be empty")
+        if len(value) > settings.bulk_request_max_ids:
+            raise ValueError(f"At most {settings.bulk_request_max_ids} request ids per call")
+        return value
+
+    @model_validator(mode="after")
+    def one_selection(self) -> "BulkRequestSelection":
+        if (self.request_ids is None) == (self.filters is None):
+            raise ValueError("Provide either request_ids or filters")
+        return self
+
+
+class BulkStaffAssignment(BulkRequestSelection):
+    staff_id: int
+
+
+class BulkStatusUpdate(BulkRequestSelection):
+    status: RequestStatus
+    staff_comment: Optional[str] = None
+
+
+class BulkComment(BulkRequestSelection):
+    staff_comment: str
+
+
+class BulkRequestResult(BaseModel):
+    request_id: int
+    outcome: BulkOutcome
+    status: Optional[RequestStatus] = None
+
+
+class BulkOperationResponse(BaseModel):
+    matched: int
+    updated: int
+    results: List[BulkRequestResult]
+
+
 class PaginatedResponse(BaseModel):
     items: List[RequestListResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    total_estimated: bool = False
 
 
 class StatsResponse(BaseModel):
@@ -2,7 +2,9 @@ from typing import List
 from fastapi import HTTPException, status
 from tortoise.functions import Count
 from tortoise.expressions import Q
+from tortoise.queryset import ValuesQuery
 
+from src.core.token_revocation import token_revocation_list
 from src.models.models import User, Request
 from src.api.schemas.schemas import StatsResponse, UserResponse, StaffResponse, PaginationParams
 from src.enums import RequestStatus, UserRole
@@ -82,6 +84,7 @@ class AdminService:
             )
 
         await user.delete()
+        await token_revocation_list.revoke_user(user_id)
         return {"message": "User deleted successfully"}
 
     @staticmethod
@@ -98,11 +101,27 @@ class AdminService:
             await Request.filter(staff_member_id=staff_id).update(staff_member_id=None)
 
         await staff.delete()
+        await token_revocation_list.revoke_user(staff_id)
         return {"message": "Staff member deleted successfully"}
 
+    @staticmethod
+    async def revoke_user_tokens(user_id: int) -> dict:
+        if not await User.filter(id=user_id).exists():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+
+        revoked_before = await token_revocation_list.revoke_user(user_id)
+        return {"message": "User tokens revoked", "revoked_before": revoked_before}
+
     @staticmethod
     async def get_staff_workload() -> List[dict]:
-        staff_workload = await User.filter(role=UserRole.STAFF).annotate(
+        return await AdminService._staff_workload_query()
+
+    @staticmethod
+    def _staff_workload_query() -> ValuesQuery:
+        return User.filter(role=UserRole.STAFF).annotate(
             total_requests=Count("assigned_requests"),
             new_requests=Count("assigned_requests", _filter=Q(assigned_requests__status=RequestStatus.NEW)),
             in_progress_requests=Count("assigned_requests", _filter=Q(assigned_requests__status=RequestStatus.IN_PROGRESS)),
@@ -111,6 +130,4 @@ class AdminService:
         ).values(
             "id", "email", "total_requests", "new_requests",
             "in_progress_requests", "completed_requests", "closed_requests"
-        )
-
-        return staff_workload
\ No newline at end of file
+        )
\ No newline at end of file
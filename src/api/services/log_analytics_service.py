@@ -0,0 +1,227 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, status
+
+from src.core.database import DatabaseManager
+from src.core.log_rollups import (
+    LATENCY_BUCKETS_MS, LATENCY_BUCKET_KEYS, ROLLUP_HOUR_COLLECTION, ROLLUP_MINUTE_COLLECTION
+)
+from src.enums import RollupGranularity
+
+MAX_ANALYTICS_BUCKETS = 2000
+LATENCY_PERCENTILES = [0.5, 0.95, 0.99]
+
+
+class LogAnalyticsService:
+
+    @staticmethod
+    async def get_route_latency(
+            db: DatabaseManager,
+            since: datetime,
+            until: datetime,
+            bucket_minutes: int,
+            route: Optional[str] = None,
+            method: Optional[str] = None
+    ) -> Dict[str, Any]:
+        bucket_count = (until - since).total_seconds() / 60 / bucket_minutes
+        if bucket_count > MAX_ANALYTICS_BUCKETS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Time range spans more than {MAX_ANALYTICS_BUCKETS} buckets, increase bucket_minutes"
+            )
+
+        pipeline = LogAnalyticsService._build_route_latency_pipeline(since, until, bucket_minutes, route, method)
+        rows = await db.aggregate_mongo_logs("app_logs", pipeline)
+
+        return {
+            "since": since,
+            "until": until,
+            "bucket_minutes": bucket_minutes,
+            "items": rows
+        }
+
+    @staticmethod
+    async def get_request_totals(db: DatabaseManager, since: datetime) -> Dict[str, int]:
+        # Minute rows cover the recent window and hour rows everything already
+        # downsampled, so the two never overlap and can simply be added up.
+        totals = {"requests": 0, "server_errors": 0}
+        covered_from: Optional[datetime] = None
+        for collection, field in ((ROLLUP_MINUTE_COLLECTION, "minute"), (ROLLUP_HOUR_COLLECTION, "hour")):
+            rows = await db.aggregate_mongo_logs(collection, [
+                {"$match": {field: {"$gte": since}}},
+                {"$group": {"_id": None, "requests": {"$sum": "$count"}, "server_errors": {"$sum": "$errors"}}}
+            ])
+            if rows:
+                totals["requests"] += rows[0]["requests"]
+                totals["server_errors"] += rows[0]["server_errors"]
+
+            first = await db.aggregate_mongo_logs(collection, [
+                {"$sort": {field: 1}}, {"$limit": 1}, {"$project": {"_id": 0, "start": f"${field}"}}
+            ])
+            if first and (covered_from is None or first[0]["start"] < covered_from):
+                covered_from = first[0]["start"]
+
+        # Rollups only exist from the deploy that introduced them; the part of the
+        # range before the oldest rollup row is counted from raw app_logs, weighted
+        # by each entry's sample weight.
+        if covered_from is None or covered_from > since:
+            timestamp = {"$gte": since}
+            if covered_from is not None:
+                timestamp["$lt"] = covered_from
+            weight = {"$ifNull": ["$sample_weight", 1]}
+            rows = await db.aggregate_mongo_logs("app_logs", [
+                {"$match": {"timestamp": timestamp}},
+                {"$group": {
+                    "_id": None,
+                    "requests": {"$sum": weight},
+                    "server_errors": {"$sum": {"$cond": [{"$gte": ["$status_code", 500]}, weight, 0]}}
+                }}
+            ])
+            if rows:
+                totals["requests"] += round(rows[0]["requests"])
+                totals["server_errors"] += round(rows[0]["server_errors"])
+
+        return totals
+
+    @staticmethod
+    async def get_rollups(
+            db: DatabaseManager,
+            since: datetime,
+            until: datetime,
+            granularity: RollupGranularity,
+            route: Optional[str] = None,
+            method: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if granularity == RollupGranularity.MINUTE:
+            collection, field = ROLLUP_MINUTE_COLLECTION, "minute"
+        else:
+            collection, field = ROLLUP_HOUR_COLLECTION, "hour"
+
+        match: Dict[str, Any] = {field: {"$gte": since, "$lt": until}}
+        if route:
+            match["route"] = route
+        if method:
+            match["method"] = method
+
+        group: Dict[str, Any] = {
+            "_id": {"bucket": f"${field}", "route": "$route", "method": "$method"},
+            "requests": {"$sum": "$count"},
+            "server_errors": {"$sum": "$errors"},
+            "client_errors": {"$sum": {"$cond": [
+                {"$and": [{"$gte": ["$status_code", 400]}, {"$lt": ["$status_code", 500]}]}, "$count", 0
+            ]}},
+            "latency_sum_ms": {"$sum": "$latency_sum_ms"},
+            "max_ms": {"$max": "$latency_max_ms"},
+        }
+        for key in LATENCY_BUCKET_KEYS:
+            group[key] = {"$sum": {"$ifNull": [f"$latency_buckets.{key}", 0]}}
+
+        rows = await db.aggregate_mongo_logs(collection, [
+            {"$match": match},
+            {"$group": group},
+            {"$sort": {"_id.bucket": 1, "_id.route": 1, "_id.method": 1}}
+        ])
+
+        return {
+            "since": since,
+            "until": until,
+            "granularity": granularity.value,
+            "items": [LogAnalyticsService._format_rollup(row) for row in rows]
+        }
+
+    @staticmethod
+    def _format_rollup(row: dict) -> Dict[str, Any]:
+        requests = row["requests"]
+        histogram = [row[key] for key in LATENCY_BUCKET_KEYS]
+        return {
+            "bucket": row["_id"]["bucket"],
+            "route": row["_id"]["route"],
+            "method": row["_id"]["method"],
+            "requests": requests,
+            "error_rate": round(row["server_errors"] / requests, 4) if requests else 0.0,
+            "client_error_rate": round(row["client_errors"] / requests, 4) if requests else 0.0,
+            "avg_ms": round(row["latency_sum_ms"] / requests, 1) if requests else None,
+            "max_ms": row["max_ms"],
+            "p50_ms": LogAnalyticsService._histogram_percentile(histogram, 0.5),
+            "p95_ms": LogAnalyticsService._histogram_percentile(histogram, 0.95),
+            "p99_ms": LogAnalyticsService._histogram_percentile(histogram, 0.99),
+        }
+
+    @staticmethod
+    def _histogram_percentile(histogram: List[int], quantile: float) -> Optional[float]:
+        # Upper bound of the bucket holding the quantile; None when it falls in the overflow bucket.
+        total = sum(histogram)
+        if not total:
+            return None
+
+        rank = quantile * total
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, histogram):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return None
+
+    @staticmethod
+    def _build_route_latency_pipeline(
+            since: datetime,
+            until: datetime,
+            bucket_minutes: int,
+            route: Optional[str],
+            method: Optional[str]
+    ) -> List[dict]:
+        match: Dict[str, Any] = {"timestamp": {"$gte": since, "$lt": until}}
+        if route:
+            match["route"] = route
+        if method:
+            match["method"] = method
+
+        # Counts and the average are weighted by sample_weight so they stay correct
+        # under sampling. Percentiles can only be read from the stored samples, which
+        # over-represent slow requests once fast ones are sampled, so buckets holding
+        # a sample with a weight above 1 report them as null and set "sampled".
+        weight = {"$ifNull": ["$sample_weight", 1]}
+        sampled = {"$gt": ["$max_weight", 1]}
+        bucket_seconds = bucket_minutes * 60
+
+        def percentile_ms(index: int) -> dict:
+            value = {"$round": [{"$multiply": [{"$arrayElemAt": ["$latency", index]}, 1000]}, 1]}
+            return {"$cond": [sampled, None, value]}
+
+        return [
+            {"$match": match},
+            {"$group": {
+                "_id": {
+                    "route": "$route",
+                    "method": "$method",
+                    "bucket": {"$dateTrunc": {"date": "$timestamp", "unit": "minute", "binSize": bucket_minutes}}
+                },
+                "requests": {"$sum": weight},
+                "server_errors": {"$sum": {"$cond": [{"$gte": ["$status_code", 500]}, weight, 0]}},
+                "client_errors": {"$sum": {"$cond": [
+                    {"$and": [{"$gte": ["$status_code", 400]}, {"$lt": ["$status_code", 500]}]}, weight, 0
+                ]}},
+                "latency": {"$percentile": {
+                    "input": "$process_time", "p": LATENCY_PERCENTILES, "method": "approximate"
+                }},
+                "latency_sum": {"$sum": {"$multiply": ["$process_time", weight]}},
+                "max_weight": {"$max": weight}
+            }},
+            {"$project": {
+                "_id": 0,
+                "route": "$_id.route",
+                "method": "$_id.method",
+                "bucket": "$_id.bucket",
+                "requests": {"$round": ["$requests", 0]},
+                "rps": {"$round": [{"$divide": ["$requests", bucket_seconds]}, 3]},
+                "error_rate": {"$round": [{"$divide": ["$server_errors", "$requests"]}, 4]},
+                "client_error_rate": {"$round": [{"$divide": ["$client_errors", "$requests"]}, 4]},
+                "p50_ms": percentile_ms(0),
+                "p95_ms": percentile_ms(1),
+                "p99_ms": percentile_ms(2),
+                "avg_ms": {"$round": [{"$multiply": [{"$divide": ["$latency_sum", "$requests"]}, 1000]}, 1]},
+                "sampled": sampled
+            }},
+            {"$sort": {"bucket": 1, "route": 1, "method": 1}}
+        ]
@@ -0,0 +1,130 @@
+import csv
+import json
+import logging
+from datetime import datetime, timezone
+from io import StringIO
+from typing import Any, AsyncIterator, List
+
+from bson import ObjectId
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from src.core.database import DatabaseManager
+from src.enums import ExportFormat, LogCollection
+from src.utils.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+class LogExportService:
+
+    @staticmethod
+    async def export_logs(
+            db: DatabaseManager,
+            collection: LogCollection,
+            since: datetime,
+            until: datetime,
+            columns: List[str],
+            export_format: ExportFormat,
+            batch_size: int
+    ) -> StreamingResponse:
+        since, until = LogExportService._as_naive_utc(since), LogExportService._as_naive_utc(until)
+        if since >= until:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'since' must be earlier than 'until'"
+            )
+
+        projection = {"_id": 0, **{column: 1 for column in columns}}
+        documents = db.stream_mongo_logs(
+            collection.value, {"timestamp": {"$gte": since, "$lt": until}}, projection, batch_size
+        )
+        if export_format == ExportFormat.CSV:
+            chunks = LogExportService._encode_csv(documents, columns, batch_size)
+        else:
+            chunks = LogExportService._encode_ndjson(documents, batch_size)
+
+        # Pull the first chunk before the response starts so an unavailable MongoDB
+        # still surfaces as a 503 instead of a truncated 200.
+        try:
+            first_chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            first_chunk = None
+        except Exception as e:
+            logger.error(f"Log export of {collection.value} failed to start: {e}")
+            raise ServiceUnavailableException("Log storage is unavailable")
+
+        filename = f"{collection.value}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format.value}"
+
+        return StreamingResponse(
+            LogExportService._prepend(first_chunk, chunks),
+            media_type=MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+
+    @staticmethod
+    def _as_naive_utc(value: datetime) -> datetime:
+        # Log timestamps are stored as naive UTC, like datetime.utcnow() produces.
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    async def _prepend(first_chunk, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+        if first_chunk is None:
+            return
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    @staticmethod
+    async def _encode_ndjson(documents: AsyncIterator[dict], batch_size: int) -> AsyncIterator[str]:
+        lines: List[str] = []
+        async for document in documents:
+            lines.append(json.dumps(document, default=LogExportService._json_default, ensure_ascii=False))
+            if len(lines) >= batch_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    @staticmethod
+    async def _encode_csv(documents: AsyncIterator[dict], columns: List[str], batch_size: int) -> AsyncIterator[str]:
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(columns)
+
+        rows = 0
+        async for document in documents:
+            writer.writerow([LogExportService._csv_value(document.get(column)) for column in columns])
+            rows += 1
+            if rows >= batch_size:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+                rows = 0
+
+        yield output.getvalue()
+
+    @staticmethod
+    def _csv_value(value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=LogExportService._json_default, ensure_ascii=False)
+        return value
+
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, ObjectId):
+            return str(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -1,78 +1,86 @@
-from typing import Optional
+from typing import Hashable, List, Optional, Tuple
 from fastapi import HTTPException, status
-from tortoise.queryset import QuerySet
+from tortoise.expressions import Q, RawSQL
+from tortoise.queryset import QuerySet, ValuesQuery
 from datetime import datetime
 
-from src.enums import UserRole, RequestStatus
-from src.models.models import Request, User
+from src.core.config import settings
+from src.enums import UserRole, RequestStatus, TotalMode, BulkOutcome
+from src.models.models import Request
 from src.api.schemas.schemas import (
     RequestCreate, RequestUpdate, RequestResponse, RequestListResponse,
     RequestStatusUpdate, PaginatedResponse, RequestFilters,
-    PaginationParams, StaffAssignment
+    RequestPaginationParams, StaffAssignment, BulkRequestSelection,
+    BulkStaffAssignment, BulkStatusUpdate, BulkComment, BulkOperationResponse,
+    BulkRequestResult
 )
+from src.utils.cache import ExpiringLRUCache
+from src.utils.cursors import encode_cursor, decode_cursor
+from src.utils.exceptions import InvalidCursorException
 
 
 class RequestService:
+    # Exactly the RequestListResponse columns; the user emails come from the JOINs
+    # `.values()` adds for the related lookups, so a page is one query.
+    LIST_FIELDS = ("id", "text", "status", "created_at", "updated_at", "owner__email", "staff_member__email")
+
+    # Exact list totals keyed by listing scope and normalized filters. Short-lived,
+    # so totals may lag writes by up to the TTL. Set to None to disable caching.
+    total_cache: Optional[ExpiringLRUCache] = (
+        ExpiringLRUCache(settings.request_total_cache_max_size) if settings.request_total_cache_max_size > 0 else None
+    )
+
+    # Writes are single statements: the data-modifying CTE does the checks and the
+    # write, and the outer SELECT joins the written row with its owner and staff
+    # member for the response, so each mutation is one round trip and atomic.
+    RETURNING_COLUMNS = """
+        "r"."id", "r"."text", "r"."status", "r"."staff_comment", "r"."created_at", "r"."updated_at",
+        "owner"."id" AS "owner__id", "owner"."email" AS "owner__email", "owner"."role" AS "owner__role",
+        "owner"."inn" AS "owner__inn", "owner"."phone" AS "owner__phone",
+        "owner"."first_name" AS "owner__first_name", "owner"."last_name" AS "owner__last_name",
+        "owner"."birth_date" AS "owner__birth_date", "owner"."father_name" AS "owner__father_name",
+        "owner"."created_at" AS "owner__created_at", "owner"."updated_at" AS "owner__updated_at",
+        "staff"."id" AS "staff__id", "staff"."email" AS "staff__email", "staff"."role" AS "staff__role",
+        "staff"."created_at" AS "staff__created_at", "staff"."updated_at" AS "staff__updated_at"
+    """
+    RETURNING_JOINS = """
+        LEFT JOIN "users" "owner" ON "owner"."id" = "r"."owner_id"
+        LEFT JOIN "users" "staff" ON "staff"."id" = "r"."staff_member_id"
+    """
 
     @staticmethod
     async def create_request(user_id: int, data: RequestCreate) -> RequestResponse:
-        request = await Request.create(
-            owner_id=user_id,
-            text=data.text,
-            status=RequestStatus.NEW
-        )
+        row = await RequestService._write_returning(f"""
+            WITH "r" AS (
+                INSERT INTO "requests" ("owner_id", "text", "status", "created_at", "updated_at")
+                VALUES ($1, $2, $3, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                RETURNING *
+            )
+            SELECT {RequestService.RETURNING_COLUMNS} FROM "r" {RequestService.RETURNING_JOINS}
+        """, [user_id, data.text, RequestStatus.NEW.value])
 
-        request = await Request.get(id=request.id).prefetch_related("owner", "staff_member")
-        return await RequestService._build_request_response(request)
+        return RequestService._build_returning_response(row)
 
     @staticmethod
     async def get_user_requests(
             user_id: int,
-            pagination: PaginationParams,
+            pagination: RequestPaginationParams,
             filters: Optional[RequestFilters] = None
     ) -> PaginatedResponse:
         query = Request.filter(owner_id=user_id)
         query = RequestService._apply_filters(query, filters)
 
-        total = await query.count()
-
-        requests = await query.offset(
-            (pagination.page - 1) * pagination.size
-        ).limit(pagination.size).prefetch_related("owner", "staff_member")
-
-        items = [await RequestService._build_list_response(req) for req in requests]
-
-        return PaginatedResponse(
-            items=items,
-            total=total,
-            page=pagination.page,
-            size=pagination.size,
-            pages=(total + pagination.size - 1) // pagination.size
-        )
+        return await RequestService._list_requests(query, f"owner:{user_id}", pagination, filters)
 
     @staticmethod
     async def get_all_requests(
-            pagination: PaginationParams,
+            pagination: RequestPaginationParams,
             filters: Optional[RequestFilters] = None
     ) -> PaginatedResponse:
         query = Request.all()
         query = RequestService._apply_filters(query, filters)
 
-        total = await query.count()
-
-        requests = await query.offset(
-            (pagination.page - 1) * pagination.size
-        ).limit(pagination.size).prefetch_related("owner", "staff_member")
-
-        items = [await RequestService._build_list_response(req) for req in requests]
-
-        return PaginatedResponse(
-            items=items,
-            total=total,
-            page=pagination.page,
-            size=pagination.size,
-            pages=(total + pagination.size - 1) // pagination.size
-        )
+        return await RequestService._list_requests(query, "all", pagination, filters)
 
     @staticmethod
     async def get_request_by_id(request_id: int, user_id: int, user_role: UserRole) -> RequestResponse:
@@ -91,75 +99,138 @@ class RequestService:
 
     @staticmethod
     async def update_request(request_id: int, user_id: int, data: RequestUpdate) -> RequestResponse:
-        request = await Request.get_or_none(id=request_id, owner_id=user_id).prefetch_related("owner")
+        # The status check is part of the UPDATE, so a ticket picked up by staff
+        # between the check and the write can no longer be edited. "current" reads
+        # the pre-update row and tells a missing ticket from one being processed.
+        update_data = data.model_dump(exclude_unset=True)
+        row = await RequestService._write_returning(f"""
+            WITH "current" AS (
+                SELECT "id" FROM "requests" WHERE "id" = $1 AND "owner_id" = $2
+            ), "r" AS (
+                UPDATE "requests" SET
+                    "text" = COALESCE($3, "text"),
+                    "updated_at" = CASE WHEN $3::text IS NULL THEN "updated_at" ELSE CURRENT_TIMESTAMP END
+                WHERE "id" = $1 AND "owner_id" = $2 AND "status" = $4
+                RETURNING *
+            )
+            SELECT "current"."id" AS "found", {RequestService.RETURNING_COLUMNS}
+            FROM "current" LEFT JOIN "r" ON TRUE {RequestService.RETURNING_JOINS}
+        """, [request_id, user_id, update_data.get("text"), RequestStatus.NEW.value])
 
-        if not request:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Request not found"
             )
 
-        if request.status != RequestStatus.NEW:
+        if row["id"] is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot update request that is being processed"
             )
 
-        update_data = data.model_dump(exclude_unset=True)
-
-        if update_data:
-            await Request.filter(id=request_id).update(**update_data)
-            request = await Request.get(id=request_id).prefetch_related("owner", "staff_member")
-
-        return await RequestService._build_request_response(request)
+        return RequestService._build_returning_response(row)
 
     @staticmethod
     async def update_request_status(request_id: int, staff_id: int, data: RequestStatusUpdate) -> RequestResponse:
-        request = await Request.get_or_none(id=request_id).prefetch_related("owner", "staff_member")
+        row = await RequestService._write_returning(f"""
+            WITH "r" AS (
+                UPDATE "requests" SET
+                    "status" = $2, "staff_comment" = $3, "staff_member_id" = $4, "updated_at" = CURRENT_TIMESTAMP
+                WHERE "id" = $1
+                RETURNING *
+            )
+            SELECT {RequestService.RETURNING_COLUMNS} FROM "r" {RequestService.RETURNING_JOINS}
+        """, [request_id, data.status.value, data.staff_comment, staff_id])
 
-        if not request:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Request not found"
             )
 
-        await Request.filter(id=request_id).update(
-            status=data.status,
-            staff_comment=data.staff_comment,
-            staff_member_id=staff_id,
-            updated_at=datetime.utcnow()
-        )
-
-        request = await Request.get(id=request_id).prefetch_related("owner", "staff_member")
-        return await RequestService._build_request_response(request)
+        return RequestService._build_returning_response(row)
 
     @staticmethod
     async def assign_staff_to_request(request_id: int, assignment: StaffAssignment, admin_id: int) -> RequestResponse:
-        request = await Request.get_or_none(id=request_id).prefetch_related("owner")
-
-        if not request:
+        # The UPDATE only matches when the staff member exists; the probe row reports
+        # which lookup failed. NEW tickets move to IN_PROGRESS on assignment.
+        row = await RequestService._write_returning(f"""
+            WITH "assignee" AS (
+                SELECT "id" FROM "users" WHERE "id" = $2 AND "role" = $3
+            ), "r" AS (
+                UPDATE "requests" SET
+                    "staff_member_id" = "assignee"."id",
+                    "status" = CASE WHEN "requests"."status" = $4 THEN $5 ELSE "requests"."status" END,
+                    "updated_at" = CURRENT_TIMESTAMP
+                FROM "assignee"
+                WHERE "requests"."id" = $1
+                RETURNING "requests".*
+            )
+            SELECT
+                EXISTS (SELECT 1 FROM "requests" WHERE "id" = $1) AS "request_found",
+                EXISTS (SELECT 1 FROM "assignee") AS "staff_found",
+                {RequestService.RETURNING_COLUMNS}
+            FROM (VALUES (1)) AS "probe" LEFT JOIN "r" ON TRUE {RequestService.RETURNING_JOINS}
+        """, [
+            request_id, assignment.staff_id, UserRole.STAFF.value,
+            RequestStatus.NEW.value, RequestStatus.IN_PROGRESS.value
+        ])
+
+        if not row["request_found"]:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Request not found"
             )
 
-        staff = await User.get_or_none(id=assignment.staff_id, role=UserRole.STAFF)
-        if not staff:
+        if not row["staff_found"]:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Staff member not found"
             )
 
-        new_status = RequestStatus.IN_PROGRESS if request.status == RequestStatus.NEW else request.status
+        return RequestService._build_returning_response(row)
 
-        await Request.filter(id=request_id).update(
-            staff_member_id=assignment.staff_id,
-            status=new_status,
-            updated_at=datetime.utcnow()
+    @staticmethod
+    async def bulk_assign_staff(selection: BulkStaffAssignment) -> BulkOperationResponse:
+        values = [selection.staff_id, UserRole.STAFF.value, RequestStatus.NEW.value, RequestStatus.IN_PROGRESS.value]
+        rows = await RequestService._bulk_update(
+            selection,
+            set_clause=(
+                '"staff_member_id" = "assignee"."id", '
+                '"status" = CASE WHEN "requests"."status" = $3 THEN $4 ELSE "requests"."status" END'
+            ),
+            values=values,
+            with_clause=', "assignee" AS (SELECT "id" FROM "users" WHERE "id" = $1 AND "role" = $2)',
+            from_clause=', "assignee"',
+            probe_columns=', EXISTS (SELECT 1 FROM "assignee") AS "staff_found"'
         )
 
-        request = await Request.get(id=request_id).prefetch_related("owner", "staff_member")
-        return await RequestService._build_request_response(request)
+        if not rows[0]["staff_found"]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Staff member not found"
+            )
+
+        return RequestService._build_bulk_response(rows)
+
+    @staticmethod
+    async def bulk_update_status(staff_id: int, data: BulkStatusUpdate) -> BulkOperationResponse:
+        rows = await RequestService._bulk_update(
+            data,
+            set_clause='"status" = $1, "staff_comment" = $2, "staff_member_id" = $3',
+            values=[data.status.value, data.staff_comment, staff_id]
+        )
+        return RequestService._build_bulk_response(rows)
+
+    @staticmethod
+    async def bulk_comment(data: BulkComment) -> BulkOperationResponse:
+        rows = await RequestService._bulk_update(
+            data,
+            set_clause='"staff_comment" = $1',
+            values=[data.staff_comment]
+        )
+        return RequestService._build_bulk_response(rows)
 
     @staticmethod
     async def delete_request(request_id: int, user_id: int) -> dict:
@@ -183,7 +254,7 @@ class RequestService:
     @staticmethod
     def _apply_filters(query: QuerySet, filters: Optional[RequestFilters]) -> QuerySet:
         if not filters:
-            return query.order_by("-created_at")
+            return query.order_by("-created_at", "-id")
 
         if filters.status:
             query = query.filter(status=filters.status)
@@ -200,7 +271,127 @@ class RequestService:
         if filters.date_to:
             query = query.filter(created_at__lte=filters.date_to)
 
-        return query.order_by("-created_at")
+        return query.order_by("-created_at", "-id")
+
+    @staticmethod
+    async def _write_returning(sql: str, values: list) -> Optional[dict]:
+        rows = await Request._meta.db.execute_query_dict(sql, values)
+        return rows[0] if rows else None
+
+    @staticmethod
+    async def _bulk_update(
+            selection: BulkRequestSelection,
+            set_clause: str,
+            values: list,
+            with_clause: str = "",
+            from_clause: str = "",
+            probe_columns: str = ""
+    ) -> List[dict]:
+        # One statement per bulk call: "selected" reads at most limit + 1 matching
+        # ids, the UPDATE only runs when no more than `limit` matched, and the outer
+        # SELECT reports an outcome per requested id. The probe row keeps the
+        # result non-empty so the checks in `probe_columns` are always returned.
+        limit = settings.bulk_request_max_ids
+        if selection.request_ids is not None:
+            values.append(selection.request_ids)
+            predicate = f'"id" = ANY(${len(values)}::int[])'
+            requested = f'unnest(${len(values)}::int[]) WITH ORDINALITY AS "requested"("id", "position")'
+        else:
+            predicate = RequestService._bulk_predicate(selection.filters, values)
+            requested = (
+                '(SELECT "id", ROW_NUMBER() OVER (ORDER BY "created_at" DESC, "id" DESC) AS "position" '
+                'FROM "selected") AS "requested"'
+            )
+
+        rows = await Request._meta.db.execute_query_dict(f"""
+            WITH "selected" AS (
+                SELECT "id", "created_at" FROM "requests" WHERE {predicate}
+                ORDER BY "created_at" DESC, "id" DESC LIMIT {limit + 1}
+            ){with_clause}, "r" AS (
+                UPDATE "requests" SET {set_clause}, "updated_at" = CURRENT_TIMESTAMP
+                FROM "selected"{from_clause}
+                WHERE "requests"."id" = "selected"."id" AND (SELECT COUNT(*) FROM "selected") <= {limit}
+                RETURNING "requests"."id", "requests"."status"
+            )
+            SELECT
+                "requested"."id", "r"."id" IS NOT NULL AS "updated", "r"."status",
+                (SELECT COUNT(*) FROM "selected") AS "matched"{probe_columns}
+            FROM (VALUES (1)) AS "probe"
+            LEFT JOIN {requested} ON TRUE
+            LEFT JOIN "r" ON "r"."id" = "requested"."id"
+            ORDER BY "requested"."position"
+        """, values)
+
+        if rows[0]["matched"] > limit:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Filters match more than {limit} requests"
+            )
+
+        return rows
+
+    @staticmethod
+    def _bulk_predicate(filters: RequestFilters, values: list) -> str:
+        # The same conditions as _apply_filters, as SQL with positional parameters.
+        conditions = []
+        columns = (
+            ("status", '"status" ='),
+            ("staff_id", '"staff_member_id" ='),
+            ("owner_id", '"owner_id" ='),
+            ("date_from", '"created_at" >='),
+            ("date_to", '"created_at" <='),
+        )
+        for field, condition in columns:
+            value = getattr(filters, field)
+            if value:
+                values.append(value.value if isinstance(value, RequestStatus) else value)
+                conditions.append(f"{condition} ${len(values)}")
+
+        return " AND ".join(conditions) or "TRUE"
+
+    @staticmethod
+    def _build_bulk_response(rows: List[dict]) -> BulkOperationResponse:
+        results = [
+            BulkRequestResult(
+                request_id=row["id"],
+                outcome=BulkOutcome.UPDATED if row["updated"] else BulkOutcome.NOT_FOUND,
+                status=row["status"]
+            )
+            for row in rows if row["id"] is not None
+        ]
+
+        return BulkOperationResponse(
+            matched=rows[0]["matched"],
+            updated=sum(result.outcome == BulkOutcome.UPDATED for result in results),
+            results=results
+        )
+
+    @staticmethod
+    def _build_returning_response(row: dict) -> RequestResponse:
+        owner_data = {
+            field: row[f"owner__{field}"]
+            for field in (
+                "id", "email", "role", "inn", "phone", "first_name", "last_name",
+                "birth_date", "father_name", "created_at", "updated_at"
+            )
+        }
+
+        staff_data = None
+        if row["staff__id"] is not None:
+            staff_data = {
+                field: row[f"staff__{field}"] for field in ("id", "email", "role", "created_at", "updated_at")
+            }
+
+        return RequestResponse(
+            id=row["id"],
+            text=row["text"],
+            status=row["status"],
+            staff_comment=row["staff_comment"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            owner=owner_data,
+            staff_member=staff_data
+        )
 
     @staticmethod
     async def _build_request_response(request: Request) -> RequestResponse:
@@ -240,13 +431,159 @@ class RequestService:
         )
 
     @staticmethod
-    async def _build_list_response(request: Request) -> RequestListResponse:
-        return RequestListResponse(
-            id=request.id,
-            text=request.text,
-            status=request.status,
-            created_at=request.created_at,
-            updated_at=request.updated_at,
-            owner_email=request.owner.email,
-            staff_member_email=request.staff_member.email if request.staff_member else None
-        )
\ No newline at end of file
+    async def _list_requests(
+            query: QuerySet,
+            scope: str,
+            pagination: RequestPaginationParams,
+            filters: Optional[RequestFilters]
+    ) -> PaginatedResponse:
+        cache_key = (scope, RequestService._normalize_filters(filters))
+        # COUNT(*) OVER() only sees the whole result set on offset pages; behind a
+        # cursor it would count the remaining rows, so those use the exact count.
+        with_window_total = (
+            pagination.include_total and pagination.total_mode == TotalMode.WINDOW and not pagination.cursor
+        )
+
+        page = await RequestService._fetch_list_page(query, pagination, with_window_total)
+        items, next_cursor, prev_cursor, total = page
+        estimated = False
+        if total is not None:
+            if RequestService.total_cache is not None:
+                RequestService.total_cache.set(cache_key, total, ttl=settings.request_total_cache_ttl_seconds)
+        elif pagination.include_total:
+            total, estimated = await RequestService._count_total(query, cache_key, pagination.total_mode)
+
+        return PaginatedResponse(
+            items=items,
+            total=total,
+            page=pagination.page,
+            size=pagination.size,
+            pages=(total + pagination.size - 1) // pagination.size if total is not None else None,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            total_estimated=estimated
+        )
+
+    @staticmethod
+    async def _count_total(query: QuerySet, cache_key: Tuple[str, Hashable], mode: TotalMode) -> Tuple[int, bool]:
+        # The planner's row estimate is only meaningful for the unfiltered table.
+        if mode == TotalMode.ESTIMATE and cache_key == ("all", ()):
+            estimate = await RequestService._estimate_request_count()
+            if estimate is not None:
+                return estimate, True
+
+        cache = RequestService.total_cache
+        total = cache.get(cache_key) if cache is not None else None
+        if total is None:
+            total = await query.count()
+            if cache is not None:
+                cache.set(cache_key, total, ttl=settings.request_total_cache_ttl_seconds)
+        return total, False
+
+    @staticmethod
+    async def _estimate_request_count() -> Optional[int]:
+        connection = Request._meta.db
+        if connection.capabilities.dialect != "postgres":
+            return None
+
+        rows = await connection.execute_query_dict(
+            "SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = to_regclass($1)",
+            [Request._meta.db_table]
+        )
+        # reltuples is -1 until the table has been vacuumed or analyzed once.
+        if not rows or rows[0]["estimate"] < 0:
+            return None
+        return rows[0]["estimate"]
+
+    @staticmethod
+    def _normalize_filters(filters: Optional[RequestFilters]) -> Hashable:
+        if filters is None:
+            return ()
+        return tuple(sorted(filters.model_dump(exclude_none=True).items()))
+
+    @staticmethod
+    def _build_page_query(
+            query: QuerySet,
+            pagination: RequestPaginationParams,
+            with_window_total: bool = False
+    ) -> Tuple[ValuesQuery, bool]:
+        # Keyset pagination on (created_at, id) DESC. A cursor seeks past the row it
+        # was taken from instead of skipping `offset` rows; "prev" cursors walk
+        # the same order backwards and the page is flipped back afterwards. The
+        # plain created_at bound is what lets the planner start the index scan at
+        # the cursor, since it cannot derive one from the OR.
+        backwards = False
+        if pagination.cursor:
+            created_at, last_id, backwards = RequestService._decode_list_cursor(pagination.cursor)
+            if backwards:
+                query = query.filter(
+                    Q(created_at__gte=created_at),
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=last_id)
+                ).order_by("created_at", "id")
+            else:
+                query = query.filter(
+                    Q(created_at__lte=created_at),
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id)
+                )
+        else:
+            query = query.offset((pagination.page - 1) * pagination.size)
+
+        fields = RequestService.LIST_FIELDS
+        if with_window_total:
+            query = query.annotate(total_count=RawSQL("COUNT(*) OVER()"))
+            fields += ("total_count",)
+
+        return query.limit(pagination.size + 1).values(*fields), backwards
+
+    @staticmethod
+    async def _fetch_list_page(
+            query: QuerySet,
+            pagination: RequestPaginationParams,
+            with_window_total: bool = False
+    ) -> Tuple[List[RequestListResponse], Optional[str], Optional[str], Optional[int]]:
+        page_query, backwards = RequestService._build_page_query(query, pagination, with_window_total)
+        rows = await page_query
+        total = rows[0]["total_count"] if with_window_total and rows else None
+        has_more = len(rows) > pagination.size
+        rows = rows[:pagination.size]
+        if backwards:
+            rows.reverse()
+
+        if not rows:
+            return [], None, None, total
+
+        if backwards:
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, bool(pagination.cursor) or pagination.page > 1
+
+        next_cursor = RequestService._encode_list_cursor(rows[-1], backwards=False) if has_next else None
+        prev_cursor = RequestService._encode_list_cursor(rows[0], backwards=True) if has_prev else None
+        return RequestService._build_list_responses(rows), next_cursor, prev_cursor, total
+
+    @staticmethod
+    def _encode_list_cursor(row: dict, backwards: bool) -> str:
+        return encode_cursor({"t": row["created_at"], "id": row["id"], "prev": backwards})
+
+    @staticmethod
+    def _decode_list_cursor(cursor: str) -> Tuple[datetime, int, bool]:
+        values = decode_cursor(cursor)
+        created_at, last_id = values.get("t"), values.get("id")
+        if not isinstance(created_at, datetime) or not isinstance(last_id, int):
+            raise InvalidCursorException()
+        return created_at, last_id, bool(values.get("prev"))
+
+    @staticmethod
+    def _build_list_responses(rows: List[dict]) -> List[RequestListResponse]:
+        return [
+            RequestListResponse(
+                id=row["id"],
+                text=row["text"],
+                status=row["status"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+                owner_email=row["owner__email"],
+                staff_member_email=row["staff_member__email"]
+            )
+            for row in rows
+        ]
\ No newline at end of file
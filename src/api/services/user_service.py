@@ -1,3 +1,4 @@
+import logging
 from typing import Optional, Union, Dict
 from fastapi import HTTPException, status
 from tortoise.exceptions import IntegrityError
@@ -5,6 +6,9 @@ from tortoise.exceptions import IntegrityError
 from src.api.auth.password_manager import PasswordManager
 from src.middleware.permissions import RolePermissions
 from src.api.auth.jwt_handler import JWTHandler
+from src.core.config import settings
+from src.core.login_guard import login_guard
+from src.core.token_revocation import token_revocation_list
 from src.models.models import User
 from src.enums import UserRole
 from src.api.schemas.schemas import (
@@ -12,6 +16,9 @@ from src.api.schemas.schemas import (
     UserLogin, UserResponse, AdminResponse, StaffResponse,
     TokenResponse, UserProfileUpdate, PasswordChange
 )
+from src.utils.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
 
 
 class UserService:
@@ -26,7 +33,7 @@ class UserService:
             )
 
         try:
-            hashed_password = PasswordManager.hash_password(data.password)
+            hashed_password = await PasswordManager.hash_password_async(data.password)
             birth_date = data.birth_date if data.birth_date else None
 
             user = await User.create(
@@ -41,6 +48,7 @@ class UserService:
                 father_name=data.father_name
             )
 
+            login_guard.forget_unknown_email(data.email)
             return UserResponse.model_validate(user)
 
         except IntegrityError:
@@ -59,7 +67,7 @@ class UserService:
             )
 
         try:
-            hashed_password = PasswordManager.hash_password(data.password)
+            hashed_password = await PasswordManager.hash_password_async(data.password)
 
             admin = await User.create(
                 email=data.email,
@@ -67,6 +75,7 @@ class UserService:
                 role=UserRole.ADMIN
             )
 
+            login_guard.forget_unknown_email(data.email)
             return AdminResponse.model_validate(admin)
 
         except IntegrityError:
@@ -85,7 +94,7 @@ class UserService:
             )
 
         try:
-            hashed_password = PasswordManager.hash_password(data.password)
+            hashed_password = await PasswordManager.hash_password_async(data.password)
 
             staff = await User.create(
                 email=data.email,
@@ -93,6 +102,7 @@ class UserService:
                 role=UserRole.STAFF
             )
 
+            login_guard.forget_unknown_email(data.email)
             return StaffResponse.model_validate(staff)
 
         except IntegrityError:
@@ -103,13 +113,31 @@ class UserService:
 
     @staticmethod
     async def authenticate_user(data: UserLogin, ip_address: Optional[str] = None) -> TokenResponse:
+        # Locked-out and recently unknown emails are rejected before any DB or bcrypt work.
+        login_guard.check(data.email, ip_address)
+        invalid_credentials = HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password"
+        )
+
+        if login_guard.is_unknown_email(data.email):
+            await login_guard.record_failure(data.email, ip_address)
+            raise invalid_credentials
+
         user = await User.filter(email=data.email).first()
+        if not user:
+            login_guard.remember_unknown_email(data.email)
+            await login_guard.record_failure(data.email, ip_address)
+            raise invalid_credentials
 
-        if not user or not PasswordManager.verify_password(data.password, user.password_hash):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
-            )
+        if not await PasswordManager.verify_password_async(data.password, user.password_hash):
+            await login_guard.record_failure(data.email, ip_address)
+            raise invalid_credentials
+
+        await login_guard.record_success(data.email)
+
+        if PasswordManager.needs_rehash(user.password_hash):
+            await UserService._rehash_password(user, data.password)
 
         permissions = RolePermissions.get_role_permissions(user.role)
 
@@ -117,7 +145,8 @@ class UserService:
             user.id,
             user.email,
             user.role,
-            permissions
+            permissions,
+            RolePermissions.get_token_claims(user.role)
         )
 
         return TokenResponse(
@@ -129,6 +158,19 @@ class UserService:
             permissions=permissions
         )
 
+    @staticmethod
+    async def _rehash_password(user: User, password: str) -> None:
+        # Best effort: a busy hash pool must not turn a valid login into a 503, and
+        # the conditional update leaves a concurrent password change untouched.
+        try:
+            new_hash = await PasswordManager.hash_password_async(password)
+        except ServiceUnavailableException:
+            return
+
+        updated = await User.filter(id=user.id, password_hash=user.password_hash).update(password_hash=new_hash)
+        if updated:
+            logger.info(f"Rehashed password for user {user.id} with {settings.bcrypt_rounds} rounds")
+
     @staticmethod
     async def get_user_profile(user_id: int) -> Union[UserResponse, AdminResponse, StaffResponse]:
         user = await User.filter(id=user_id).first()
@@ -170,7 +212,7 @@ class UserService:
                 detail="User not found"
             )
 
-        if not PasswordManager.verify_password(data.current_password, user.password_hash):
+        if not await PasswordManager.verify_password_async(data.current_password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Current password is incorrect"
@@ -189,11 +231,29 @@ class UserService:
                 detail="New password must be different from current password"
             )
 
-        new_password_hash = PasswordManager.hash_password(data.new_password)
+        new_password_hash = await PasswordManager.hash_password_async(data.new_password)
         await User.filter(id=user_id).update(password_hash=new_password_hash)
+        await token_revocation_list.revoke_user(user_id)
 
         return {"message": "Password changed successfully"}
 
+    @staticmethod
+    async def logout(current_user: Dict, refresh_token: Optional[str] = None) -> Dict[str, str]:
+        if current_user.get("jti"):
+            await token_revocation_list.revoke_token(current_user["jti"], current_user["exp"])
+
+        if refresh_token:
+            refresh_payload = JWTHandler.verify_refresh_token(refresh_token)
+            if refresh_payload.get("user_id") != current_user["user_id"]:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Refresh token belongs to another user"
+                )
+            if refresh_payload.get("jti"):
+                await token_revocation_list.revoke_token(refresh_payload["jti"], refresh_payload["exp"])
+
+        return {"message": "Logged out successfully"}
+
     @staticmethod
     async def verify_user_permissions(user_id: int) -> Dict:
         user = await User.filter(id=user_id).first()
@@ -0,0 +1,61 @@
+import logging
+import time
+from typing import Dict, Optional
+
+from src.enums import CircuitState
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+            logger.info(f"Circuit '{self.name}' half-open, allowing trial calls")
+        return self._state
+
+    def allow_request(self) -> bool:
+        return self.state != CircuitState.OPEN
+
+    def ensure_closed(self) -> None:
+        if not self.allow_request():
+            raise CircuitOpenError(f"Circuit '{self.name}' is open")
+
+    def record_success(self) -> None:
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed")
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+
+        if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            if self._state != CircuitState.OPEN:
+                logger.warning(
+                    f"Circuit '{self.name}' opened after {self._consecutive_failures} consecutive failures"
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+        }
@@ -12,8 +12,64 @@ class Settings(BaseSettings):
     secret_key: str = os.getenv("SECRET_KEY")
     algorithm: str = os.getenv("ALGORITHM")
     access_token_expire_minutes: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+    refresh_token_expire_days: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+    jwt_cache_max_size: int = int(os.getenv("JWT_CACHE_MAX_SIZE", "10000"))
+    token_blacklist_enabled: bool = os.getenv("TOKEN_BLACKLIST_ENABLED", "True").lower() == "true"
+    token_revocation_bloom_capacity: int = int(os.getenv("TOKEN_REVOCATION_BLOOM_CAPACITY", "100000"))
+    token_revocation_bloom_error_rate: float = float(os.getenv("TOKEN_REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+    token_revocation_sync_interval_seconds: float = float(os.getenv("TOKEN_REVOCATION_SYNC_INTERVAL_SECONDS", "2.0"))
+    login_max_attempts_per_ip: int = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_IP", "100"))
+    login_unknown_email_ttl_seconds: float = float(os.getenv("LOGIN_UNKNOWN_EMAIL_TTL_SECONDS", "30"))
+    login_guard_shared: bool = os.getenv("LOGIN_GUARD_SHARED", "False").lower() == "true"
+    login_guard_sync_interval_seconds: float = float(os.getenv("LOGIN_GUARD_SYNC_INTERVAL_SECONDS", "2.0"))
+    bcrypt_rounds: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    password_hash_max_pending: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+    pagination_max_size: int = int(os.getenv("PAGINATION_MAX_SIZE", "200"))
+    request_total_cache_ttl_seconds: float = float(os.getenv("REQUEST_TOTAL_CACHE_TTL_SECONDS", "5.0"))
+    request_total_cache_max_size: int = int(os.getenv("REQUEST_TOTAL_CACHE_MAX_SIZE", "1000"))
+    bulk_request_max_ids: int = int(os.getenv("BULK_REQUEST_MAX_IDS", "500"))
     debug: bool = os.getenv("DEBUG", "False").lower() == "true"
 
+    log_queue_max_size: int = int(os.getenv("LOG_QUEUE_MAX_SIZE", "10000"))
+    log_batch_size: int = int(os.getenv("LOG_BATCH_SIZE", "500"))
+    log_flush_interval_seconds: float = float(os.getenv("LOG_FLUSH_INTERVAL_SECONDS", "1.0"))
+    log_overflow_policy: str = os.getenv("LOG_OVERFLOW_POLICY", "drop_oldest")
+    log_shutdown_timeout_seconds: float = float(os.getenv("LOG_SHUTDOWN_TIMEOUT_SECONDS", "10.0"))
+
+    log_retention_days_app_logs: int = int(os.getenv("LOG_RETENTION_DAYS_APP_LOGS", "0"))
+    log_retention_days_request_actions: int = int(os.getenv("LOG_RETENTION_DAYS_REQUEST_ACTIONS", "0"))
+    log_app_logs_timeseries: bool = os.getenv("LOG_APP_LOGS_TIMESERIES", "False").lower() == "true"
+    log_timeseries_meta_field: str = os.getenv("LOG_TIMESERIES_META_FIELD", "route")
+    log_timeseries_granularity: str = os.getenv("LOG_TIMESERIES_GRANULARITY", "seconds")
+    log_count_cap: int = int(os.getenv("LOG_COUNT_CAP", "10000"))
+    log_export_batch_size: int = int(os.getenv("LOG_EXPORT_BATCH_SIZE", "2000"))
+
+    log_rollup_flush_interval_seconds: float = float(os.getenv("LOG_ROLLUP_FLUSH_INTERVAL_SECONDS", "10.0"))
+    log_rollup_downsample_after_hours: int = int(os.getenv("LOG_ROLLUP_DOWNSAMPLE_AFTER_HOURS", "48"))
+    log_rollup_downsample_interval_seconds: float = float(os.getenv("LOG_ROLLUP_DOWNSAMPLE_INTERVAL_SECONDS", "600.0"))
+    log_rollup_retention_days: int = int(os.getenv("LOG_ROLLUP_RETENTION_DAYS", "365"))
+
+    log_sample_default_rate: float = float(os.getenv("LOG_SAMPLE_DEFAULT_RATE", "1.0"))
+    log_sample_route_rates: str = os.getenv("LOG_SAMPLE_ROUTE_RATES", "")
+    log_sample_status_rates: str = os.getenv("LOG_SAMPLE_STATUS_RATES", "")
+    log_sample_slow_threshold_ms: float = float(os.getenv("LOG_SAMPLE_SLOW_THRESHOLD_MS", "1000"))
+    log_sample_excluded_routes: str = os.getenv("LOG_SAMPLE_EXCLUDED_ROUTES", "/health/live,/health/ready,/metrics")
+
+    log_spool_enabled: bool = os.getenv("LOG_SPOOL_ENABLED", "True").lower() == "true"
+    log_spool_dir: str = os.getenv("LOG_SPOOL_DIR", "/tmp/support_system/log_spool")
+    log_spool_segment_max_bytes: int = int(os.getenv("LOG_SPOOL_SEGMENT_MAX_BYTES", str(16 * 1024 * 1024)))
+    log_spool_max_bytes: int = int(os.getenv("LOG_SPOOL_MAX_BYTES", str(1024 * 1024 * 1024)))
+    log_spool_fsync: bool = os.getenv("LOG_SPOOL_FSYNC", "False").lower() == "true"
+    log_spool_replay_interval_seconds: float = float(os.getenv("LOG_SPOOL_REPLAY_INTERVAL_SECONDS", "5.0"))
+
+    health_check_interval_seconds: float = float(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "5.0"))
+    health_check_timeout_seconds: float = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "2.0"))
+    mongo_circuit_failure_threshold: int = int(os.getenv("MONGO_CIRCUIT_FAILURE_THRESHOLD", "3"))
+    mongo_circuit_reset_seconds: float = float(os.getenv("MONGO_CIRCUIT_RESET_SECONDS", "30.0"))
+
+    metrics_sample_interval_seconds: float = float(os.getenv("METRICS_SAMPLE_INTERVAL_SECONDS", "1.0"))
+
     initial_admin_email: str = os.getenv("INITIAL_ADMIN_EMAIL")
     initial_admin_password: str = os.getenv("INITIAL_ADMIN_PASSWORD")
     initial_staff_email: str = os.getenv("INITIAL_STAFF_EMAIL")
@@ -1,19 +1,37 @@
 import logging
+import os
+from datetime import datetime, timedelta
 
 from tortoise import Tortoise, connections
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional
+from typing import AsyncIterator, Optional, List, Set, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import DuplicateKeyError
 
 from src.core.config import settings, tortoise_config
+from src.core.circuit_breaker import CircuitBreaker
+from src.core.mongo_indexes import MongoIndexManager, declared_log_indexes
+from src.utils.cursors import encode_cursor, decode_cursor
+from src.utils.exceptions import InvalidCursorException
 
 logger = logging.getLogger(__name__)
 
+MAINTENANCE_LEASES_COLLECTION = "maintenance_leases"
+
 
 class DatabaseManager:
     def __init__(self):
         self._mongo_client: Optional[AsyncIOMotorClient] = None
         self._mongo_db = None
+        self._index_manager: Optional[MongoIndexManager] = None
+        self.app_logs_timeseries = False
         self._postgres_initialized = False
+        self.mongo_breaker = CircuitBreaker(
+            "mongodb",
+            failure_threshold=settings.mongo_circuit_failure_threshold,
+            reset_timeout=settings.mongo_circuit_reset_seconds
+        )
 
     async def init_postgres(self):
         if not self._postgres_initialized:
@@ -34,8 +52,82 @@ class DatabaseManager:
             self._mongo_db = self._mongo_client[settings.mongodb_database]
             await self._mongo_db.command("ping")
             logger.info("MongoDB initialized successfully")
+            await self._init_app_logs_collection()
+            await self._init_mongo_indexes()
+
+    def app_logs_timeseries_options(self) -> dict:
+        # The meta field defaults to the route template: it is low-cardinality and keeps
+        # the document shape unchanged, so every app_logs query works in both modes.
+        options = {
+            "timeseries": {
+                "timeField": "timestamp",
+                "metaField": settings.log_timeseries_meta_field,
+                "granularity": settings.log_timeseries_granularity,
+            }
+        }
+        if settings.log_retention_days_app_logs > 0:
+            options["expireAfterSeconds"] = settings.log_retention_days_app_logs * 86400
+        return options
+
+    def enforces_unique_id(self, collection: str) -> bool:
+        # Time-series collections have no unique _id index, so re-inserting a
+        # document that already landed creates a duplicate instead of failing.
+        return not (collection == "app_logs" and self.app_logs_timeseries)
+
+    async def get_collection_info(self, name: str) -> Optional[dict]:
+        result = await self._mongo_db.command({"listCollections": 1, "filter": {"name": name}})
+        batch = result["cursor"]["firstBatch"]
+        return batch[0] if batch else None
+
+    async def _init_app_logs_collection(self):
+        if not settings.log_app_logs_timeseries:
+            return
+
+        try:
+            info = await self.get_collection_info("app_logs")
+            options = self.app_logs_timeseries_options()
+
+            if info is None:
+                await self._mongo_db.create_collection("app_logs", **options)
+                self.app_logs_timeseries = True
+                logger.info(f"Created time-series collection app_logs: {options}")
+            elif info.get("type") == "timeseries":
+                self.app_logs_timeseries = True
+                expire_after = options.get("expireAfterSeconds")
+                if info["options"].get("expireAfterSeconds") != expire_after:
+                    await self._mongo_db.command({"collMod": "app_logs", "expireAfterSeconds": expire_after or "off"})
+                    logger.info(f"Changed app_logs expireAfterSeconds to {expire_after}")
+            else:
+                logger.warning(
+                    "LOG_APP_LOGS_TIMESERIES is enabled but app_logs is a plain collection; "
+                    "run `python -m src.tools.migrate_app_logs_timeseries` to convert it"
+                )
+        except Exception as e:
+            logger.error(f"Failed to prepare time-series app_logs collection: {e}")
+
+    async def _init_mongo_indexes(self):
+        retention_days = {
+            "app_logs": settings.log_retention_days_app_logs,
+            "request_actions": settings.log_retention_days_request_actions,
+            "app_logs_rollup_hour": settings.log_rollup_retention_days,
+        }
+        meta_field = settings.log_timeseries_meta_field if self.app_logs_timeseries else None
+        declared = declared_log_indexes(retention_days, app_logs_meta_field=meta_field)
+        self._index_manager = MongoIndexManager(self._mongo_db, declared)
+        try:
+            await self._index_manager.start()
+        except Exception as e:
+            logger.error(f"MongoDB index reconciliation could not start: {e}")
+
+    def get_index_report(self) -> dict:
+        if self._index_manager is None:
+            return {"building": False, "app_logs_timeseries": self.app_logs_timeseries, "collections": {}}
+        return {**self._index_manager.get_report(), "app_logs_timeseries": self.app_logs_timeseries}
 
     async def close_mongo(self):
+        if self._index_manager is not None:
+            await self._index_manager.stop()
+            self._index_manager = None
         if self._mongo_client:
             self._mongo_client.close()
             self._mongo_client = None
@@ -69,52 +161,239 @@ class DatabaseManager:
     async def log_to_mongo(self, collection: str, data: dict):
         if self._mongo_db is None:
             raise RuntimeError("MongoDB not initialized")
+        self.mongo_breaker.ensure_closed()
 
         try:
             result = await self._mongo_db[collection].insert_one(data)
+            self.mongo_breaker.record_success()
             logger.info(f"Successfully inserted into {collection}, ID: {result.inserted_id}")
         except Exception as e:
+            self.mongo_breaker.record_failure()
             logger.error(f"Failed to insert into {collection}: {e}")
             raise
 
-    async def get_mongo_logs(self, collection: str, filters: dict = None, page: int = 1, size: int = 50):
+    async def log_many_to_mongo(self, collection: str, documents: List[dict]) -> int:
         if self._mongo_db is None:
-            return {"items": [], "total": 0, "page": page, "size": size, "pages": 0}
+            raise RuntimeError("MongoDB not initialized")
+
+        if not documents:
+            return 0
+        self.mongo_breaker.ensure_closed()
 
         try:
-            query = filters or {}
-            skip = (page - 1) * size
+            result = await self._mongo_db[collection].insert_many(documents, ordered=False)
+            self.mongo_breaker.record_success()
+            logger.debug(f"Inserted {len(result.inserted_ids)} documents into {collection}")
+            return len(result.inserted_ids)
+        except Exception as e:
+            self.mongo_breaker.record_failure()
+            logger.error(f"Failed to bulk insert into {collection}: {e}")
+            raise
+
+    @staticmethod
+    async def find_existing_ids(coll, documents: List[dict]) -> Set[ObjectId]:
+        # For collections without a unique _id (time-series app_logs), where a re-insert
+        # would duplicate instead of failing. They have no _id index either; bounding the
+        # lookup by the documents' timestamps lets MongoDB skip every bucket outside them.
+        timestamps = [doc["timestamp"] for doc in documents if isinstance(doc.get("timestamp"), datetime)]
+        ids = [doc["_id"] for doc in documents if "_id" in doc]
+        if not timestamps or not ids:
+            return set()
+
+        return set(await coll.distinct("_id", {
+            "_id": {"$in": ids},
+            "timestamp": {"$gte": min(timestamps), "$lte": max(timestamps)}
+        }))
 
-            cursor = self._mongo_db[collection].find(query).sort("timestamp", -1).skip(skip).limit(size)
+    async def get_mongo_logs(
+            self,
+            collection: str,
+            filters: dict = None,
+            page: int = 1,
+            size: int = 50,
+            cursor: Optional[str] = None,
+            include_total: bool = True,
+            projection: Optional[dict] = None
+    ):
+        empty_result = {
+            "items": [], "total": 0, "page": page, "size": size, "pages": 0,
+            "next_cursor": None, "total_capped": False
+        }
+        if self._mongo_db is None or not self.mongo_breaker.allow_request():
+            return empty_result
 
-            logs = []
-            async for doc in cursor:
+        query = dict(filters or {})
+        if cursor:
+            query = {"$and": [query, self._keyset_condition(cursor)]} if query else self._keyset_condition(cursor)
+
+        try:
+            find = self._mongo_db[collection].find(query, projection).sort([("timestamp", -1), ("_id", -1)])
+            if not cursor:
+                find = find.skip((page - 1) * size)
+
+            docs = await find.limit(size + 1).to_list(length=size + 1)
+            has_more = len(docs) > size
+            docs = docs[:size]
+
+            next_cursor = None
+            if has_more:
+                last = docs[-1]
+                next_cursor = encode_cursor({"t": last["timestamp"], "id": str(last["_id"])})
+
+            for doc in docs:
                 doc['_id'] = str(doc['_id'])
-                logs.append(doc)
 
-            total = await self._mongo_db[collection].count_documents(query)
+            total, total_capped = None, False
+            if include_total:
+                total, total_capped = await self._count_for_listing(collection, filters or {})
+            self.mongo_breaker.record_success()
 
             return {
-                "items": logs,
+                "items": docs,
                 "total": total,
                 "page": page,
                 "size": size,
-                "pages": (total + size - 1) // size
+                "pages": (total + size - 1) // size if total is not None else None,
+                "next_cursor": next_cursor,
+                "total_capped": total_capped
             }
         except Exception as e:
+            self.mongo_breaker.record_failure()
             logger.error(f"Error getting logs from {collection}: {e}")
-            return {"items": [], "total": 0, "page": page, "size": size, "pages": 0}
+            return empty_result
+
+    @staticmethod
+    def _keyset_condition(cursor: str) -> dict:
+        values = decode_cursor(cursor)
+        try:
+            timestamp, last_id = values["t"], ObjectId(values["id"])
+        except (KeyError, TypeError, InvalidId) as e:
+            raise InvalidCursorException() from e
+
+        return {"$or": [
+            {"timestamp": {"$lt": timestamp}},
+            {"timestamp": timestamp, "_id": {"$lt": last_id}}
+        ]}
+
+    async def _count_for_listing(self, collection: str, query: dict) -> Tuple[int, bool]:
+        if not query:
+            return await self._mongo_db[collection].estimated_document_count(), False
+
+        cap = settings.log_count_cap
+        total = await self._mongo_db[collection].count_documents(query, limit=cap)
+        return total, total >= cap
 
     async def count_mongo_logs(self, collection: str, filters: dict = None):
-        if self._mongo_db is None:
+        if self._mongo_db is None or not self.mongo_breaker.allow_request():
             return 0
 
         try:
             query = filters or {}
-            return await self._mongo_db[collection].count_documents(query)
+            total = await self._mongo_db[collection].count_documents(query)
+            self.mongo_breaker.record_success()
+            return total
         except Exception as e:
+            self.mongo_breaker.record_failure()
             logger.error(f"Error counting logs in {collection}: {e}")
             return 0
 
+    async def aggregate_mongo_logs(self, collection: str, pipeline: List[dict]) -> List[dict]:
+        if self._mongo_db is None or not self.mongo_breaker.allow_request():
+            return []
+
+        try:
+            results = await self._mongo_db[collection].aggregate(pipeline).to_list(length=None)
+            self.mongo_breaker.record_success()
+            return results
+        except Exception as e:
+            self.mongo_breaker.record_failure()
+            logger.error(f"Error aggregating logs in {collection}: {e}")
+            return []
+
+    async def stream_mongo_logs(
+            self,
+            collection: str,
+            filters: dict,
+            projection: Optional[dict] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[dict]:
+        if self._mongo_db is None:
+            raise RuntimeError("MongoDB not initialized")
+        self.mongo_breaker.ensure_closed()
+
+        # Ascending (timestamp, _id) walks the descending keyset indexes backwards,
+        # and the cursor only fetches the next batch once the previous one is consumed.
+        cursor = self._mongo_db[collection].find(filters, projection) \
+            .sort([("timestamp", 1), ("_id", 1)]) \
+            .batch_size(batch_size)
+        try:
+            async for document in cursor:
+                yield document
+            self.mongo_breaker.record_success()
+        except Exception as e:
+            self.mongo_breaker.record_failure()
+            logger.error(f"Error streaming logs from {collection}: {e}")
+            raise
+        finally:
+            await cursor.close()
+
+    async def bulk_write_mongo(self, collection: str, operations: list) -> None:
+        if self._mongo_db is None:
+            raise RuntimeError("MongoDB not initialized")
+
+        if not operations:
+            return
+        self.mongo_breaker.ensure_closed()
+
+        try:
+            await self._mongo_db[collection].bulk_write(operations, ordered=False)
+            self.mongo_breaker.record_success()
+        except Exception as e:
+            self.mongo_breaker.record_failure()
+            logger.error(f"Failed bulk write into {collection}: {e}")
+            raise
+
+    async def execute_mongo_pipeline(self, collection: str, pipeline: List[dict]) -> None:
+        if self._mongo_db is None:
+            raise RuntimeError("MongoDB not initialized")
+        self.mongo_breaker.ensure_closed()
+
+        try:
+            await self._mongo_db[collection].aggregate(pipeline).to_list(length=None)
+            self.mongo_breaker.record_success()
+        except Exception as e:
+            self.mongo_breaker.record_failure()
+            logger.error(f"Error running pipeline on {collection}: {e}")
+            raise
+
+    async def delete_mongo_logs(self, collection: str, query: dict) -> int:
+        if self._mongo_db is None:
+            raise RuntimeError("MongoDB not initialized")
+        self.mongo_breaker.ensure_closed()
+
+        try:
+            result = await self._mongo_db[collection].delete_many(query)
+            self.mongo_breaker.record_success()
+            return result.deleted_count
+        except Exception as e:
+            self.mongo_breaker.record_failure()
+            logger.error(f"Error deleting logs in {collection}: {e}")
+            raise
+
+    async def acquire_mongo_lease(self, name: str, ttl_seconds: float) -> bool:
+        if self._mongo_db is None or not self.mongo_breaker.allow_request():
+            return False
+
+        now = datetime.utcnow()
+        try:
+            await self._mongo_db[MAINTENANCE_LEASES_COLLECTION].update_one(
+                {"_id": name, "expires_at": {"$lt": now}},
+                {"$set": {"expires_at": now + timedelta(seconds=ttl_seconds), "owner": os.getpid()}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
 
 db_manager = DatabaseManager()
\ No newline at end of file
@@ -1,5 +1,10 @@
 from src.core.database import db_manager, DatabaseManager
+from src.core.health import health_monitor, HealthMonitor
 
 
 async def get_database_manager() -> DatabaseManager:
-    return db_manager
\ No newline at end of file
+    return db_manager
+
+
+async def get_health_monitor() -> HealthMonitor:
+    return health_monitor
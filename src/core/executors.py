@@ -0,0 +1,82 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.core.config import settings
+from src.core.metrics import EXECUTOR_QUEUE_WAIT, EXECUTOR_REJECTED
+from src.utils.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedExecutor:
+    # Runs blocking calls on a fixed thread pool so they never stall the event loop.
+    # At most `max_workers` calls run at once; beyond `max_pending` in-flight calls
+    # new work is rejected with a 503 instead of queueing without bound.
+
+    def __init__(self, name: str, max_workers: int, max_pending: int):
+        self.name = name
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+
+        self._counters: Dict[str, int] = {"completed": 0, "rejected": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def get_stats(self) -> Dict[str, Any]:
+        completed = self._counters["completed"]
+        return {
+            **self._counters,
+            "pending": self._pending,
+            "max_workers": self._max_workers,
+            "max_pending": self._max_pending,
+            "avg_queue_wait_ms": round(self._wait_total / completed * 1000, 3) if completed else None,
+            "max_queue_wait_ms": round(self._wait_max * 1000, 3),
+        }
+
+    async def run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self._max_pending:
+            self._counters["rejected"] += 1
+            EXECUTOR_REJECTED.labels(self.name, operation).inc()
+            raise ServiceUnavailableException("Server is busy, please retry shortly")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=self.name)
+
+        def call() -> Any:
+            return time.perf_counter(), func(*args)
+
+        submitted_at = time.perf_counter()
+        self._pending += 1
+        try:
+            started_at, result = await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        finally:
+            self._pending -= 1
+
+        waited = started_at - submitted_at
+        EXECUTOR_QUEUE_WAIT.labels(self.name, operation).observe(waited)
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        self._counters["completed"] += 1
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info(f"Executor {self.name} stopped: {self.get_stats()}")
+
+
+password_executor = BoundedExecutor(
+    "password-hash",
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending
+)
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.core.config import settings
+from src.core.database import db_manager, DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentHealth:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.healthy: Optional[bool] = None
+        self.latency_ms: Optional[float] = None
+        self.checked_at: Optional[datetime] = None
+        self.consecutive_failures = 0
+
+    def update(self, healthy: bool, latency_ms: float) -> None:
+        self.healthy = healthy
+        self.latency_ms = round(latency_ms, 3)
+        self.checked_at = datetime.utcnow()
+        self.consecutive_failures = 0 if healthy else self.consecutive_failures + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "latency_ms": self.latency_ms,
+            "checked_at": self.checked_at,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+class HealthMonitor:
+
+    def __init__(self, database: DatabaseManager, interval: float = 5.0, probe_timeout: float = 2.0):
+        self._database = database
+        self._interval = interval
+        self._probe_timeout = probe_timeout
+        self._task: Optional[asyncio.Task] = None
+
+        self.postgres = ComponentHealth("postgresql")
+        self.mongo = ComponentHealth("mongodb")
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self.probe_all()
+        self._task = asyncio.create_task(self._run(), name="health-monitor")
+        logger.info(f"Health monitor started (interval={self._interval}s)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Health monitor stopped")
+
+    async def probe_all(self) -> None:
+        await asyncio.gather(
+            self._probe(self.postgres, self._database.is_postgres_healthy),
+            self._probe(self.mongo, self._database.is_mongo_healthy),
+        )
+
+        breaker = self._database.mongo_breaker
+        if self.mongo.healthy:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.error(f"Health probe cycle failed: {e}")
+
+    async def _probe(self, component: ComponentHealth, check: Callable[[], Awaitable[bool]]) -> None:
+        started = time.perf_counter()
+        try:
+            healthy = await asyncio.wait_for(check(), timeout=self._probe_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"{component.name} health probe timed out after {self._probe_timeout}s")
+            healthy = False
+        component.update(healthy, (time.perf_counter() - started) * 1000)
+
+    def is_ready(self) -> bool:
+        return bool(self.postgres.healthy)
+
+    def get_status(self) -> Dict[str, Any]:
+        postgres_healthy = bool(self.postgres.healthy)
+        mongo_healthy = bool(self.mongo.healthy)
+
+        if postgres_healthy and mongo_healthy:
+            overall = "healthy"
+        elif not postgres_healthy and not mongo_healthy:
+            overall = "unhealthy"
+        else:
+            overall = "degraded"
+
+        return {
+            "status": overall,
+            "components": {
+                "api": "operational",
+                "postgresql": "connected" if postgres_healthy else "error",
+                "mongodb": "connected" if mongo_healthy else "disconnected"
+            },
+            "checks": {
+                "postgresql": self.postgres.to_dict(),
+                "mongodb": {
+                    **self.mongo.to_dict(),
+                    "circuit": self._database.mongo_breaker.get_stats()
+                }
+            }
+        }
+
+
+health_monitor = HealthMonitor(
+    db_manager,
+    interval=settings.health_check_interval_seconds,
+    probe_timeout=settings.health_check_timeout_seconds
+)
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from src.core.config import settings
+from src.core.database import db_manager, DatabaseManager
+from src.core.log_spool import log_spool, LogSpool, DUPLICATE_KEY_ERROR
+from src.enums import LogOverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+LogItem = Tuple[str, dict]
+
+
+class LogPipeline:
+
+    def __init__(
+            self,
+            database: DatabaseManager,
+            max_size: int = 10000,
+            batch_size: int = 500,
+            flush_interval: float = 1.0,
+            overflow_policy: LogOverflowPolicy = LogOverflowPolicy.DROP_OLDEST,
+            spool: Optional[LogSpool] = None
+    ):
+        self._database = database
+        self._spool = spool
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow_policy = overflow_policy
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self._counters: Dict[str, int] = {
+            "enqueued": 0,
+            "flushed": 0,
+            "dropped": 0,
+            "failed": 0,
+            "spooled": 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self._flusher is not None and not self._flusher.done()
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            **self._counters,
+            "queue_depth": self.queue_depth(),
+            "queue_max_size": self._max_size,
+            "overflow_policy": self._overflow_policy.value,
+        }
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self._max_size)
+        self._stopping = False
+        self._flusher = asyncio.create_task(self._run(), name="log-pipeline-flusher")
+        logger.info(
+            f"Log pipeline started (max_size={self._max_size}, batch_size={self._batch_size}, "
+            f"flush_interval={self._flush_interval}s, overflow_policy={self._overflow_policy.value})"
+        )
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        if not self.is_running:
+            return
+
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._flusher, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Log pipeline drain timed out, {self.queue_depth()} entries left unflushed")
+            self._flusher.cancel()
+            self._counters["dropped"] += self.queue_depth()
+        finally:
+            self._flusher = None
+            logger.info(f"Log pipeline stopped: {self._counters}")
+
+    async def enqueue(self, collection: str, document: dict) -> bool:
+        if self._queue is None or self._stopping:
+            self._counters["dropped"] += 1
+            return False
+
+        item = (collection, document)
+
+        if self._overflow_policy == LogOverflowPolicy.BLOCK:
+            await self._queue.put(item)
+            self._counters["enqueued"] += 1
+            return True
+
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self._overflow_policy == LogOverflowPolicy.DROP_NEW:
+                self._counters["dropped"] += 1
+                return False
+
+            self._queue.get_nowait()
+            self._queue.put_nowait(item)
+            self._counters["dropped"] += 1
+
+        self._counters["enqueued"] += 1
+        return True
+
+    async def _run(self) -> None:
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _collect_batch(self) -> List[LogItem]:
+        batch: List[LogItem] = []
+        deadline = time.monotonic() + self._flush_interval
+
+        while len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            if self._stopping:
+                # Drain without waiting once shutdown has been requested.
+                if self._queue.empty():
+                    break
+                batch.append(self._queue.get_nowait())
+                continue
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _flush(self, batch: List[LogItem]) -> None:
+        by_collection: Dict[str, List[dict]] = defaultdict(list)
+        for collection, document in batch:
+            by_collection[collection].append(document)
+
+        for collection, documents in by_collection.items():
+            try:
+                inserted = await self._database.log_many_to_mongo(collection, documents)
+                self._counters["flushed"] += inserted
+            except BulkWriteError as e:
+                self._counters["flushed"] += e.details.get("nInserted", 0)
+                failed_indexes = sorted(
+                    error["index"] for error in e.details.get("writeErrors", [])
+                    if error.get("code") != DUPLICATE_KEY_ERROR
+                )
+                await self._spool_or_drop(collection, [documents[i] for i in failed_indexes], e)
+            except Exception as e:
+                await self._spool_or_drop(collection, documents, e)
+
+    async def _spool_or_drop(self, collection: str, documents: List[dict], error: Exception) -> None:
+        if not documents:
+            return
+
+        if self._spool is None:
+            self._counters["failed"] += len(documents)
+            logger.warning(f"Dropped {len(documents)} log entries for {collection}: {error}")
+            return
+
+        items = [(collection, document) for document in documents]
+        try:
+            spooled = await asyncio.to_thread(self._spool.append, items)
+        except Exception as e:
+            logger.error(f"Failed to spool log entries for {collection}: {e}")
+            spooled = 0
+
+        self._counters["spooled"] += spooled
+        self._counters["failed"] += len(documents) - spooled
+        logger.debug(f"Spooled {spooled} log entries for {collection}: {error}")
+
+
+log_pipeline = LogPipeline(
+    db_manager,
+    max_size=settings.log_queue_max_size,
+    batch_size=settings.log_batch_size,
+    flush_interval=settings.log_flush_interval_seconds,
+    overflow_policy=LogOverflowPolicy(settings.log_overflow_policy),
+    spool=log_spool if settings.log_spool_enabled else None
+)
@@ -0,0 +1,255 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from src.core.config import settings
+from src.core.database import db_manager, DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_MINUTE_COLLECTION = "app_logs_rollup_minute"
+ROLLUP_HOUR_COLLECTION = "app_logs_rollup_hour"
+
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+LATENCY_BUCKET_KEYS = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["le_inf"]
+
+# $merge cannot match on null fields, so requests that matched no route share a placeholder.
+UNMATCHED_ROUTE = "<unmatched>"
+
+RollupKey = Tuple[datetime, str, str, int]
+
+
+def latency_bucket(latency_ms: float) -> str:
+    for bound, key in zip(LATENCY_BUCKETS_MS, LATENCY_BUCKET_KEYS):
+        if latency_ms <= bound:
+            return key
+    return "le_inf"
+
+
+class RollupCell:
+    __slots__ = ("count", "errors", "latency_sum_ms", "latency_max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.buckets: Dict[str, int] = defaultdict(int)
+
+    def add(self, latency_ms: float, is_error: bool) -> None:
+        self.count += 1
+        self.errors += is_error
+        self.latency_sum_ms += latency_ms
+        self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+        self.buckets[latency_bucket(latency_ms)] += 1
+
+    def merge(self, other: "RollupCell") -> None:
+        self.count += other.count
+        self.errors += other.errors
+        self.latency_sum_ms += other.latency_sum_ms
+        self.latency_max_ms = max(self.latency_max_ms, other.latency_max_ms)
+        for key, value in other.buckets.items():
+            self.buckets[key] += value
+
+
+class RequestRollups:
+    # Every request is counted here, before sampling, so rollups stay exact while
+    # raw app_logs may be sampled. Cells are keyed by (minute, route, method, status)
+    # and flushed as $inc upserts, so concurrent workers add into the same rows.
+
+    def __init__(
+            self,
+            database: DatabaseManager,
+            flush_interval: float = 10.0,
+            downsample_after_hours: int = 48,
+            downsample_interval: float = 600.0
+    ):
+        self._database = database
+        self._flush_interval = flush_interval
+        self._downsample_after = timedelta(hours=downsample_after_hours)
+        self._downsample_interval = downsample_interval
+
+        self._cells: Dict[RollupKey, RollupCell] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._downsampler: Optional[asyncio.Task] = None
+
+        self._counters: Dict[str, int] = {
+            "recorded": 0,
+            "rows_flushed": 0,
+            "flush_failures": 0,
+            "rows_downsampled": 0,
+        }
+
+    def get_stats(self) -> Dict[str, object]:
+        return {**self._counters, "pending_rows": len(self._cells)}
+
+    def record(self, route: Optional[str], method: str, status_code: int, process_time: float) -> None:
+        minute = datetime.utcnow().replace(second=0, microsecond=0)
+        key = (minute, route or UNMATCHED_ROUTE, method, status_code)
+
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = RollupCell()
+        cell.add(process_time * 1000, status_code >= 500)
+        self._counters["recorded"] += 1
+
+    async def start(self) -> None:
+        if self._flusher is not None:
+            return
+        self._flusher = asyncio.create_task(self._run_flusher(), name="log-rollup-flusher")
+        self._downsampler = asyncio.create_task(self._run_downsampler(), name="log-rollup-downsampler")
+
+    async def stop(self) -> None:
+        for task in (self._flusher, self._downsampler):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flusher = None
+        self._downsampler = None
+
+        await self.flush()
+        logger.info(f"Request rollups stopped: {self.get_stats()}")
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    async def _run_downsampler(self) -> None:
+        while True:
+            await asyncio.sleep(self._downsample_interval)
+            try:
+                await self.downsample()
+            except Exception as e:
+                logger.error(f"Rollup downsampling failed: {e}")
+
+    async def flush(self) -> int:
+        if not self._cells:
+            return 0
+
+        cells, self._cells = self._cells, {}
+        operations = [self._to_update(key, cell) for key, cell in cells.items()]
+
+        try:
+            await self._database.bulk_write_mongo(ROLLUP_MINUTE_COLLECTION, operations)
+        except Exception as e:
+            # Keep the counts for the next attempt; anything recorded meanwhile is merged in.
+            for key, cell in cells.items():
+                current = self._cells.get(key)
+                if current is None:
+                    self._cells[key] = cell
+                else:
+                    current.merge(cell)
+            self._counters["flush_failures"] += 1
+            logger.warning(f"Failed to flush {len(cells)} rollup rows: {e}")
+            return 0
+
+        self._counters["rows_flushed"] += len(operations)
+        return len(operations)
+
+    @staticmethod
+    def _to_update(key: RollupKey, cell: RollupCell) -> UpdateOne:
+        minute, route, method, status_code = key
+        increments: Dict[str, Any] = {
+            "count": cell.count,
+            "errors": cell.errors,
+            "latency_sum_ms": round(cell.latency_sum_ms, 3),
+        }
+        for bucket, value in cell.buckets.items():
+            increments[f"latency_buckets.{bucket}"] = value
+
+        return UpdateOne(
+            {"minute": minute, "route": route, "method": method, "status_code": status_code},
+            {"$inc": increments, "$max": {"latency_max_ms": round(cell.latency_max_ms, 3)}},
+            upsert=True
+        )
+
+    async def downsample(self) -> int:
+        # Only one worker folds minutes into hours per interval; the lease expires on
+        # its own so a crashed holder does not block the next run.
+        if not await self._database.acquire_mongo_lease("log-rollup-downsample", self._downsample_interval):
+            return 0
+
+        cutoff = (datetime.utcnow() - self._downsample_after).replace(minute=0, second=0, microsecond=0)
+        await self._database.execute_mongo_pipeline(
+            ROLLUP_MINUTE_COLLECTION, self._build_downsample_pipeline(cutoff)
+        )
+        removed = await self._database.delete_mongo_logs(ROLLUP_MINUTE_COLLECTION, {"minute": {"$lt": cutoff}})
+
+        self._counters["rows_downsampled"] += removed
+        if removed:
+            logger.info(f"Downsampled {removed} minute rollup rows older than {cutoff}")
+        return removed
+
+    @staticmethod
+    def _build_downsample_pipeline(cutoff: datetime) -> List[dict]:
+        group: Dict[str, Any] = {
+            "_id": {
+                "hour": {"$dateTrunc": {"date": "$minute", "unit": "hour"}},
+                "route": "$route",
+                "method": "$method",
+                "status_code": "$status_code",
+            },
+            "count": {"$sum": "$count"},
+            "errors": {"$sum": "$errors"},
+            "latency_sum_ms": {"$sum": "$latency_sum_ms"},
+            "latency_max_ms": {"$max": "$latency_max_ms"},
+            "minute_rows": {"$sum": 1},
+        }
+        project: Dict[str, Any] = {
+            "_id": 0,
+            "hour": "$_id.hour",
+            "route": "$_id.route",
+            "method": "$_id.method",
+            "status_code": "$_id.status_code",
+            "count": 1,
+            "errors": 1,
+            "latency_sum_ms": 1,
+            "latency_max_ms": 1,
+            "minute_rows": 1,
+        }
+        for key in LATENCY_BUCKET_KEYS:
+            group[key] = {"$sum": {"$ifNull": [f"$latency_buckets.{key}", 0]}}
+            project[f"latency_buckets.{key}"] = f"${key}"
+
+        # The cutoff is hour-aligned and far behind the flushers, so each run sees
+        # every minute row of the hours it folds and the hour row is recomputed, not
+        # added to. Re-running after a crash between the merge and the delete is
+        # therefore harmless. If the delete was cut short, fewer minute rows remain
+        # than the hour row was built from, and the existing row is kept.
+        keep_existing = {"$gt": [{"$ifNull": ["$minute_rows", 0]}, "$$new.minute_rows"]}
+        merge_set: Dict[str, Any] = {
+            field: {"$cond": [keep_existing, f"${field}", f"$$new.{field}"]}
+            for field in (
+                "count", "errors", "latency_sum_ms", "latency_max_ms", "minute_rows",
+                *(f"latency_buckets.{key}" for key in LATENCY_BUCKET_KEYS)
+            )
+        }
+
+        return [
+            {"$match": {"minute": {"$lt": cutoff}}},
+            {"$group": group},
+            {"$project": project},
+            {"$merge": {
+                "into": ROLLUP_HOUR_COLLECTION,
+                "on": ["hour", "route", "method", "status_code"],
+                "let": {"new": "$$ROOT"},
+                "whenMatched": [{"$set": merge_set}],
+                "whenNotMatched": "insert"
+            }}
+        ]
+
+
+request_rollups = RequestRollups(
+    db_manager,
+    flush_interval=settings.log_rollup_flush_interval_seconds,
+    downsample_after_hours=settings.log_rollup_downsample_after_hours,
+    downsample_interval=settings.log_rollup_downsample_interval_seconds
+)
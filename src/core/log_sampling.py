@@ -0,0 +1,72 @@
+import json
+import logging
+import random
+from typing import Dict, Iterable, Optional
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LogSamplingPolicy:
+    # Resolution order: excluded routes are never stored, 5xx and slow requests are
+    # always stored, then the per-route rate, the per-status-class rate ("2xx", "4xx")
+    # and finally the default rate apply. Stored documents carry 1 / rate as their
+    # sample weight so counts can be extrapolated.
+
+    def __init__(
+            self,
+            default_rate: float = 1.0,
+            route_rates: Optional[Dict[str, float]] = None,
+            status_rates: Optional[Dict[str, float]] = None,
+            slow_threshold_ms: Optional[float] = None,
+            excluded_routes: Optional[Iterable[str]] = None
+    ):
+        self._default_rate = default_rate
+        self._route_rates = route_rates or {}
+        self._status_rates = status_rates or {}
+        self._slow_threshold = slow_threshold_ms / 1000 if slow_threshold_ms else None
+        self._excluded_routes = frozenset(excluded_routes or ())
+
+    @classmethod
+    def from_settings(cls) -> "LogSamplingPolicy":
+        return cls(
+            default_rate=settings.log_sample_default_rate,
+            route_rates=cls._parse_rates(settings.log_sample_route_rates, "LOG_SAMPLE_ROUTE_RATES"),
+            status_rates=cls._parse_rates(settings.log_sample_status_rates, "LOG_SAMPLE_STATUS_RATES"),
+            slow_threshold_ms=settings.log_sample_slow_threshold_ms,
+            excluded_routes=[route.strip() for route in settings.log_sample_excluded_routes.split(",") if route.strip()]
+        )
+
+    def sample(self, route: Optional[str], status_code: int, process_time: float) -> Optional[float]:
+        if route in self._excluded_routes:
+            return None
+
+        if status_code >= 500:
+            return 1.0
+
+        if self._slow_threshold is not None and process_time >= self._slow_threshold:
+            return 1.0
+
+        rate = self._route_rates.get(route)
+        if rate is None:
+            rate = self._status_rates.get(f"{status_code // 100}xx", self._default_rate)
+
+        if rate >= 1.0:
+            return 1.0
+        if rate <= 0.0 or random.random() >= rate:
+            return None
+        return 1.0 / rate
+
+    @staticmethod
+    def _parse_rates(raw: str, name: str) -> Dict[str, float]:
+        if not raw:
+            return {}
+        try:
+            return {key: float(value) for key, value in json.loads(raw).items()}
+        except (ValueError, AttributeError) as e:
+            logger.error(f"Ignoring invalid {name}: {e}")
+            return {}
+
+
+log_sampling_policy = LogSamplingPolicy.from_settings()
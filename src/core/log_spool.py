@@ -0,0 +1,345 @@
+import asyncio
+import logging
+import os
+import struct
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import bson
+from pymongo.errors import BulkWriteError
+
+from src.core.config import settings
+from src.core.database import db_manager, DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+SpoolItem = Tuple[str, dict]
+
+DUPLICATE_KEY_ERROR = 11000
+# How long a scan of the spool directory is reused for the size cap.
+DIRECTORY_SCAN_TTL = 1.0
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class LogSpool:
+    # Segment lifecycle: "<pid>-<ns>.active" is being appended to by one worker,
+    # ".spool" is sealed and ready for replay, ".replaying-<pid>" is claimed by a
+    # replayer. Records are plain BSON documents, which carry their own int32
+    # length prefix. Every worker shares the directory, so the size cap is checked
+    # against what is on disk rather than a per-process running total.
+    ACTIVE_SUFFIX = ".active"
+    SEALED_SUFFIX = ".spool"
+    CLAIMED_SUFFIX = ".replaying-"
+
+    def __init__(self, directory: str, segment_max_bytes: int, max_total_bytes: int, fsync: bool = False):
+        self._directory = Path(directory)
+        self._segment_max_bytes = segment_max_bytes
+        self._max_total_bytes = max_total_bytes
+        self._fsync = fsync
+        self._pid = os.getpid()
+
+        self._lock = threading.Lock()
+        self._active: Optional[BinaryIO] = None
+        self._active_path: Optional[Path] = None
+        self._active_bytes = 0
+        self._other_bytes = 0
+        self._sealed_bytes = 0
+        self._scanned_at = 0.0
+
+        self._counters: Dict[str, int] = {
+            "spooled": 0,
+            "dropped_over_cap": 0,
+            "replayed": 0,
+            "segments_replayed": 0,
+        }
+
+    def open(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._pid = os.getpid()
+
+        with self._lock:
+            for path in self._directory.iterdir():
+                owner = self._owner_pid(path)
+                if owner is None or owner == self._pid or _pid_alive(owner):
+                    continue
+                if path.name.endswith(self.ACTIVE_SUFFIX) or self.CLAIMED_SUFFIX in path.name:
+                    # Recover segments left behind by a worker that died mid-write or mid-replay.
+                    self._seal_path(path)
+            self._scan_directory(force=True)
+
+        logger.info(f"Log spool opened at {self._directory} ({self._sealed_bytes} bytes pending replay)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._seal_active()
+
+    def append(self, items: List[SpoolItem]) -> int:
+        with self._lock:
+            written = 0
+            self._scan_directory()
+            for collection, document in items:
+                record = bson.encode({"collection": collection, "document": document})
+
+                if self._active_bytes + self._other_bytes + len(record) > self._max_total_bytes:
+                    self._counters["dropped_over_cap"] += len(items) - written
+                    logger.warning(f"Log spool is full, dropped {len(items) - written} entries")
+                    break
+
+                if self._active is None or self._active_bytes + len(record) > self._segment_max_bytes:
+                    self._seal_active()
+                    self._open_active()
+
+                self._active.write(record)
+                self._active_bytes += len(record)
+                written += 1
+
+            if self._active is not None:
+                self._active.flush()
+                if self._fsync:
+                    os.fsync(self._active.fileno())
+
+            self._counters["spooled"] += written
+            return written
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            self._scan_directory()
+            return self._active_bytes + self._sealed_bytes > 0
+
+    def claim_segments(self) -> List[Path]:
+        with self._lock:
+            self._seal_active()
+            claimed = []
+            for path in sorted(self._directory.glob(f"*{self.SEALED_SUFFIX}")):
+                target = path.with_name(f"{path.stem}{self.CLAIMED_SUFFIX}{self._pid}")
+                try:
+                    path.rename(target)
+                except FileNotFoundError:
+                    continue
+                claimed.append(target)
+            self._scanned_at = 0.0
+            return claimed
+
+    def read_segment(self, path: Path) -> List[SpoolItem]:
+        data = path.read_bytes()
+        items: List[SpoolItem] = []
+        offset = 0
+
+        while offset + 4 <= len(data):
+            (length,) = struct.unpack_from("<i", data, offset)
+            if length < 5 or offset + length > len(data):
+                logger.warning(f"Truncated record in spool segment {path.name} at offset {offset}")
+                break
+            record = bson.decode(data[offset:offset + length])
+            items.append((record["collection"], record["document"]))
+            offset += length
+
+        return items
+
+    def complete_segment(self, path: Path, replayed: int) -> None:
+        with self._lock:
+            path.unlink()
+            self._scanned_at = 0.0
+            self._counters["replayed"] += replayed
+            self._counters["segments_replayed"] += 1
+
+    def release_segment(self, path: Path) -> None:
+        with self._lock:
+            self._seal_path(path)
+            self._scanned_at = 0.0
+
+    def get_stats(self) -> Dict[str, object]:
+        with self._lock:
+            self._scan_directory()
+        return {
+            **self._counters,
+            "pending_bytes": self._active_bytes + self._other_bytes,
+            "max_bytes": self._max_total_bytes,
+        }
+
+    def _open_active(self) -> None:
+        self._active_path = self._directory / f"{self._pid}-{time.time_ns()}{self.ACTIVE_SUFFIX}"
+        self._active = open(self._active_path, "ab")
+        self._active_bytes = 0
+
+    def _seal_active(self) -> None:
+        if self._active is None:
+            return
+
+        self._active.close()
+        if self._active_bytes:
+            self._seal_path(self._active_path)
+            self._other_bytes += self._active_bytes
+            self._sealed_bytes += self._active_bytes
+        else:
+            self._active_path.unlink(missing_ok=True)
+
+        self._active = None
+        self._active_path = None
+        self._active_bytes = 0
+
+    def _seal_path(self, path: Path) -> None:
+        stem = path.name.split(".", 1)[0]
+        path.rename(path.with_name(f"{stem}{self.SEALED_SUFFIX}"))
+
+    def _scan_directory(self, force: bool = False) -> None:
+        # Sizes of every segment except this worker's active one, whose size is
+        # tracked exactly in `_active_bytes`: sealed segments from all workers,
+        # other workers' active segments and segments claimed for replay.
+        now = time.monotonic()
+        if not force and now - self._scanned_at < DIRECTORY_SCAN_TTL:
+            return
+
+        other_bytes = sealed_bytes = 0
+        for path in self._directory.iterdir():
+            if path == self._active_path:
+                continue
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                continue
+            other_bytes += size
+            if path.name.endswith(self.SEALED_SUFFIX):
+                sealed_bytes += size
+
+        self._other_bytes, self._sealed_bytes, self._scanned_at = other_bytes, sealed_bytes, now
+
+    @staticmethod
+    def _owner_pid(path: Path) -> Optional[int]:
+        name = path.name
+        if LogSpool.CLAIMED_SUFFIX in name:
+            owner = name.rsplit(LogSpool.CLAIMED_SUFFIX, 1)[1]
+        elif name.endswith(LogSpool.ACTIVE_SUFFIX):
+            owner = name.split("-", 1)[0]
+        else:
+            return None
+        return int(owner) if owner.isdigit() else None
+
+
+class LogSpoolReplayer:
+
+    def __init__(self, spool: LogSpool, database: DatabaseManager, interval: float = 5.0, batch_size: int = 1000):
+        self._spool = spool
+        self._database = database
+        self._interval = interval
+        self._batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+        self.last_replay_at: Optional[datetime] = None
+        self.last_replay_docs_per_second: Optional[float] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="log-spool-replayer")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "last_replay_at": self.last_replay_at,
+            "last_replay_docs_per_second": self.last_replay_docs_per_second,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            if not self._can_replay():
+                continue
+            try:
+                await self.replay_pending()
+            except Exception as e:
+                logger.error(f"Log spool replay failed: {e}")
+
+    def _can_replay(self) -> bool:
+        return (
+            self._spool.has_pending()
+            and self._database.get_mongo_db() is not None
+            and self._database.mongo_breaker.allow_request()
+        )
+
+    async def replay_pending(self) -> int:
+        segments = await asyncio.to_thread(self._spool.claim_segments)
+        started = time.perf_counter()
+        replayed = 0
+
+        for index, path in enumerate(segments):
+            try:
+                count = await self._replay_segment(path)
+            except Exception as e:
+                logger.warning(f"Replay of {path.name} interrupted, will retry: {e}")
+                for pending in segments[index:]:
+                    await asyncio.to_thread(self._spool.release_segment, pending)
+                break
+            await asyncio.to_thread(self._spool.complete_segment, path, count)
+            replayed += count
+
+        if replayed:
+            elapsed = time.perf_counter() - started
+            self.last_replay_at = datetime.utcnow()
+            self.last_replay_docs_per_second = round(replayed / elapsed, 1) if elapsed > 0 else None
+            logger.info(f"Replayed {replayed} spooled log entries from {len(segments)} segments")
+
+        return replayed
+
+    async def _replay_segment(self, path: Path) -> int:
+        items = await asyncio.to_thread(self._spool.read_segment, path)
+
+        by_collection: Dict[str, List[dict]] = defaultdict(list)
+        for collection, document in items:
+            by_collection[collection].append(document)
+
+        for collection, documents in by_collection.items():
+            for start in range(0, len(documents), self._batch_size):
+                chunk = documents[start:start + self._batch_size]
+                # Documents keep the _id assigned before the first attempt. Entries that
+                # did reach MongoDB come back as duplicate key errors, except where _id is
+                # not unique; those are looked up and left out first.
+                if not self._database.enforces_unique_id(collection):
+                    target = self._database.get_mongo_db()[collection]
+                    existing = await self._database.find_existing_ids(target, chunk)
+                    chunk = [document for document in chunk if document.get("_id") not in existing]
+                try:
+                    await self._database.log_many_to_mongo(collection, chunk)
+                except BulkWriteError as e:
+                    errors = e.details.get("writeErrors", [])
+                    if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                        raise
+
+        return len(items)
+
+
+log_spool = LogSpool(
+    settings.log_spool_dir,
+    segment_max_bytes=settings.log_spool_segment_max_bytes,
+    max_total_bytes=settings.log_spool_max_bytes,
+    fsync=settings.log_spool_fsync
+)
+
+log_spool_replayer = LogSpoolReplayer(
+    log_spool,
+    db_manager,
+    interval=settings.log_spool_replay_interval_seconds,
+    batch_size=settings.log_batch_size
+)
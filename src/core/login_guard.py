@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+from pymongo import UpdateOne
+
+from src.core.config import settings
+from src.core.database import db_manager, DatabaseManager
+from src.core.security import SecurityConfig
+from src.utils.cache import ExpiringLRUCache
+from src.utils.exceptions import RateLimitExceededException
+
+logger = logging.getLogger(__name__)
+
+LOGIN_ATTEMPTS_COLLECTION = "login_attempts"
+
+
+class SlidingWindowCounter:
+    # Keeps the timestamps of the last `limit` failures per key; a key is locked
+    # while `limit` of them fall inside the window. Idle keys age out of the LRU.
+
+    def __init__(self, window_seconds: float, max_keys: int):
+        self._window = window_seconds
+        self._entries = ExpiringLRUCache(max_keys)
+
+    def add(self, key: str, limit: int, now: float) -> None:
+        failures: Optional[Deque[float]] = self._entries.get(key)
+        if failures is None:
+            failures = deque(maxlen=limit)
+        failures.append(now)
+        self._entries.set(key, failures, expires_at=now + self._window)
+
+    def locked_until(self, key: str, limit: int, now: float) -> Optional[float]:
+        failures: Optional[Deque[float]] = self._entries.get(key)
+        if failures is None or len(failures) < limit:
+            return None
+
+        unlock_at = failures[-limit] + self._window
+        return unlock_at if unlock_at > now else None
+
+    def reset(self, key: str) -> None:
+        self._entries.delete(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MongoLoginAttemptStore:
+    # Failures are $inc'ed into per-key, per-bucket documents so every worker sees
+    # the same totals. Workers poll the locked keys instead of querying per login,
+    # which keeps the login path's lockout check in memory.
+
+    def __init__(self, database: DatabaseManager, window_seconds: float, bucket_seconds: int = 60):
+        self._database = database
+        self._window = window_seconds
+        self._bucket_seconds = bucket_seconds
+
+    async def record_failures(self, keys: List[str], now: float) -> None:
+        bucket = int(now // self._bucket_seconds) * self._bucket_seconds
+        expires_at = bucket + self._window + self._bucket_seconds
+        operations = [
+            UpdateOne(
+                {"_id": f"{key}|{bucket}"},
+                {
+                    "$inc": {"failures": 1},
+                    "$setOnInsert": {"key": key, "bucket": bucket, "expires_at": datetime.utcfromtimestamp(expires_at)}
+                },
+                upsert=True
+            )
+            for key in keys
+        ]
+        await self._database.bulk_write_mongo(LOGIN_ATTEMPTS_COLLECTION, operations)
+
+    async def reset(self, key: str) -> None:
+        await self._database.delete_mongo_logs(LOGIN_ATTEMPTS_COLLECTION, {"key": key})
+
+    async def fetch_locked(self, limits: Dict[str, int], now: float) -> Dict[str, float]:
+        # Bucketed counts make the shared window up to one bucket longer than the
+        # in-memory one, which only errs on the side of locking.
+        since = now - self._window - self._bucket_seconds
+        rows = await self._database.aggregate_mongo_logs(LOGIN_ATTEMPTS_COLLECTION, [
+            {"$match": {"bucket": {"$gte": since}}},
+            {"$group": {"_id": "$key", "failures": {"$sum": "$failures"}, "first_bucket": {"$min": "$bucket"}}},
+            {"$match": {"failures": {"$gte": min(limits.values())}}}
+        ])
+
+        locked = {}
+        for row in rows:
+            kind = row["_id"].split(":", 1)[0]
+            if row["failures"] >= limits.get(kind, row["failures"] + 1):
+                locked[row["_id"]] = row["first_bucket"] + self._bucket_seconds + self._window
+        return locked
+
+
+class LoginGuard:
+
+    def __init__(
+            self,
+            max_attempts_per_email: int,
+            max_attempts_per_ip: int,
+            window_seconds: float,
+            unknown_email_ttl: float,
+            max_keys: int = 100000,
+            shared_store: Optional[MongoLoginAttemptStore] = None,
+            sync_interval: float = 2.0
+    ):
+        self._limits = {"email": max_attempts_per_email, "ip": max_attempts_per_ip}
+        self._window = window_seconds
+        self._unknown_email_ttl = unknown_email_ttl
+        self._failures = SlidingWindowCounter(window_seconds, max_keys)
+        self._unknown_emails = ExpiringLRUCache(max_keys)
+
+        self._shared_store = shared_store
+        self._sync_interval = sync_interval
+        self._shared_locks: Dict[str, float] = {}
+        self._syncer: Optional[asyncio.Task] = None
+
+        self._counters: Dict[str, int] = {"rejected": 0, "failures": 0, "unknown_email_hits": 0}
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            **self._counters,
+            "tracked_keys": len(self._failures),
+            "unknown_emails": len(self._unknown_emails),
+            "shared_locks": len(self._shared_locks),
+        }
+
+    async def start(self) -> None:
+        if self._shared_store is not None and self._syncer is None:
+            self._syncer = asyncio.create_task(self._run_sync(), name="login-guard-sync")
+
+    async def stop(self) -> None:
+        if self._syncer is not None:
+            self._syncer.cancel()
+            try:
+                await self._syncer
+            except asyncio.CancelledError:
+                pass
+            self._syncer = None
+
+    def check(self, email: str, ip_address: Optional[str]) -> None:
+        now = time.time()
+        unlock_times = [
+            until for until in (self._locked_until(key, now) for key in self._keys(email, ip_address))
+            if until is not None
+        ]
+        if unlock_times:
+            self._counters["rejected"] += 1
+            raise RateLimitExceededException(
+                "Too many failed login attempts, try again later",
+                retry_after=math.ceil(max(unlock_times) - now)
+            )
+
+    async def record_failure(self, email: str, ip_address: Optional[str]) -> None:
+        now = time.time()
+        keys = self._keys(email, ip_address)
+        for key in keys:
+            self._failures.add(key, self._limits[key.split(":", 1)[0]], now)
+        self._counters["failures"] += 1
+
+        if self._shared_store is not None:
+            try:
+                await self._shared_store.record_failures(keys, now)
+            except Exception as e:
+                logger.warning(f"Failed to share login failure: {e}")
+
+    async def record_success(self, email: str) -> None:
+        key = f"email:{self._normalize(email)}"
+        self._failures.reset(key)
+        self._shared_locks.pop(key, None)
+
+        if self._shared_store is not None:
+            try:
+                await self._shared_store.reset(key)
+            except Exception as e:
+                logger.warning(f"Failed to reset shared login failures: {e}")
+
+    # Unknown emails are keyed exactly as the user lookup sees them: the lookup is
+    # case-sensitive, so a miss for "john@x.com" says nothing about "John@x.com".
+    # The cache is per worker, so after a registration other workers may keep
+    # rejecting the new address for up to the TTL; keep the TTL short.
+    def is_unknown_email(self, email: str) -> bool:
+        if self._unknown_emails.get(email) is None:
+            return False
+        self._counters["unknown_email_hits"] += 1
+        return True
+
+    def remember_unknown_email(self, email: str) -> None:
+        self._unknown_emails.set(email, True, ttl=self._unknown_email_ttl)
+
+    def forget_unknown_email(self, email: str) -> None:
+        self._unknown_emails.delete(email)
+
+    def _keys(self, email: str, ip_address: Optional[str]) -> List[str]:
+        keys = [f"email:{self._normalize(email)}"]
+        if ip_address and self._limits["ip"] > 0:
+            keys.append(f"ip:{ip_address}")
+        return keys
+
+    def _locked_until(self, key: str, now: float) -> Optional[float]:
+        local = self._failures.locked_until(key, self._limits[key.split(":", 1)[0]], now)
+        shared = self._shared_locks.get(key)
+        if shared is not None and shared <= now:
+            shared = None
+        return max((until for until in (local, shared) if until is not None), default=None)
+
+    @staticmethod
+    def _normalize(email: str) -> str:
+        return email.strip().lower()
+
+    async def _run_sync(self) -> None:
+        while True:
+            try:
+                limits = {kind: limit for kind, limit in self._limits.items() if limit > 0}
+                self._shared_locks = await self._shared_store.fetch_locked(limits, time.time())
+            except Exception as e:
+                logger.warning(f"Failed to sync shared login locks: {e}")
+            await asyncio.sleep(self._sync_interval)
+
+
+login_guard = LoginGuard(
+    max_attempts_per_email=SecurityConfig.MAX_LOGIN_ATTEMPTS,
+    max_attempts_per_ip=settings.login_max_attempts_per_ip,
+    window_seconds=SecurityConfig.LOCKOUT_DURATION_MINUTES * 60,
+    unknown_email_ttl=settings.login_unknown_email_ttl_seconds,
+    shared_store=(
+        MongoLoginAttemptStore(db_manager, SecurityConfig.LOCKOUT_DURATION_MINUTES * 60)
+        if settings.login_guard_shared else None
+    ),
+    sync_interval=settings.login_guard_sync_interval_seconds
+)
@@ -0,0 +1,86 @@
+import os
+from typing import Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+from src.core.log_rollups import UNMATCHED_ROUTE
+
+# prometheus_client picks its value backend when the first metric is created, so
+# PROMETHEUS_MULTIPROC_DIR has to exist before this module is imported. entrypoint.sh
+# exports it and prepares the directory; each worker then writes its samples to
+# mmap'd files named after its pid. Without it, metrics are kept per process.
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template, method and status code",
+    ["route", "method", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and method",
+    ["route", "method"],
+    buckets=LATENCY_BUCKETS_SECONDS
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "PostgreSQL pool connections summed over live workers",
+    ["state"],
+    multiprocess_mode="livesum"
+)
+DB_POOL_MAX_CONNECTIONS = Gauge(
+    "db_pool_max_connections",
+    "PostgreSQL pool capacity summed over live workers",
+    multiprocess_mode="livesum"
+)
+LOG_QUEUE_DEPTH = Gauge(
+    "log_queue_depth",
+    "Log entries waiting in the in-process queues of live workers",
+    multiprocess_mode="livesum"
+)
+LOG_QUEUE_DROPPED = Gauge(
+    "log_queue_dropped",
+    "Log entries dropped by live workers since they started",
+    multiprocess_mode="livesum"
+)
+TOKEN_CACHE = Gauge(
+    "auth_token_cache",
+    "Decoded JWT payload cache size and lookup counts summed over live workers",
+    ["stat"],
+    multiprocess_mode="livesum"
+)
+EXECUTOR_QUEUE_WAIT = Histogram(
+    "executor_queue_wait_seconds",
+    "Time blocking calls wait for a free executor thread",
+    ["executor", "operation"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+EXECUTOR_REJECTED = Counter(
+    "executor_rejected_total",
+    "Blocking calls rejected with 503 because the executor queue was full",
+    ["executor", "operation"]
+)
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "Event loop scheduling delay per worker",
+    multiprocess_mode="liveall"
+)
+
+
+def record_request(route: Optional[str], method: str, status_code: int, process_time: float) -> None:
+    # Unmatched paths share one label value so scanners cannot blow up cardinality.
+    route = route or UNMATCHED_ROUTE
+    HTTP_REQUESTS.labels(route, method, str(status_code)).inc()
+    HTTP_REQUEST_DURATION.labels(route, method).observe(process_time)
+
+
+def render_metrics() -> bytes:
+    if not MULTIPROCESS:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+from prometheus_client import multiprocess
+from tortoise import connections
+
+from src.api.auth.jwt_handler import JWTHandler
+from src.core.config import settings
+from src.core.log_pipeline import log_pipeline, LogPipeline
+from src.core.metrics import (
+    DB_POOL_CONNECTIONS, DB_POOL_MAX_CONNECTIONS, EVENT_LOOP_LAG, LOG_QUEUE_DEPTH, LOG_QUEUE_DROPPED, MULTIPROCESS,
+    TOKEN_CACHE
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsSampler:
+    # Gauges in multiprocess mode are only written by the process that owns them,
+    # so every worker samples its own state on a timer rather than at scrape time.
+    # The sleep overshoot of that timer doubles as the event-loop lag measurement.
+
+    def __init__(self, pipeline: LogPipeline, interval: float = 1.0):
+        self._pipeline = pipeline
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="metrics-sampler")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if MULTIPROCESS:
+            multiprocess.mark_process_dead(os.getpid())
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            EVENT_LOOP_LAG.set(max(0.0, time.perf_counter() - started - self._interval))
+
+            try:
+                self.sample()
+            except Exception as e:
+                logger.debug(f"Metrics sampling failed: {e}")
+
+    def sample(self) -> None:
+        stats = self._pipeline.get_stats()
+        LOG_QUEUE_DEPTH.set(stats["queue_depth"])
+        LOG_QUEUE_DROPPED.set(stats["dropped"])
+
+        cache_stats = JWTHandler.get_cache_stats()
+        if cache_stats is not None:
+            for stat in ("size", "hits", "misses", "evictions"):
+                TOKEN_CACHE.labels(stat).set(cache_stats[stat])
+
+        pool = self._postgres_pool()
+        if pool is not None:
+            size, idle = pool.get_size(), pool.get_idle_size()
+            DB_POOL_CONNECTIONS.labels("in_use").set(size - idle)
+            DB_POOL_CONNECTIONS.labels("idle").set(idle)
+            DB_POOL_MAX_CONNECTIONS.set(pool.get_max_size())
+
+    @staticmethod
+    def _postgres_pool():
+        try:
+            return getattr(connections.get("default"), "_pool", None)
+        except Exception:
+            return None
+
+
+metrics_sampler = MetricsSampler(log_pipeline, interval=settings.metrics_sample_interval_seconds)
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+IndexKeys = List[Tuple[str, int]]
+# Options that change what an index accepts or covers; any difference means a rebuild.
+COMPARED_OPTIONS = ("unique", "sparse", "partialFilterExpression")
+
+
+class ManagedIndex:
+    # Only indexes whose name carries this prefix are created, altered or dropped
+    # by reconciliation; anything else on the collection is left alone.
+    PREFIX = "mgd_"
+
+    def __init__(self, name: str, keys: IndexKeys, **options: Any):
+        self.name = f"{self.PREFIX}{name}"
+        self.keys = keys
+        self.options = options
+
+    @property
+    def expire_after_seconds(self) -> Optional[int]:
+        return self.options.get("expireAfterSeconds")
+
+    def to_model(self) -> IndexModel:
+        return IndexModel(self.keys, name=self.name, **self.options)
+
+    def matches_keys(self, info: Dict[str, Any]) -> bool:
+        return [(field, int(direction)) for field, direction in info["key"]] == self.keys
+
+    def matches_options(self, info: Dict[str, Any]) -> bool:
+        # index_information() omits unset options, and unique/sparse default to false.
+        for option in COMPARED_OPTIONS:
+            declared, existing = self.options.get(option), info.get(option)
+            if option != "partialFilterExpression":
+                declared, existing = bool(declared), bool(existing)
+            if declared != existing:
+                return False
+        return True
+
+
+def declared_log_indexes(
+        retention_days: Dict[str, int],
+        app_logs_meta_field: Optional[str] = None
+) -> Dict[str, List[ManagedIndex]]:
+    def retention_index(collection: str, field: str = "timestamp") -> ManagedIndex:
+        days = retention_days.get(collection, 0)
+        if days > 0:
+            return ManagedIndex(field, [(field, ASCENDING)], expireAfterSeconds=days * 86400)
+        return ManagedIndex(field, [(field, ASCENDING)])
+
+    # Equality fields first, then (timestamp, _id) for the keyset sort and the
+    # timestamp range, matching the /admin/logs query shapes.
+    if app_logs_meta_field:
+        # A time-series app_logs expires through the collection's expireAfterSeconds and
+        # MongoDB already indexes (metaField, timeField); the rest stay on (field, timestamp).
+        app_logs = [
+            ManagedIndex(name, [(field, ASCENDING), ("timestamp", DESCENDING)])
+            for name, field in (
+                ("method_timestamp", "method"),
+                ("route_timestamp", "route"),
+                ("status_code_timestamp", "status_code"),
+                ("user_id_timestamp", "user_info.user_id"),
+            )
+            if field != app_logs_meta_field
+        ]
+    else:
+        app_logs = [
+            retention_index("app_logs"),
+            ManagedIndex("timestamp_id", [("timestamp", DESCENDING), ("_id", DESCENDING)]),
+            ManagedIndex("method_timestamp", [("method", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]),
+            ManagedIndex("route_timestamp", [("route", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]),
+            ManagedIndex(
+                "status_code_timestamp",
+                [("status_code", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]
+            ),
+            ManagedIndex(
+                "user_id_timestamp",
+                [("user_info.user_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]
+            ),
+        ]
+
+    return {
+        "app_logs": app_logs,
+        "request_actions": [
+            retention_index("request_actions"),
+            ManagedIndex("timestamp_id", [("timestamp", DESCENDING), ("_id", DESCENDING)]),
+            ManagedIndex(
+                "request_id_timestamp",
+                [("request_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]
+            ),
+            ManagedIndex(
+                "request_ids_timestamp",
+                [("request_ids", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)],
+                partialFilterExpression={"request_ids": {"$exists": True}}
+            ),
+            ManagedIndex("user_id_timestamp", [("user_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]),
+            ManagedIndex("action_timestamp", [("action", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)]),
+        ],
+        "revoked_tokens": [
+            ManagedIndex("expires_at", [("expires_at", ASCENDING)], expireAfterSeconds=0),
+            ManagedIndex("updated_at", [("updated_at", ASCENDING)]),
+        ],
+        "login_attempts": [
+            ManagedIndex("expires_at", [("expires_at", ASCENDING)], expireAfterSeconds=0),
+            ManagedIndex("bucket_key", [("bucket", ASCENDING), ("key", ASCENDING)]),
+        ],
+        # The unique keys back the $inc upserts and the $merge "on" fields of downsampling.
+        "app_logs_rollup_minute": [
+            ManagedIndex(
+                "minute_route_method_status",
+                [("minute", ASCENDING), ("route", ASCENDING), ("method", ASCENDING), ("status_code", ASCENDING)],
+                unique=True
+            ),
+        ],
+        "app_logs_rollup_hour": [
+            ManagedIndex(
+                "hour_route_method_status",
+                [("hour", ASCENDING), ("route", ASCENDING), ("method", ASCENDING), ("status_code", ASCENDING)],
+                unique=True
+            ),
+            retention_index("app_logs_rollup_hour", "hour"),
+        ],
+    }
+
+
+class MongoIndexManager:
+
+    def __init__(self, mongo_db, declared: Dict[str, List[ManagedIndex]]):
+        self._mongo_db = mongo_db
+        self._declared = declared
+        self._task: Optional[asyncio.Task] = None
+
+        self.report: Dict[str, Dict[str, List[str]]] = {}
+
+    async def start(self) -> None:
+        # Only the diff is computed before serving; building runs in the background
+        # so a large collection cannot hold up startup.
+        self.report = await self.diff()
+        pending = {collection: entry for collection, entry in self.report.items() if any(entry.values())}
+        if pending:
+            logger.warning(f"MongoDB index reconciliation pending: {pending}")
+        else:
+            logger.info("MongoDB log indexes are up to date")
+
+        self._task = asyncio.create_task(self._run(), name="mongo-index-reconcile")
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    @property
+    def is_building(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def get_report(self) -> Dict[str, Any]:
+        return {"building": self.is_building, "collections": self.report}
+
+    async def _run(self) -> None:
+        try:
+            await self.reconcile()
+        except Exception as e:
+            logger.error(f"MongoDB index reconciliation failed: {e}")
+
+    async def diff(self) -> Dict[str, Dict[str, List[str]]]:
+        report = {}
+        for collection, indexes in self._declared.items():
+            existing = await self._mongo_db[collection].index_information()
+            declared_names = {index.name for index in indexes}
+
+            entry = {"missing": [], "outdated": [], "obsolete": []}
+            for index in indexes:
+                info = existing.get(index.name)
+                if info is None:
+                    entry["missing"].append(index.name)
+                elif not self._is_current(index, info):
+                    entry["outdated"].append(index.name)
+
+            entry["obsolete"] = [
+                name for name in existing
+                if name.startswith(ManagedIndex.PREFIX) and name not in declared_names
+            ]
+            report[collection] = entry
+        return report
+
+    async def reconcile(self) -> None:
+        for collection, indexes in self._declared.items():
+            coll = self._mongo_db[collection]
+            existing = await coll.index_information()
+            declared_names = {index.name for index in indexes}
+
+            for name in existing:
+                if name.startswith(ManagedIndex.PREFIX) and name not in declared_names:
+                    await coll.drop_index(name)
+                    logger.info(f"Dropped obsolete index {collection}.{name}")
+
+            for index in indexes:
+                info = existing.get(index.name)
+                try:
+                    if info is None:
+                        await coll.create_indexes([index.to_model()])
+                        logger.info(f"Created index {collection}.{index.name}")
+                    elif not self._is_current(index, info):
+                        await self._update_index(collection, index, info)
+                except OperationFailure as e:
+                    logger.error(f"Failed to reconcile index {collection}.{index.name}: {e}")
+
+        self.report = await self.diff()
+        logger.info(f"MongoDB index reconciliation finished: {self.report}")
+
+    async def _update_index(self, collection: str, index: ManagedIndex, info: Dict[str, Any]) -> None:
+        coll = self._mongo_db[collection]
+
+        if index.matches_keys(info) and index.matches_options(info) and "expireAfterSeconds" in info and index.expire_after_seconds is not None:
+            await self._mongo_db.command({
+                "collMod": collection,
+                "index": {"name": index.name, "expireAfterSeconds": index.expire_after_seconds}
+            })
+            logger.info(f"Changed TTL of {collection}.{index.name} to {index.expire_after_seconds}s")
+            return
+
+        await coll.drop_index(index.name)
+        await coll.create_indexes([index.to_model()])
+        logger.info(f"Rebuilt index {collection}.{index.name}")
+
+    @staticmethod
+    def _is_current(index: ManagedIndex, info: Dict[str, Any]) -> bool:
+        existing_ttl = info.get("expireAfterSeconds")
+        return index.matches_keys(info) and index.matches_options(info) and (
+            (existing_ttl is None and index.expire_after_seconds is None)
+            or (existing_ttl is not None and int(existing_ttl) == index.expire_after_seconds)
+        )
@@ -1,11 +1,12 @@
 from typing import List, Dict, Any
 
+from src.core.config import settings
 from src.enums import UserRole
-from src.middleware.permissions import RolePermissions
+from src.middleware.permissions import RolePermissions, mask_permissions, permissions_mask
 
 class SecurityConfig:
     PASSWORD_MIN_LENGTH = 8
-    TOKEN_BLACKLIST_ENABLED = True
+    TOKEN_BLACKLIST_ENABLED = settings.token_blacklist_enabled
     MAX_LOGIN_ATTEMPTS = 5
     LOCKOUT_DURATION_MINUTES = 15
 
@@ -18,11 +19,21 @@ class PermissionHierarchy:
         UserRole.ADMIN: [UserRole.USER, UserRole.STAFF]
     }
 
+    INHERITED_PERMISSIONS: Dict[UserRole, List[str]] = {}
+
     @classmethod
     def get_inherited_permissions(cls, role: UserRole) -> List[str]:
-        permissions = set(RolePermissions.get_role_permissions(role))
-
-        for inherited_role in cls.HIERARCHY.get(role, []):
-            permissions.update(RolePermissions.get_role_permissions(inherited_role))
-
-        return list(permissions)
\ No newline at end of file
+        return list(cls.INHERITED_PERMISSIONS.get(role, []))
+
+
+PermissionHierarchy.INHERITED_PERMISSIONS = {
+    role: mask_permissions(
+        RolePermissions.get_role_mask(role)
+        | permissions_mask(
+            permission
+            for inherited_role in inherited_roles
+            for permission in RolePermissions.get_role_permissions(inherited_role)
+        )
+    )
+    for role, inherited_roles in PermissionHierarchy.HIERARCHY.items()
+}
\ No newline at end of file
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from src.core.config import settings
+from src.core.database import db_manager, DatabaseManager
+from src.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+REVOKED_TOKENS_COLLECTION = "revoked_tokens"
+# Re-read a little behind the newest change already seen so writes that commit
+# out of `updated_at` order on the server are not skipped.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class TokenRevocationList:
+    # Revoked tokens by `jti`, plus a per-user cutoff that revokes every token issued
+    # to that user before a given second. The Bloom filter answers the common "not
+    # revoked" case and the exact map is only consulted on a filter hit. Entries
+    # live until the token's own `exp`; the filter is rebuilt when they are purged.
+    # Revocations are written to MongoDB and every worker polls for new ones.
+
+    def __init__(
+            self,
+            database: DatabaseManager,
+            user_cutoff_ttl: float,
+            bloom_capacity: int,
+            bloom_error_rate: float,
+            sync_interval: float,
+            enabled: bool = True
+    ):
+        self.enabled = enabled
+        self._database = database
+        self._user_cutoff_ttl = user_cutoff_ttl
+        self._bloom_capacity = bloom_capacity
+        self._bloom_error_rate = bloom_error_rate
+        self._sync_interval = sync_interval
+
+        self._tokens: Dict[str, float] = {}
+        self._bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._user_cutoffs: Dict[int, Tuple[int, float]] = {}
+
+        self._pending: List[UpdateOne] = []
+        self._synced_until: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "revoked_tokens": len(self._tokens),
+            "user_cutoffs": len(self._user_cutoffs),
+            "bloom_bits": self._bloom.size_bits,
+            "pending_writes": len(self._pending),
+        }
+
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        if not self.enabled:
+            return False
+
+        jti = payload.get("jti")
+        if jti is not None and jti in self._bloom:
+            expires_at = self._tokens.get(jti)
+            if expires_at is not None and expires_at > time.time():
+                return True
+
+        cutoff = self._user_cutoffs.get(payload.get("user_id"))
+        return cutoff is not None and payload.get("iat", 0) < cutoff[0]
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        self._add_token(jti, expires_at)
+        await self._persist(UpdateOne(
+            {"_id": f"jti:{jti}"},
+            {
+                "$setOnInsert": {"kind": "token", "jti": jti, "expires_at": datetime.utcfromtimestamp(expires_at)},
+                "$currentDate": {"updated_at": True}
+            },
+            upsert=True
+        ))
+
+    async def revoke_user(self, user_id: int) -> int:
+        # Whole seconds, like `iat`: tokens issued later in the same second (e.g.
+        # a login right after a password change) stay valid.
+        revoked_before = int(time.time())
+        expires_at = revoked_before + self._user_cutoff_ttl
+        self._set_user_cutoff(user_id, revoked_before, expires_at)
+        await self._persist(UpdateOne(
+            {"_id": f"user:{user_id}"},
+            {
+                "$set": {"kind": "user", "user_id": user_id},
+                "$max": {"revoked_before": revoked_before, "expires_at": datetime.utcfromtimestamp(expires_at)},
+                "$currentDate": {"updated_at": True}
+            },
+            upsert=True
+        ))
+        return revoked_before
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        await self.sync()
+        self._task = asyncio.create_task(self._run(), name="token-revocation-sync")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sync(self) -> None:
+        await self._flush_pending()
+
+        if self._synced_until is None:
+            query = {"expires_at": {"$gt": datetime.utcnow()}}
+        else:
+            query = {"updated_at": {"$gte": self._synced_until - SYNC_OVERLAP}}
+
+        for document in await self._database.aggregate_mongo_logs(REVOKED_TOKENS_COLLECTION, [{"$match": query}]):
+            # MongoDB returns naive UTC datetimes.
+            expires_at = document["expires_at"].replace(tzinfo=timezone.utc).timestamp()
+            if document.get("kind") == "token":
+                self._add_token(document["jti"], expires_at)
+            elif document.get("kind") == "user":
+                self._set_user_cutoff(document["user_id"], document["revoked_before"], expires_at)
+
+            updated_at = document.get("updated_at")
+            if updated_at is not None and (self._synced_until is None or updated_at > self._synced_until):
+                self._synced_until = updated_at
+
+        self._purge_expired()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._sync_interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.warning(f"Failed to sync token revocations: {e}")
+
+    async def _persist(self, operation: UpdateOne) -> None:
+        # The revocation already applies on this worker; if MongoDB is unavailable
+        # the write is retried on the next sync so other workers still pick it up.
+        self._pending.append(operation)
+        await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+
+        operations, self._pending = self._pending, []
+        try:
+            await self._database.bulk_write_mongo(REVOKED_TOKENS_COLLECTION, operations)
+        except Exception as e:
+            self._pending = operations + self._pending
+            logger.warning(f"Failed to store {len(operations)} token revocations, will retry: {e}")
+
+    def _add_token(self, jti: str, expires_at: float) -> None:
+        if expires_at <= time.time() or jti in self._tokens:
+            return
+
+        self._tokens[jti] = expires_at
+        if len(self._tokens) > self._bloom.capacity:
+            self._rebuild_bloom()
+        else:
+            self._bloom.add(jti)
+
+    def _set_user_cutoff(self, user_id: int, revoked_before: int, expires_at: float) -> None:
+        current = self._user_cutoffs.get(user_id)
+        if current is None or current[0] < revoked_before:
+            self._user_cutoffs[user_id] = (revoked_before, expires_at)
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        expired = [jti for jti, expires_at in self._tokens.items() if expires_at <= now]
+        for jti in expired:
+            del self._tokens[jti]
+        if expired:
+            self._rebuild_bloom()
+
+        for user_id in [user_id for user_id, (_, expires_at) in self._user_cutoffs.items() if expires_at <= now]:
+            del self._user_cutoffs[user_id]
+
+    def _rebuild_bloom(self) -> None:
+        capacity = max(self._bloom_capacity, 2 * len(self._tokens))
+        self._bloom = BloomFilter.from_keys(self._tokens, capacity, self._bloom_error_rate)
+
+
+token_revocation_list = TokenRevocationList(
+    db_manager,
+    # A user cutoff must outlive every token issued before it, refresh tokens included.
+    user_cutoff_ttl=max(settings.access_token_expire_minutes * 60, settings.refresh_token_expire_days * 86400),
+    bloom_capacity=settings.token_revocation_bloom_capacity,
+    bloom_error_rate=settings.token_revocation_bloom_error_rate,
+    sync_interval=settings.token_revocation_sync_interval_seconds,
+    enabled=settings.token_blacklist_enabled
+)
@@ -11,3 +11,41 @@ class RequestStatus(str, Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     CLOSED = "closed"
+
+
+class LogOverflowPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEW = "drop_new"
+    BLOCK = "block"
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class RollupGranularity(str, Enum):
+    MINUTE = "minute"
+    HOUR = "hour"
+
+
+class LogCollection(str, Enum):
+    APP_LOGS = "app_logs"
+    REQUEST_ACTIONS = "request_actions"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class BulkOutcome(str, Enum):
+    UPDATED = "updated"
+    NOT_FOUND = "not_found"
+
+
+class TotalMode(str, Enum):
+    EXACT = "exact"
+    WINDOW = "window"
+    ESTIMATE = "estimate"
@@ -1,15 +1,26 @@
 import logging
 from typing import Dict, Any
 from dotenv import load_dotenv
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from tortoise.contrib.fastapi import register_tortoise
 
 from src.api.routers import admin, auth, logs, staff, user_request
 from src.core.config import settings, tortoise_config
 from src.core.database import db_manager
-from src.core.dependencies import get_database_manager
+from src.core.executors import password_executor
+from src.core.health import health_monitor, HealthMonitor
+from src.core.log_pipeline import log_pipeline
+from src.core.log_rollups import request_rollups
+from src.core.log_spool import log_spool, log_spool_replayer
+from src.core.login_guard import login_guard
+from src.core.metrics import CONTENT_TYPE_LATEST, render_metrics
+from src.core.metrics_sampler import metrics_sampler
+from src.core.token_revocation import token_revocation_list
+from src.core.dependencies import get_health_monitor
 from src.middleware import LoggingMiddleware, RequestActionMiddleware
+from src.middleware.route_actions import route_action_table
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,10 +41,10 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json"
     )
 
+    _setup_database(app)
     _setup_event_handlers(app)
     _setup_middleware(app)
     _setup_routers(app)
-    _setup_database(app)
     _setup_service_endpoints(app)
 
     logger.info("Application successfully configured")
@@ -44,12 +55,33 @@ def _setup_event_handlers(app: FastAPI) -> None:
     @app.on_event("startup")
     async def startup_event():
         logger.info("Starting application...")
+        route_action_table.build(app.routes)
+        if settings.log_spool_enabled:
+            log_spool.open()
         await db_manager.init_mongo()
         logger.info("MongoDB connected")
+        await health_monitor.start()
+        await log_pipeline.start()
+        await request_rollups.start()
+        await metrics_sampler.start()
+        await login_guard.start()
+        await token_revocation_list.start()
+        if settings.log_spool_enabled:
+            await log_spool_replayer.start()
 
     @app.on_event("shutdown")
     async def shutdown_event():
         logger.info("Shutting down application...")
+        await log_pipeline.stop(timeout=settings.log_shutdown_timeout_seconds)
+        await request_rollups.stop()
+        await metrics_sampler.stop()
+        await login_guard.stop()
+        await token_revocation_list.stop()
+        password_executor.shutdown()
+        if settings.log_spool_enabled:
+            await log_spool_replayer.stop()
+            log_spool.close()
+        await health_monitor.stop()
         await db_manager.close_mongo()
         logger.info("MongoDB disconnected")
 
@@ -99,30 +131,28 @@ def _setup_database(app: FastAPI) -> None:
 def _setup_service_endpoints(app: FastAPI) -> None:
     @app.get("/health", summary="System health check", tags=["System"])
     async def health_check(
-        db: db_manager.__class__ = Depends(get_database_manager)
+        monitor: HealthMonitor = Depends(get_health_monitor)
     ) -> Dict[str, Any]:
-        health_status = {
-            "status": "healthy",
-            "components": {
-                "api": "operational",
-                "postgresql": "unknown",
-                "mongodb": "unknown"
-            }
-        }
-
-        postgres_healthy = await db.is_postgres_healthy()
-        mongo_healthy = await db.is_mongo_healthy()
-
-        health_status["components"]["postgresql"] = "connected" if postgres_healthy else "error"
-        health_status["components"]["mongodb"] = "connected" if mongo_healthy else "disconnected"
-
-        if not postgres_healthy or not mongo_healthy:
-            if not postgres_healthy and not mongo_healthy:
-                health_status["status"] = "unhealthy"
-            else:
-                health_status["status"] = "degraded"
-
-        return health_status
+        return monitor.get_status()
+
+    @app.get("/health/live", summary="Liveness probe", tags=["System"])
+    async def liveness_check() -> Dict[str, Any]:
+        return {"status": "alive"}
+
+    @app.get("/health/ready", summary="Readiness probe", tags=["System"])
+    async def readiness_check(
+        monitor: HealthMonitor = Depends(get_health_monitor)
+    ):
+        if not monitor.is_ready():
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"status": "not_ready"}
+            )
+        return {"status": "ready"}
+
+    @app.get("/metrics", summary="Prometheus metrics", tags=["System"], include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
 
 
 app = create_app()
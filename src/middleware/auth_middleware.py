@@ -9,14 +9,17 @@ security = HTTPBearer()
 
 
 async def get_current_user(
+        request: Request,
         credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> Dict[str, Any]:
     token = credentials.credentials
     payload = JWTHandler.get_token_payload(token)
+    request.state.current_user = payload
     return payload
 
 
 async def get_current_user_optional(
+        request: Request,
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(
             HTTPBearer(auto_error=False)
         )
@@ -27,6 +30,7 @@ async def get_current_user_optional(
     try:
         token = credentials.credentials
         payload = JWTHandler.get_token_payload(token)
+        request.state.current_user = payload
         return payload
     except HTTPException:
         return None
@@ -1,191 +1,141 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from datetime import datetime
-from typing import Dict, Optional
 import time
-import asyncio
 import logging
 
-from src.core.database import db_manager
+from src.core.log_pipeline import log_pipeline
+from src.core.log_rollups import request_rollups
+from src.core.log_sampling import log_sampling_policy
+from src.core.metrics import record_request
+from src.middleware.route_actions import route_action_table, RouteAction, BULK_REQUEST_IDS_STATE
 
 logger = logging.getLogger(__name__)
 
-try:
-    from src.api.auth.jwt_handler import JWTHandler
-except ImportError:
-    JWTHandler = None
-    logger.warning("JWTHandler not found, JWT token extraction will be skipped")
 
+class LoggingMiddleware:
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next):
-        try:
-            start_time = time.time()
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            asyncio.create_task(self._log_in_background(request, response, process_time))
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-            return response
-        except Exception as e:
-            logger.error(f"LoggingMiddleware error: {e}")
-            return await call_next(request)
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-    async def _log_in_background(self, request: Request, response: Response, process_time: float):
         try:
-            if not await db_manager.is_mongo_healthy():
-                logger.warning("MongoDB not connected, skipping API log")
-                return
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            process_time = time.perf_counter() - start_time
+            await self._log_request(Request(scope), status_code, process_time)
 
+    async def _log_request(self, request: Request, status_code: int, process_time: float):
+        try:
+            route = request.scope.get("route")
+            route_path = route.path if route is not None else None
             method = request.method
+
+            request_rollups.record(route_path, method, status_code, process_time)
+            record_request(route_path, method, status_code, process_time)
+
+            sample_weight = log_sampling_policy.sample(route_path, status_code, process_time)
+            if sample_weight is None:
+                return
+
             url = str(request.url)
             ip_address = getattr(request.client, 'host', None) if request.client else None
             user_agent = request.headers.get("user-agent")
+            # Set by the auth dependency on authenticated routes; the /api-logs user_id filter reads it.
+            current_user = request.scope.get("state", {}).get("current_user")
 
             log_entry = {
                 "timestamp": datetime.utcnow(),
                 "type": "api_request",
                 "method": method,
                 "url": url,
-                "status_code": response.status_code,
+                "route": route_path,
+                "status_code": status_code,
                 "process_time": round(process_time, 3),
                 "ip_address": ip_address,
-                "user_agent": user_agent
+                "user_agent": user_agent,
+                "sample_weight": sample_weight
             }
+            if current_user:
+                log_entry["user_info"] = {
+                    "user_id": current_user.get("user_id"),
+                    "role": current_user.get("role")
+                }
 
-            await db_manager.log_to_mongo("app_logs", log_entry)
-            logger.debug(f"Logged API request to MongoDB: {log_entry}")
+            await log_pipeline.enqueue("app_logs", log_entry)
 
         except Exception as e:
-            logger.error(f"Background logging failed: {e}")
+            logger.error(f"Request logging failed: {e}")
 
 
-class RequestActionMiddleware(BaseHTTPMiddleware):
+class RequestActionMiddleware:
 
-    async def dispatch(self, request: Request, call_next):
-        try:
-            if not self._is_request_action(request):
-                return await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-            response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-            if 200 <= response.status_code < 300:
-                asyncio.create_task(self._log_action_background(request, response))
+        status_code = None
 
-            return response
-        except Exception as e:
-            logger.error(f"RequestActionMiddleware error: {e}")
-            return await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-    def _is_request_action(self, request: Request) -> bool:
-        try:
-            url_path = request.url.path
-            return (
-                    ("/user_request/" in url_path or "/staff/requests" in url_path)
-                    and request.method in ["GET", "POST", "PUT", "PATCH", "DELETE"]
-            )
-        except:
-            return False
-
-    async def _log_action_background(self, request: Request, response: Response):
-        try:
-            if not await db_manager.is_mongo_healthy():
-                logger.error("MongoDB not connected, skipping request_action log")
-                return
+        await self.app(scope, receive, send_wrapper)
+
+        if status_code is None or not 200 <= status_code < 300:
+            return
+
+        route_action = route_action_table.resolve(scope)
+        if route_action is not None:
+            await self._log_action(scope, route_action)
 
-            user_info = await self._extract_user_info(request)
+    async def _log_action(self, scope: Scope, route_action: RouteAction):
+        try:
+            state = scope.get("state", {})
+            user_info = state.get("current_user")
             if not user_info:
                 return
 
-            request_id = self._extract_request_id(request)
-            action = self._determine_action(request)
-
             log_entry = {
                 "timestamp": datetime.utcnow(),
                 "type": "request_action",
-                "request_id": request_id,
+                "request_id": None,
                 "user_id": user_info.get("user_id"),
                 "user_email": user_info.get("email"),
-                "user_role": user_info.get("role"),
-                "action": action,
-                "method": request.method,
-                "url": str(request.url)
+                "user_role": user_info.get("role", "").upper(),
+                "action": route_action.action,
+                "method": scope["method"],
+                "url": str(URL(scope=scope))
             }
 
-            await db_manager.log_to_mongo("request_actions", log_entry)
+            # A bulk call is one audit entry listing every ticket it changed.
+            bulk_request_ids = state.get(BULK_REQUEST_IDS_STATE)
+            if bulk_request_ids is not None:
+                log_entry["request_ids"] = bulk_request_ids
+            elif route_action.request_id_param:
+                raw_request_id = scope["path_params"].get(route_action.request_id_param)
+                log_entry["request_id"] = int(raw_request_id) if raw_request_id is not None else None
+
+            await log_pipeline.enqueue("request_actions", log_entry)
         except Exception as e:
             logger.error(f"Action logging failed: {e}")
-
-    def _extract_request_id(self, request: Request) -> Optional[int]:
-        try:
-            path_parts = request.url.path.split("/")
-
-            if "user_request" in path_parts:
-                index = path_parts.index("user_request")
-                if index + 1 < len(path_parts) and path_parts[index + 1].isdigit():
-                    return int(path_parts[index + 1])
-
-            if "requests" in path_parts:
-                index = path_parts.index("requests")
-                if index + 1 < len(path_parts) and path_parts[index + 1].isdigit():
-                    return int(path_parts[index + 1])
-
-        except:
-            pass
-        return None
-
-    def _determine_action(self, request: Request) -> str:
-        try:
-            method = request.method
-            url_path = request.url.path
-
-            if "/user_request/" in url_path:
-                if method == "POST" and url_path.endswith("/user_request/"):
-                    return "create_request"
-                elif method == "GET":
-                    if url_path.endswith("/my"):
-                        return "view_my_requests"
-                    elif url_path.count("/") > 2:
-                        return "view_request"
-                    else:
-                        return "list_requests"
-                elif method in ["PUT", "PATCH"]:
-                    return "update_request"
-                elif method == "DELETE":
-                    return "delete_request"
-
-            elif "/staff/requests" in url_path or "/admin/requests" in url_path:
-                if method == "GET":
-                    return "view_request" if url_path.count("/") > 3 else "list_assigned_requests"
-                elif method in ["PUT", "PATCH"]:
-                    if "assign" in url_path:
-                        return "assign_request"
-                    elif "status" in url_path:
-                        return "change_status"
-                    else:
-                        return "manage_request"
-                elif method == "DELETE":
-                    return "admin_delete_request"
-
-            return "unknown_action"
-        except:
-            return "unknown_action"
-
-    async def _extract_user_info(self, request: Request) -> Optional[Dict]:
-        try:
-            if JWTHandler is None:
-                return None
-
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                return None
-
-            token = auth_header.split(" ")[1]
-            payload = JWTHandler.decode_token(token)
-
-            if payload and "role" in payload:
-                payload["role"] = payload["role"].upper()
-
-            return payload
-        except:
-            return None
\ No newline at end of file
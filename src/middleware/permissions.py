@@ -1,5 +1,6 @@
+import hashlib
 import logging
-from typing import Any, List
+from typing import Any, Dict, Iterable, List, Optional
 from fastapi import Depends, HTTPException, status
 
 from src.enums import UserRole
@@ -32,6 +33,28 @@ class Permissions:
     MANAGE_PROFILE = "manage-profile"
 
 
+# One bit per permission, in declaration order. The layout fingerprint goes into
+# tokens next to their mask, so masks issued under a different layout are ignored.
+PERMISSION_BITS: Dict[str, int] = {
+    value: 1 << position
+    for position, value in enumerate(
+        value for name, value in vars(Permissions).items() if not name.startswith("_") and isinstance(value, str)
+    )
+}
+PERMISSION_LAYOUT = hashlib.sha256(",".join(PERMISSION_BITS).encode()).hexdigest()[:8]
+
+
+def permissions_mask(permissions: Iterable[str]) -> int:
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS[permission]
+    return mask
+
+
+def mask_permissions(mask: int) -> List[str]:
+    return [permission for permission, bit in PERMISSION_BITS.items() if mask & bit]
+
+
 class RolePermissions:
     ROLE_PERMISSIONS = {
         UserRole.USER: [
@@ -70,35 +93,85 @@ class RolePermissions:
         ]
     }
 
+    # Keyed by the role's string value so token claims need no UserRole() conversion.
+    ROLE_MASKS: Dict[str, int] = {}
+
     @classmethod
     def get_role_permissions(cls, role: UserRole) -> List[str]:
         return cls.ROLE_PERMISSIONS.get(role, [])
 
+    @classmethod
+    def get_role_mask(cls, role: UserRole) -> int:
+        return cls.ROLE_MASKS.get(UserRole(role).value, 0)
+
     @classmethod
     def has_permission(cls, role: UserRole, permission: str) -> bool:
-        return permission in cls.get_role_permissions(role)
+        bit = PERMISSION_BITS.get(permission, 0)
+        return bit != 0 and cls.get_role_mask(role) & bit == bit
+
+    @classmethod
+    def get_token_claims(cls, role: UserRole) -> Dict[str, Any]:
+        return {"perm_mask": cls.get_role_mask(role), "perm_layout": PERMISSION_LAYOUT}
+
+    @classmethod
+    def get_user_mask(cls, current_user: dict[str, Any]) -> int:
+        # A token's own mask can only narrow what its role grants today.
+        role_mask = cls.ROLE_MASKS.get(current_user["role"], 0)
+        token_mask = current_user.get("perm_mask")
+        if token_mask is not None and current_user.get("perm_layout") == PERMISSION_LAYOUT:
+            return role_mask & token_mask
+        return role_mask
+
+
+RolePermissions.ROLE_MASKS = {
+    role.value: permissions_mask(permissions) for role, permissions in RolePermissions.ROLE_PERMISSIONS.items()
+}
+
+
+def _reject_missing_permissions(current_user: dict[str, Any], missing_mask: int) -> None:
+    LOGGER.warning(
+        f"User {current_user.get('user_id')} missing permissions: {set(mask_permissions(missing_mask))}"
+    )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Insufficient permissions"
+    )
 
 
 class PermissionsValidator:
     def __init__(self, required_permissions: List[str]):
         self.required_permissions = required_permissions
+        self.required_mask = permissions_mask(required_permissions)
 
     def __call__(self, current_user: dict[str, Any] = Depends(get_current_user)) -> None:
-        user_role = UserRole(current_user["role"])
-        user_permissions = RolePermissions.get_role_permissions(user_role)
+        user_mask = RolePermissions.get_user_mask(current_user)
+        if user_mask & self.required_mask != self.required_mask:
+            _reject_missing_permissions(current_user, self.required_mask & ~user_mask)
+
+        return None
 
-        missing_permissions = set(self.required_permissions) - set(user_permissions)
 
-        if missing_permissions:
-            LOGGER.warning(
-                f"User {current_user.get('user_id')} missing permissions: {missing_permissions}"
-            )
+class Authorize:
+    # Role and permission check in one dependency: a set lookup for the role and a
+    # single AND/compare against the mask compiled when the route is declared.
+    # Returns the token payload so routes can take it as their current user.
+
+    def __init__(self, roles: Optional[List[UserRole]] = None, permissions: Optional[List[str]] = None):
+        self.roles = frozenset(role.value for role in roles) if roles else None
+        self.required_mask = permissions_mask(permissions or [])
+
+    def __call__(self, current_user: dict[str, Any] = Depends(get_current_user)) -> dict[str, Any]:
+        if self.roles is not None and current_user["role"] not in self.roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient permissions"
+                detail="Insufficient role permissions"
             )
 
-        return None
+        user_mask = RolePermissions.get_user_mask(current_user)
+        if user_mask & self.required_mask != self.required_mask:
+            _reject_missing_permissions(current_user, self.required_mask & ~user_mask)
+
+        return current_user
 
 
 class ResourceOwnerValidator:
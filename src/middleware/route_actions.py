@@ -0,0 +1,69 @@
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+# Bulk routes have no request id in the path; they store the ids they changed
+# under this `request.state` key and the audit entry lists them in `request_ids`.
+BULK_REQUEST_IDS_STATE = "action_request_ids"
+
+
+class RouteAction:
+    __slots__ = ("action", "request_id_param")
+
+    def __init__(self, action: str, request_id_param: Optional[str] = None):
+        self.action = action
+        self.request_id_param = request_id_param
+
+
+class RouteActionTable:
+    ACTIONS: Dict[Tuple[str, str], str] = {
+        ("/user_request/", "POST"): "create_request",
+        ("/user_request/my", "GET"): "view_my_requests",
+        ("/user_request/{request_id}", "GET"): "view_request",
+        ("/user_request/{request_id}", "PUT"): "update_request",
+        ("/user_request/{request_id}", "DELETE"): "delete_request",
+        ("/staff/requests", "GET"): "list_assigned_requests",
+        ("/staff/requests/{request_id}/status", "PUT"): "change_status",
+        ("/staff/requests/{request_id}/assign", "POST"): "assign_request",
+        ("/staff/requests/bulk/assign", "POST"): "assign_request",
+        ("/staff/requests/bulk/status", "POST"): "change_status",
+        ("/staff/requests/bulk/comment", "POST"): "comment_request",
+    }
+
+    REQUEST_ID_PARAM = "request_id"
+
+    def __init__(self):
+        self._table: Dict[Tuple[str, str], RouteAction] = {}
+
+    def build(self, routes: Iterable[BaseRoute]) -> None:
+        table = {}
+        for route in routes:
+            if not isinstance(route, APIRoute):
+                continue
+
+            request_id_param = self.REQUEST_ID_PARAM if self.REQUEST_ID_PARAM in route.param_convertors else None
+            for method in route.methods:
+                action = self.ACTIONS.get((route.path, method))
+                if action is not None:
+                    table[(route.path, method)] = RouteAction(action, request_id_param)
+
+        unmatched = set(self.ACTIONS) - set(table)
+        if unmatched:
+            logger.warning(f"Request actions declared for unknown routes: {sorted(unmatched)}")
+
+        self._table = table
+        logger.info(f"Route action table built with {len(table)} entries")
+
+    def resolve(self, scope: Scope) -> Optional[RouteAction]:
+        route = scope.get("route")
+        if route is None:
+            return None
+        return self._table.get((route.path, scope["method"]))
+
+
+route_action_table = RouteActionTable()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Pick the bcrypt cost that hits a target hash time on this machine.
+
+Times a few hashes at each cost from --min-rounds upwards and recommends the
+highest cost whose median hash time stays within --target-ms. Each extra round
+doubles the time, so the search stops at the first cost over the target.
+Run it once per environment and pin the result as BCRYPT_ROUNDS; workers with
+different costs would keep rehashing each other's passwords on login.
+
+    python -m src.tools.calibrate_bcrypt [--target-ms 250] [--samples 3] [--quiet]
+"""
+
+import argparse
+import statistics
+import time
+
+import bcrypt
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 20
+
+
+def median_hash_ms(rounds: int, samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        salt = bcrypt.gensalt(rounds=rounds)
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", salt)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, samples: int, min_rounds: int, verbose: bool) -> int:
+    chosen = min_rounds
+    for rounds in range(min_rounds, MAX_ROUNDS + 1):
+        elapsed = median_hash_ms(rounds, samples)
+        if verbose:
+            print(f"rounds={rounds:<3} median={elapsed:8.1f} ms")
+        if elapsed > target_ms:
+            break
+        chosen = rounds
+    return chosen
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--quiet", action="store_true", help="print only the chosen cost")
+    args = parser.parse_args()
+
+    rounds = calibrate(args.target_ms, args.samples, max(args.min_rounds, MIN_ROUNDS), not args.quiet)
+    if args.quiet:
+        print(rounds)
+    else:
+        print(f"\nRecommended for a {args.target_ms:.0f} ms target: BCRYPT_ROUNDS={rounds}")
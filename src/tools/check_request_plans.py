@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Fail if any ticket endpoint query plans a sequential scan on requests.
+
+Creates the schema on a scratch PostgreSQL database, applies the request index
+migration, seeds --requests tickets (only if the table is empty) and runs
+ANALYZE. Then it runs EXPLAIN on the exact SQL the ticket endpoints send: list
+pages with every filter, cursor pages, window totals, counts and the admin
+statistics. A "Seq Scan" on requests anywhere in a plan fails the run, except
+for the full-table aggregates in ALLOWED_SEQ_SCANS, which read the whole table
+whatever indexes exist. Never point it at a production database.
+
+    python -m src.tools.check_request_plans --db-url postgres://user:pass@db:5432/scratch [--requests 50000]
+"""
+
+import argparse
+import asyncio
+import glob
+import importlib.util
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+
+from tortoise import Tortoise
+
+from src.api.schemas.schemas import RequestFilters, RequestPaginationParams
+from src.api.services.admin_service import AdminService
+from src.api.services.request_service import RequestService
+from src.enums import RequestStatus, TotalMode, UserRole
+from src.models.models import Request, User
+
+TABLE = Request._meta.db_table
+MIGRATION_GLOB = "migrations/models/*_request_indexes.py"
+# Aggregates over the whole table, or over a status that covers a large share
+# of it; a sequential read is the cheapest plan for these.
+ALLOWED_SEQ_SCANS = {
+    "count all",
+    "count status=completed",
+    "count status=closed",
+    "staff workload",
+}
+
+
+async def apply_index_migration() -> None:
+    path = sorted(glob.glob(MIGRATION_GLOB))[-1]
+    spec = importlib.util.spec_from_file_location("request_indexes", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    connection = Tortoise.get_connection("default")
+    await connection.execute_script(await module.upgrade(connection))
+
+
+async def seed(requests: int) -> None:
+    connection = Tortoise.get_connection("default")
+    if await Request.all().exists():
+        return
+
+    await connection.execute_script(f"""
+        INSERT INTO "users" ("email", "password_hash", "role")
+        SELECT 'plan-user' || i || '@company.com', 'x', '{UserRole.USER.value}' FROM generate_series(1, 2000) AS i;
+        INSERT INTO "users" ("email", "password_hash", "role")
+        SELECT 'plan-staff' || i || '@company.com', 'x', '{UserRole.STAFF.value}' FROM generate_series(1, 50) AS i;
+    """)
+    users = await connection.execute_query_dict(
+        'SELECT MIN("id") AS low, MAX("id") AS high FROM "users" WHERE "role" = $1', [UserRole.USER.value]
+    )
+    staff = await connection.execute_query_dict(
+        'SELECT MIN("id") AS low, MAX("id") AS high FROM "users" WHERE "role" = $1', [UserRole.STAFF.value]
+    )
+    user_low, user_span = users[0]["low"], users[0]["high"] - users[0]["low"] + 1
+    staff_low, staff_span = staff[0]["low"], staff[0]["high"] - staff[0]["low"] + 1
+
+    # Most tickets are finished, ~10% are still open, as on a long-running
+    # deployment. New tickets have no staff member yet.
+    await connection.execute_script(f"""
+        INSERT INTO "{TABLE}" ("text", "status", "owner_id", "staff_member_id", "created_at", "updated_at")
+        SELECT
+            'Request ' || i,
+            CASE WHEN i % 20 = 0 THEN 'new' WHEN i % 20 = 1 THEN 'in_progress'
+                 WHEN i % 2 = 0 THEN 'closed' ELSE 'completed' END,
+            {user_low} + i % {user_span},
+            CASE WHEN i % 20 = 0 THEN NULL ELSE {staff_low} + i % {staff_span} END,
+            now() - (i || ' minutes')::interval,
+            now() - (i || ' minutes')::interval
+        FROM generate_series(1, {requests}) AS i;
+    """)
+
+
+def page(**kwargs) -> RequestPaginationParams:
+    return RequestPaginationParams(size=20, **kwargs)
+
+
+async def query_shapes() -> List[Tuple[str, str]]:
+    owner = await User.filter(role=UserRole.USER).order_by("id").first()
+    staff = await User.filter(role=UserRole.STAFF).order_by("id").first()
+    now = datetime.now(timezone.utc)
+
+    first_page, _ = RequestService._build_page_query(RequestService._apply_filters(Request.all(), None), page())
+    rows = await first_page
+    after = RequestService._encode_list_cursor(rows[-1], backwards=False)
+    before = RequestService._encode_list_cursor(rows[0], backwards=True)
+
+    list_filters = {
+        "unfiltered": None,
+        "status=new": RequestFilters(status=RequestStatus.NEW),
+        "status=in_progress": RequestFilters(status=RequestStatus.IN_PROGRESS),
+        "status=closed": RequestFilters(status=RequestStatus.CLOSED),
+        "owner": RequestFilters(owner_id=owner.id),
+        "staff": RequestFilters(staff_id=staff.id),
+        "staff+status": RequestFilters(staff_id=staff.id, status=RequestStatus.IN_PROGRESS),
+        "last day": RequestFilters(date_from=now - timedelta(days=1), date_to=now),
+    }
+
+    shapes = []
+    for name, filters in list_filters.items():
+        query = RequestService._apply_filters(Request.all(), filters)
+        shapes.append((f"list {name}", RequestService._build_page_query(query, page())[0].sql()))
+        shapes.append((f"count {name}".replace("unfiltered", "all"), query.count().sql()))
+
+    all_requests = RequestService._apply_filters(Request.all(), None)
+    shapes += [
+        ("list page 50", RequestService._build_page_query(all_requests, page(page=50))[0].sql()),
+        ("list window total", RequestService._build_page_query(
+            all_requests, page(total_mode=TotalMode.WINDOW), with_window_total=True
+        )[0].sql()),
+        ("list next cursor", RequestService._build_page_query(all_requests, page(cursor=after))[0].sql()),
+        ("list prev cursor", RequestService._build_page_query(all_requests, page(cursor=before))[0].sql()),
+    ]
+
+    own_requests = RequestService._apply_filters(Request.filter(owner_id=owner.id), None)
+    shapes += [
+        ("my requests", RequestService._build_page_query(own_requests, page())[0].sql()),
+        ("my requests next cursor", RequestService._build_page_query(own_requests, page(cursor=after))[0].sql()),
+        ("count status=completed", Request.filter(status=RequestStatus.COMPLETED).count().sql()),
+        ("staff workload", AdminService._staff_workload_query().sql()),
+    ]
+    return shapes
+
+
+def walk(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+def request_access(plan: Dict[str, Any]) -> Tuple[bool, str]:
+    seq_scan, paths = False, []
+    for node in walk(plan):
+        if node.get("Relation Name") != TABLE:
+            continue
+        if node["Node Type"] == "Seq Scan":
+            seq_scan = True
+        paths.append(f"{node['Node Type']}" + (f" using {node['Index Name']}" if "Index Name" in node else ""))
+    return seq_scan, ", ".join(paths) or "-"
+
+
+async def main(db_url: str, requests: int) -> int:
+    await Tortoise.init(db_url=db_url, modules={"models": ["src.models.models"]})
+    try:
+        connection = Tortoise.get_connection("default")
+        if connection.capabilities.dialect != "postgres":
+            print("check_request_plans needs a PostgreSQL database", file=sys.stderr)
+            return 2
+
+        await Tortoise.generate_schemas()
+        await apply_index_migration()
+        await seed(requests)
+        await connection.execute_script(f'ANALYZE "users"; ANALYZE "{TABLE}";')
+
+        failures = 0
+        for name, sql in await query_shapes():
+            _, rows = await connection.execute_query(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = rows[0][0]
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            seq_scan, access = request_access(plan[0]["Plan"])
+
+            if seq_scan and name not in ALLOWED_SEQ_SCANS:
+                failures += 1
+                verdict = "FAIL"
+            else:
+                verdict = "ok  " if not seq_scan else "skip"
+            print(f"{verdict} {name:<26} {access}")
+
+        if failures:
+            print(f"{failures} query shape(s) scan {TABLE} sequentially", file=sys.stderr)
+        return 1 if failures else 0
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", required=True)
+    parser.add_argument("--requests", type=int, default=50000)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.db_url, args.requests)))
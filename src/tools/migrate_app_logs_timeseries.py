@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Convert the plain app_logs collection into a MongoDB time-series collection.
+
+Time-series collections cannot be renamed into place, so the plain collection
+is renamed to app_logs_legacy, a time-series app_logs is created with the
+options DatabaseManager uses, and documents are copied over in _id order.
+Progress is checkpointed after every batch, so an interrupted run resumes
+where it stopped; the batch being inserted is recorded first and, on resume,
+documents of it already in app_logs are skipped, since time-series collections
+do not enforce a unique _id. Stop the API workers before running it, otherwise a log
+write between the rename and the create would recreate a plain app_logs.
+
+    python -m src.tools.migrate_app_logs_timeseries [--batch-size N] [--drop-legacy]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
+
+from src.core.config import settings
+from src.core.database import db_manager
+
+SOURCE = "app_logs"
+LEGACY = "app_logs_legacy"
+STATE_COLLECTION = "maintenance_state"
+STATE_ID = "app_logs_timeseries_migration"
+
+
+async def collection_type(mongo_db, name: str):
+    result = await mongo_db.command({"listCollections": 1, "filter": {"name": name}})
+    batch = result["cursor"]["firstBatch"]
+    return batch[0].get("type", "collection") if batch else None
+
+
+async def prepare_collections(mongo_db) -> bool:
+    source_type = await collection_type(mongo_db, SOURCE)
+    legacy_type = await collection_type(mongo_db, LEGACY)
+
+    if source_type == "timeseries" and legacy_type is None:
+        print(f"{SOURCE} is already a time-series collection, nothing to migrate")
+        return False
+
+    if source_type == "collection":
+        if legacy_type is not None:
+            print(f"Both {SOURCE} and {LEGACY} are plain collections, resolve manually before migrating")
+            sys.exit(1)
+        await mongo_db[SOURCE].rename(LEGACY)
+        print(f"Renamed {SOURCE} to {LEGACY}")
+        source_type = None
+
+    if source_type is None:
+        options = db_manager.app_logs_timeseries_options()
+        await mongo_db.create_collection(SOURCE, **options)
+        print(f"Created time-series collection {SOURCE}: {options}")
+
+    return True
+
+
+async def copy_documents(mongo_db, batch_size: int) -> int:
+    legacy = mongo_db[LEGACY]
+    target = mongo_db[SOURCE]
+    state = mongo_db[STATE_COLLECTION]
+
+    progress = await state.find_one({"_id": STATE_ID}) or {}
+    last_id = progress.get("last_id")
+    copied = progress.get("copied", 0)
+    skipped = progress.get("skipped", 0)
+    pending_until = progress.get("pending_until")
+    if last_id is not None or pending_until is not None:
+        print(f"Resuming after _id {last_id} ({copied} documents already copied)")
+
+    started = time.perf_counter()
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+        documents = await legacy.find(query).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+        if not documents:
+            break
+
+        if pending_until is not None:
+            # The previous run stopped between inserting up to this _id and checkpointing
+            # it; the range may span several batches if --batch-size changed.
+            interrupted = [doc for doc in documents if doc["_id"] <= pending_until]
+            existing = await db_manager.find_existing_ids(target, interrupted)
+            documents_to_insert = [doc for doc in documents if doc["_id"] not in existing]
+            copied += len(existing)
+            if documents[-1]["_id"] >= pending_until:
+                pending_until = None
+        else:
+            documents_to_insert = documents
+
+        batch_until = documents[-1]["_id"] if pending_until is None else pending_until
+        await state.update_one({"_id": STATE_ID}, {"$set": {"pending_until": batch_until}}, upsert=True)
+        try:
+            if documents_to_insert:
+                result = await target.insert_many(documents_to_insert, ordered=False)
+                copied += len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Documents without a timestamp cannot live in a time-series collection.
+            copied += e.details.get("nInserted", 0)
+            skipped += len(e.details.get("writeErrors", []))
+
+        last_id = documents[-1]["_id"]
+        await state.update_one(
+            {"_id": STATE_ID},
+            {"$set": {"last_id": last_id, "copied": copied, "skipped": skipped, "pending_until": pending_until}},
+            upsert=True
+        )
+
+        elapsed = time.perf_counter() - started
+        print(f"Copied {copied} documents ({skipped} skipped), {copied / elapsed:.0f} docs/s")
+
+    return copied
+
+
+async def migrate(batch_size: int, drop_legacy: bool) -> None:
+    client = AsyncIOMotorClient(settings.mongodb_url)
+    mongo_db = client[settings.mongodb_database]
+
+    try:
+        if not await prepare_collections(mongo_db):
+            return
+
+        copied = await copy_documents(mongo_db, batch_size)
+        legacy_count = await mongo_db[LEGACY].count_documents({})
+        print(f"Migration finished: {copied} documents copied, {legacy_count} in {LEGACY}")
+
+        if drop_legacy:
+            await mongo_db[LEGACY].drop()
+            await mongo_db[STATE_COLLECTION].delete_one({"_id": STATE_ID})
+            print(f"Dropped {LEGACY}")
+        else:
+            print("Set LOG_APP_LOGS_TIMESERIES=true, check the data, then rerun with --drop-legacy")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--drop-legacy", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(migrate(args.batch_size, args.drop_legacy))
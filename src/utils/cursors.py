@@ -0,0 +1,34 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+from src.utils.exceptions import InvalidCursorException
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "$dt" in value:
+        return datetime.fromisoformat(value["$dt"])
+    return value
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    payload = json.dumps({key: _encode_value(value) for key, value in values.items()}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, dict):
+            raise ValueError("cursor payload is not an object")
+        return {key: _decode_value(value) for key, value in payload.items()}
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorException() from e
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import HTTPException, status
 
 
@@ -26,5 +28,16 @@ class WeakPasswordException(BaseCustomException):
 
 
 class RateLimitExceededException(BaseCustomException):
-    def __init__(self, detail: str = "Rate limit exceeded"):
-        super().__init__(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=detail)
\ No newline at end of file
+    def __init__(self, detail: str = "Rate limit exceeded", retry_after: Optional[int] = None):
+        headers = {"Retry-After": str(max(1, retry_after))} if retry_after is not None else None
+        super().__init__(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=detail, headers=headers)
+
+
+class InvalidCursorException(BaseCustomException):
+    def __init__(self, detail: str = "Invalid pagination cursor"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class ServiceUnavailableException(BaseCustomException):
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)